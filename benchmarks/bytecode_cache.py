@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ bytecode_cache.py         [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Measure the cold and warm start of GitPy with the bytecode cache         #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.bytecode_cache [--runs N] [--json]
+
+# Imports section
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import subprocess
+from statistics import median
+
+## Third party libraries
+from src.util.bytecode_cache import bytecode_cache_path, compile_bytecode_cache
+
+# The root of the GitPy's directory
+GITPY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry points to measure: name -> arguments given to the Python interpreter
+ENTRY_POINTS = {
+    'gitpy -V'              : ['gitpy.py', '-V'],
+    'gitpy --show-env-var'  : ['gitpy.py', '--show-env-var'],
+    'import src.__main__'   : ['-c', 'import src.__main__'],
+    'import console'        : ['-c', 'import src.core.console'],
+    'import cli_console'    : ['-c', 'import src.core.cli_console'],
+    'import installer'      : ['-c', 'import src.core.installer'],
+    'import updater'        : ['-c', 'import src.core.updater'],
+    'import send_email'     : ['-c', 'import src.core.send_email'],
+}
+
+# Functions section
+def run_once(arguments, env):
+    '''
+        Run an entry point once and return its wall time in milliseconds
+    '''
+    start = time.perf_counter()
+    subprocess.run([sys.executable] + arguments, cwd=GITPY_PATH, env=env,
+                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return (time.perf_counter() - start) * 1000
+
+def measure(runs):
+    '''
+        Measure every entry point without bytecode (cold) and with the
+        compiled bytecode cache (warm)
+    '''
+    compile_bytecode_cache(path=GITPY_PATH)
+
+    with tempfile.TemporaryDirectory() as empty_cache:
+        # Cold: an empty cache that is never written, so every module is compiled from source
+        cold_env = dict(os.environ, PYTHONPYCACHEPREFIX=empty_cache, PYTHONDONTWRITEBYTECODE='1')
+        # Warm: the cache compiled at install/update time
+        warm_env = dict(os.environ, PYTHONPYCACHEPREFIX=bytecode_cache_path(GITPY_PATH))
+
+        results = {}
+        for name, arguments in ENTRY_POINTS.items():
+            cold = median(run_once(arguments, cold_env) for _ in range(runs))
+            warm = median(run_once(arguments, warm_env) for _ in range(runs))
+            results[name] = {
+                'cold_ms': round(cold, 2),
+                'warm_ms': round(warm, 2),
+                'gain_percent': round((cold - warm) / cold * 100, 1) if cold else 0.0,
+            }
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold vs warm start of GitPy with the bytecode cache')
+    parser.add_argument('--runs', type=int, default=10, help='runs per entry point (default: 10)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    results = measure(args.runs)
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+        return
+
+    print('%-24s %12s %12s %8s' % ('Entry point', 'Cold (ms)', 'Warm (ms)', 'Gain'))
+    print('%-24s %12s %12s %8s' % ('-----------', '---------', '---------', '----'))
+    for name, result in results.items():
+        print('%-24s %12.2f %12.2f %7.1f%%' % (name, result['cold_ms'], result['warm_ms'], result['gain_percent']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ color_render.py           [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Micro-benchmark of the Color.s() markup renderer                         #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.color_render [--loops N] [--json]
+
+# Imports section
+import sys
+import json
+import timeit
+import argparse
+
+## Third party libraries
+from src.util.colors import Color
+from src.util.help_messages import Help_Messages
+
+# Functions section
+def legacy_render(text):
+    '''
+        The previous Color.s(): one str.replace() pass per helper and per color
+    '''
+    for (key, value) in Color.replacements.items():
+        text = text.replace(key, value)
+    for (key, value) in Color.colors.items():
+        text = text.replace('{%s}' % key, value)
+    return text
+
+def help_pages():
+    '''
+        Returns the templates of all the help pages of GitPy
+    '''
+    return [function() for name, function in vars(Help_Messages).items() if not name.startswith('_') and callable(function)]
+
+def measure(loops):
+    '''
+        Time the rendering of all the help pages with each renderer, in
+        microseconds per page
+    '''
+    pages = help_pages()
+
+    # The new renderer must give exactly the same output as the old one
+    for page in pages:
+        if Color._render(page, True) != legacy_render(page):
+            sys.exit('The rendered output differs from the legacy renderer')
+
+    def render_all(render):
+        for page in pages:
+            render(page)
+
+    def cold(page, enabled=True):
+        Color._render.cache_clear()
+        Color._render(page, enabled)
+
+    renderers = {
+        'legacy (str.replace)'  : legacy_render,
+        'single pass (no cache)': cold,
+        'single pass (cached)'  : lambda page: Color._render(page, True),
+        'strip (no cache)'      : lambda page: cold(page, enabled=False),
+        'strip (cached)'        : lambda page: Color._render(page, False),
+    }
+
+    results = {}
+    for name, render in renderers.items():
+        seconds = min(timeit.repeat(lambda: render_all(render), number=loops, repeat=5))
+        results[name] = round(seconds / loops / len(pages) * 1e6, 2)
+
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark of the Color.s() renderer on the help pages')
+    parser.add_argument('--loops', type=int, default=200, help='renders of all the help pages per measure (default: 200)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    results = measure(args.loops)
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+        return
+
+    legacy = results['legacy (str.replace)']
+    print('%-24s %14s %9s' % ('Renderer', 'us per page', 'Speedup'))
+    print('%-24s %14s %9s' % ('--------', '-----------', '-------'))
+    for name, microseconds in results.items():
+        print('%-24s %14.2f %8.1fx' % (name, microseconds, legacy / microseconds if microseconds else 0.0))
+
+
+if __name__ == '__main__':
+    main()
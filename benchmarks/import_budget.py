@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ import_budget.py          [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Fail when a trivial command imports a heavy module it does not use       #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.import_budget [--budget-ms MS]
+#
+# Every entry point is run with 'python3 -X importtime' and the imported
+# modules are compared with the forbidden ones. The exit code is 1 when an
+# eager import crept back in or when the import time is over the budget.
+
+# Imports section
+import os
+import sys
+import argparse
+import subprocess
+
+# The root of the GitPy's directory
+GITPY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The trivial commands of GitPy that must stay light
+ENTRY_POINTS = {
+    'gitpy -V'              : ['-V'],
+    'gitpy --show-env-var'  : ['--show-env-var'],
+    'gitpy --remove-cache'  : ['--remove-cache'],
+}
+
+# The top-level modules imported by gitpy.py
+ENTRY_MODULES = ['src.util.daemon_client', 'src.__main__']
+
+# Modules (or packages, with all their sub-modules) that the trivial commands must never import
+FORBIDDEN_MODULES = [
+    'src.tools.requests',
+    'src.tools.urllib3',
+    'src.tools.packaging',
+    'src.util.github_repo',
+    'src.core',
+    'urllib.request',
+    'http.client',
+    'ssl',
+]
+
+# Functions section
+def import_times(arguments):
+    '''
+        Run gitpy with '-X importtime' and return the imported modules
+
+        Returns:
+            dict: module name -> cumulative import time (in microseconds)
+    '''
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', 'gitpy.py'] + arguments,
+        cwd=GITPY_PATH, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+
+    modules = {}
+    for line in process.stderr.splitlines():
+        # Format: 'import time: <self> | <cumulative> | <indentation><module>'
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative)
+
+    return modules
+
+def is_forbidden(module):
+    '''
+        Check if a module is one of the forbidden modules or one of their sub-modules
+    '''
+    return any(module == forbidden or module.startswith(forbidden + '.') for forbidden in FORBIDDEN_MODULES)
+
+def check(budget_ms):
+    '''
+        Check all the entry points, return the list of the failures
+    '''
+    failures = []
+
+    for name, arguments in ENTRY_POINTS.items():
+        # The first run fills the bytecode cache, only the second one is measured
+        import_times(arguments)
+        modules = import_times(arguments)
+
+        forbidden = sorted(module for module in modules if is_forbidden(module))
+        if forbidden:
+            failures.append('%s imports %s' % (name, ', '.join(forbidden)))
+
+        # The daemon client is imported by gitpy.py before GitPy itself
+        total_ms = sum(modules.get(module, 0) for module in ENTRY_MODULES) / 1000
+        if total_ms > budget_ms:
+            failures.append('%s spends %.1f ms importing GitPy (budget: %.1f ms)' % (name, total_ms, budget_ms))
+
+        print('%-24s %8.1f ms  %s' % (name, total_ms, 'FAILED' if forbidden or total_ms > budget_ms else 'OK'))
+
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time budget of the trivial GitPy commands')
+    parser.add_argument('--budget-ms', type=float, default=250.0, help='max import time of GitPy per command (default: 250)')
+    args = parser.parse_args()
+
+    failures = check(args.budget_ms)
+    for failure in failures:
+        print('FAILED: %s' % failure)
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
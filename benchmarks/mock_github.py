@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ mock_github.py            [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Local mock of the GitHub endpoints used by GitPy                         #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.mock_github [--port PORT] [--latency-ms MS]
+#
+# Serves the endpoints used by GitPy with fake but stable data:
+#   GET /metadata.json                      The GitPy's metadata (version check)
+#   GET /search/repositories?q=...          Search results
+#   GET /repos/<owner>/<repo>               Details of a repository
+#   GET /repos/<owner>/<repo>/commits       Commits of a branch (?sha=<branch>)
+#   GET /repos/<owner>/<repo>/commits/<ref> Head of a branch (or HEAD), only its SHA
+#                                           with 'Accept: application/vnd.github.sha'
+#   GET /repos/<owner>/<repo>/branches      Branches of a repository
+# The list endpoints are paginated (per_page, page and a 'Link' header) and all
+# the responses have an ETag ('If-None-Match' gets a 304).
+# Point GitPy to it with the variables printed at start.
+
+# Imports section
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+from collections import Counter
+from urllib.parse import urlsplit, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# The fake data
+OWNER = 'mock-owner'
+REPOSITORIES = ['mock-repo-%d' % i for i in range(1, 251)]
+BRANCHES = ['master', 'dev'] + ['feature-%d' % i for i in range(1, 11)]
+COMMITS_PER_BRANCH = 120
+METADATA = {'name': 'GitPy', 'version': '0.0.1'}
+
+# Functions section
+def commit_sha(repository, branch, index=0):
+    '''
+        The SHA of a commit of the mock: index 0 is the head of the branch
+    '''
+    return hashlib.sha1(('%s/%s@%s#%d' % (OWNER, repository, branch, index)).encode()).hexdigest()
+
+def environment(url):
+    '''
+        The environment variables that point GitPy to a mock server
+    '''
+    return {
+        'GITPY_GITHUB_URL': url,
+        'GITPY_GITHUB_API_URL': url,
+        'GITPY_REPO_METADATA_URL': url + '/metadata.json',
+    }
+
+# Main
+class Mock_GitHub_Handler(BaseHTTPRequestHandler):
+    '''
+        Answer the requests with the fake data of the mock
+    '''
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # Silent, the benchmarks print their own results
+        pass
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+
+        self.server.requests[url.path] += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        if url.path == '/metadata.json':
+            return self.send_json(METADATA)
+
+        if parts == ['search', 'repositories']:
+            items = [self.repository(name) for name in REPOSITORIES if query.get('q', '') in name]
+            return self.send_page({'total_count': len(items), 'incomplete_results': False}, 'items', items, query)
+
+        if len(parts) >= 3 and parts[0] == 'repos' and parts[1] == OWNER and parts[2] in REPOSITORIES:
+            repository = parts[2]
+
+            if len(parts) == 3:
+                return self.send_json(self.repository(repository))
+
+            if parts[3:] == ['branches']:
+                branches = [{'name': branch, 'commit': {'sha': commit_sha(repository, branch)}} for branch in BRANCHES]
+                return self.send_page(None, None, branches, query)
+
+            if parts[3:] == ['commits']:
+                branch = query.get('sha', 'master')
+                commits = [{'sha': commit_sha(repository, branch, index)} for index in range(COMMITS_PER_BRANCH)]
+                return self.send_page(None, None, commits, query)
+
+            if len(parts) == 5 and parts[3] == 'commits' and parts[4] in BRANCHES + ['HEAD']:
+                branch = 'master' if parts[4] == 'HEAD' else parts[4]
+
+                # Only the SHA of the head of the branch
+                if self.headers.get('Accept') == 'application/vnd.github.sha':
+                    return self.send_body(commit_sha(repository, branch).encode(), 'application/vnd.github.sha')
+                return self.send_json({'sha': commit_sha(repository, branch)})
+
+        # A HEAD/GET on the root (like a connectivity check) answers 200
+        if not parts:
+            return self.send_json({})
+
+        self.send_json({'message': 'Not Found'}, status=404)
+
+    def repository(self, name):
+        url = self.server.url
+        return {
+            'name': name,
+            'full_name': '%s/%s' % (OWNER, name),
+            'owner': {'login': OWNER},
+            'description': 'A repository of the GitPy mock server',
+            'size': 1024,
+            'stargazers_count': 42,
+            'forks_count': 7,
+            'language': 'Python',
+            'created_at': '2023-01-01T00:00:00Z',
+            'updated_at': '2023-06-01T00:00:00Z',
+            'html_url': '%s/%s/%s' % (url, OWNER, name),
+            'url': '%s/repos/%s/%s' % (url, OWNER, name),
+            'clone_url': '%s/%s/%s.git' % (url, OWNER, name),
+            'default_branch': 'master',
+            'license': {'name': 'MIT License'},
+        }
+
+    def send_page(self, envelope, key, items, query):
+        '''
+            Send a page of a list, with the 'Link' header of GitHub
+        '''
+        per_page = min(int(query.get('per_page', 30)), 100)
+        page = max(int(query.get('page', 1)), 1)
+        last = max((len(items) + per_page - 1) // per_page, 1)
+        selected = items[(page - 1) * per_page:page * per_page]
+
+        links = []
+        for relation, number in (('next', page + 1), ('last', last)):
+            if page < last:
+                arguments = dict(query, per_page=per_page, page=number)
+                links.append('<%s%s?%s>; rel="%s"' % (self.server.url, urlsplit(self.path).path, '&'.join('%s=%s' % item for item in arguments.items()), relation))
+
+        body = dict(envelope, **{key: selected}) if key else selected
+        self.send_json(body, headers={'Link': ', '.join(links)} if links else None)
+
+    def send_json(self, data, status=200, headers=None):
+        self.send_body(json.dumps(data).encode(), 'application/json; charset=utf-8', status, headers)
+
+    def send_body(self, body, content_type, status=200, headers=None):
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            status, body = 304, b''
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('X-RateLimit-Limit', '5000')
+        self.send_header('X-RateLimit-Remaining', '4999')
+        self.send_header('X-RateLimit-Reset', str(int(time.time()) + 3600))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+
+class Mock_GitHub(ThreadingHTTPServer):
+    '''
+        The mock server. 'requests' counts the requests per path.
+
+        Arguments:
+            port (int): The port to listen on (0: any free port)
+            latency (float): Delay added to each response, in seconds
+    '''
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0):
+        super().__init__(('127.0.0.1', port), Mock_GitHub_Handler)
+        self.latency = latency
+        self.requests = Counter()
+        self.url = 'http://127.0.0.1:%d' % self.server_address[1]
+
+    def start(self):
+        '''
+            Serve in a background thread
+        '''
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local mock of the GitHub endpoints used by GitPy')
+    parser.add_argument('--port', type=int, default=8765, help='port to listen on (default: 8765)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='delay added to each response (default: 0)')
+    args = parser.parse_args()
+
+    server = Mock_GitHub(port=args.port, latency=args.latency_ms / 1000)
+    print('Mock GitHub listening on %s, point GitPy to it with:' % server.url)
+    for name, value in environment(server.url).items():
+        print('  export %s=%s' % (name, value))
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ mock_smtp.py              [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Local stand-in of a SMTP server for the notifications                    #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.mock_smtp [--port PORT] [--latency-ms MS] [--drop-every N]
+#
+# A minimal SMTP server (EHLO, AUTH PLAIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT)
+# that accepts everything and keeps the received emails. It has no STARTTLS:
+# point GitPy to it with GITPY_SMTP_NO_STARTTLS set and the server/port of a
+# subscription set to it. With --drop-every N, it drops the connection instead
+# of accepting the Nth email of each connection (to check the reconnections).
+
+# Imports section
+import sys
+import time
+import argparse
+import threading
+import socketserver
+from collections import Counter
+
+# Main
+class Mock_SMTP_Handler(socketserver.StreamRequestHandler):
+    '''
+        One SMTP session
+    '''
+
+    def reply(self, line):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.wfile.write(line.encode() + b'\r\n')
+
+    def handle(self):
+        self.server.count('connections')
+        self.reply('220 mock-smtp ESMTP')
+        received = 0
+
+        for raw in self.rfile:
+            line = raw.decode(errors='replace').rstrip('\r\n')
+            command = line.split(' ', 1)[0].upper()
+
+            if command == 'EHLO':
+                self.wfile.write(b'250-mock-smtp\r\n250-AUTH PLAIN\r\n250-PIPELINING\r\n')
+                self.reply('250 SIZE 10485760')
+            elif command == 'HELO':
+                self.reply('250 mock-smtp')
+            elif command == 'AUTH':
+                self.server.count('logins')
+                self.reply('235 2.7.0 Authentication successful')
+            elif command == 'STARTTLS':
+                self.reply('454 4.7.0 TLS not available')
+            elif command in ('MAIL', 'RCPT', 'RSET', 'NOOP'):
+                self.reply('250 OK')
+            elif command == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                for raw in self.rfile:
+                    if raw in (b'.\r\n', b'.\n'):
+                        break
+                    data.append(raw[1:] if raw.startswith(b'..') else raw)
+
+                received += 1
+                if self.server.drop_every and received % self.server.drop_every == 0:
+                    self.server.count('dropped')
+                    return
+
+                self.server.count('messages')
+                with self.server.lock:
+                    self.server.messages.append(b''.join(data))
+                self.reply('250 OK: queued')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class Mock_SMTP(socketserver.ThreadingTCPServer):
+    '''
+        The stand-in server. 'stats' counts the connections, logins, messages
+        and dropped connections, 'messages' keeps the received emails.
+
+        Arguments:
+            port (int): The port to listen on (0: any free port)
+            latency (float): Delay added to each reply, in seconds
+            drop_every (int): Drop the connection at the Nth email of each connection (0: never)
+    '''
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, port=0, latency=0.0, drop_every=0):
+        super().__init__(('127.0.0.1', port), Mock_SMTP_Handler)
+        self.latency = latency
+        self.drop_every = drop_every
+        self.lock = threading.Lock()
+        self.stats = Counter()
+        self.messages = []
+        self.port = self.server_address[1]
+
+    def count(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def start(self):
+        '''
+            Serve in a background thread
+        '''
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in of a SMTP server for the notifications of GitPy')
+    parser.add_argument('--port', type=int, default=8025, help='port to listen on (default: 8025)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='delay added to each reply (default: 0)')
+    parser.add_argument('--drop-every', type=int, default=0, help='drop the connection at the Nth email of each connection (default: never)')
+    args = parser.parse_args()
+
+    server = Mock_SMTP(port=args.port, latency=args.latency_ms / 1000, drop_every=args.drop_every)
+    print('Mock SMTP listening on 127.0.0.1:%d (export GITPY_SMTP_NO_STARTTLS=1)' % server.port)
+    sys.stdout.flush()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(dict(server.stats))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ notifications.py          [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Benchmark of the delivery of the notifications by SMTP                   #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.notifications [--messages N] [--accounts N] [--latency-ms MS]
+#                                       [--drop-every N] [--json]
+#
+# Sends the same notifications to a local stand-in SMTP server (see
+# 'benchmarks/mock_smtp.py') in two ways:
+#   per-message: a connection (and a login) per email, like GitPy used to do
+#   dispatcher:  the Mail_Dispatcher, one session per server and account
+# and prints the time, the connections, the logins and the delivered emails.
+
+# Imports section
+import os
+import sys
+import json
+import time
+import smtplib
+import argparse
+from email.mime.text import MIMEText
+
+# The stand-in server has no STARTTLS
+os.environ['GITPY_SMTP_NO_STARTTLS'] = '1'
+
+## Third party libraries
+from benchmarks.mock_smtp import Mock_SMTP
+from src.util.mail_dispatcher import Mail_Dispatcher
+
+# Functions section
+def notifications(count, accounts):
+    '''
+        The (username, message) of the fake notifications
+    '''
+    result = []
+    for index in range(count):
+        username = 'gitpy-%d@example.com' % (index % accounts)
+        message = MIMEText('A new version of mock-repo-%d is available' % index)
+        message['From'] = 'GitPy Notification <%s>' % username
+        message['To'] = 'receiver-%d@example.com' % index
+        message['Subject'] = 'New version of mock-repo-%d' % index
+        result.append((username, message))
+    return result
+
+def per_message(port, messages):
+    for username, message in messages:
+        with smtplib.SMTP('127.0.0.1', port) as smtp:
+            smtp.login(username, 'password')
+            smtp.send_message(message)
+
+def dispatcher(port, messages):
+    mail_dispatcher = Mail_Dispatcher()
+    for username, message in messages:
+        mail_dispatcher.queue('127.0.0.1', port, username, 'password', message)
+    mail_dispatcher.flush()
+
+def measure(name, send, count, accounts, latency, drop_every):
+    server = Mock_SMTP(latency=latency, drop_every=drop_every).start()
+    try:
+        start = time.perf_counter()
+        send(server.port, notifications(count, accounts))
+        elapsed = time.perf_counter() - start
+    except (smtplib.SMTPException, OSError) as error:
+        elapsed = None
+        print('%s: %s' % (name, error), file=sys.stderr)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    return {
+        'ms': round(elapsed * 1000, 1) if elapsed is not None else None,
+        'connections': server.stats['connections'],
+        'logins': server.stats['logins'],
+        'delivered': server.stats['messages'],
+        'dropped': server.stats['dropped'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Delivery time of the notifications by SMTP')
+    parser.add_argument('--messages', type=int, default=200, help='number of emails (default: 200)')
+    parser.add_argument('--accounts', type=int, default=2, help='number of SMTP accounts sending them (default: 2)')
+    parser.add_argument('--latency-ms', type=float, default=2.0, help='delay added by the server to each reply (default: 2)')
+    parser.add_argument('--drop-every', type=int, default=0, help='the server drops the connection at the Nth email of each connection (default: never)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    results = {name: measure(name, send, args.messages, args.accounts, args.latency_ms / 1000, args.drop_every) for name, send in (('per-message', per_message), ('dispatcher', dispatcher))}
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+    else:
+        print('%-12s %10s %12s %7s %10s %8s' % ('Mode', 'Time', 'Connections', 'Logins', 'Delivered', 'Dropped'))
+        for name, result in results.items():
+            print('%-12s %7s ms %12d %7d %10d %8d' % (name, result['ms'], result['connections'], result['logins'], result['delivered'], result['dropped']))
+
+
+if __name__ == '__main__':
+    main()
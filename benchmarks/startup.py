@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ startup.py                [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Cold and warm start time of the GitPy commands                           #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Usage (from the root of the GitPy's directory):
+#   python3 -m benchmarks.startup [--runs N] [--latency-ms MS] [--json]
+#                                 [--save-baseline FILE] [--baseline FILE] [--tolerance PERCENT]
+#
+# Every command is run in a new process against a local mock of GitHub (see
+# 'benchmarks/mock_github.py'), with its own GitPy cache and install path, so
+# the results never depend on the network or on the installed GitPy:
+#   cold: empty bytecode cache and empty GitPy cache (metadata, connectivity)
+#   warm: bytecode cache and GitPy cache filled by a previous run
+# The results (p50, p90, p99 in milliseconds and the HTTP requests made per run)
+# can be saved as a baseline. With --baseline, the exit code is 1 when a p50 is
+# over the baseline by more than the tolerance or when a command makes more
+# requests than in the baseline.
+
+# Imports section
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import tempfile
+import argparse
+import subprocess
+
+## Third party libraries
+from benchmarks.mock_github import Mock_GitHub, OWNER, REPOSITORIES, commit_sha, environment
+
+# The root of the GitPy's directory
+GITPY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Commands to measure: name -> arguments of gitpy
+ENTRY_POINTS = {
+    'gitpy -V'              : ['-V'],
+    'gitpy -h'              : ['-h'],
+    'gitpy --info'          : ['--info'],
+    'gitpy --show-env-var'  : ['--show-env-var'],
+    'gitpy --check-repo'    : ['--check-repo'],
+}
+
+# The environment variable holding the SMTP password of the fake subscriptions
+SMTP_PASSWORD_ENV_VAR = 'GITPY_BENCHMARK_SMTP_PASSWORD'
+
+# Functions section
+def create_install_path(path):
+    '''
+        Create a fake GitPy install path with a notification config file
+    '''
+    os.makedirs(os.path.join(path, 'src', 'config'))
+
+    with open(os.path.join(path, 'src', 'config', 'new_version_notification.conf'), 'w') as config_file:
+        for repository in REPOSITORIES[:2]:
+            config_file.write(
+                '[%s/%s]\n' % (OWNER, repository) +
+                'smtp_server = 127.0.0.1\n'
+                'smtp_port = 1\n'
+                'smtp_username = gitpy@localhost\n'
+                'smtp_password = %s\n' % SMTP_PASSWORD_ENV_VAR +
+                'receiver_email_address = gitpy@localhost\n'
+                'github_repo_name = %s\n' % repository +
+                'github_repo_owner = %s\n' % OWNER +
+                'github_repo_branch = master\n'
+                'github_repo_url = https://github.com/%s/%s\n' % (OWNER, repository) +
+                # Up to date: no email is sent (there is no SMTP server)
+                'current_commit_sha = %s\n\n' % commit_sha(repository, 'master')
+            )
+
+def run(arguments, env):
+    '''
+        Run gitpy once, return the duration (in milliseconds) and the exit code.
+        The processes detached by the command (like the background refresh of
+        the metadata) are waited for too, so their requests are never counted
+        in the next run.
+    '''
+    # Every descendant of gitpy inherits the write end: the read end only
+    # reaches EOF once they have all exited
+    read_fd, write_fd = os.pipe()
+
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, 'gitpy.py'] + arguments,
+        cwd=GITPY_PATH, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        pass_fds=(write_fd,)
+    )
+    duration = (time.perf_counter() - start) * 1000
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as pipe:
+        pipe.read()
+
+    return duration, process.returncode
+
+def percentile(values, percent):
+    '''
+        The percentile of a list of values (nearest rank)
+    '''
+    values = sorted(values)
+    return values[max(math.ceil(percent / 100 * len(values)) - 1, 0)]
+
+def summary(durations, requests, exit_codes):
+    return {
+        'p50_ms': round(percentile(durations, 50), 2),
+        'p90_ms': round(percentile(durations, 90), 2),
+        'p99_ms': round(percentile(durations, 99), 2),
+        'min_ms': round(min(durations), 2),
+        'max_ms': round(max(durations), 2),
+        'requests': max(requests),
+        'exit_codes': sorted(set(exit_codes)),
+    }
+
+def measure(runs, latency):
+    '''
+        Measure all the commands, cold and warm
+    '''
+    server = Mock_GitHub(latency=latency).start()
+    temp_path = tempfile.mkdtemp(prefix='gitpy-benchmark-')
+    results = {}
+
+    try:
+        install_path = os.path.join(temp_path, 'install') + '/'
+        create_install_path(install_path)
+
+        env = dict(os.environ, **environment(server.url))
+        env.update({
+            'GITPY_NO_DAEMON': '1',
+            'GITPY_INSTALL_PATH': install_path,
+            SMTP_PASSWORD_ENV_VAR: 'password',
+        })
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        env.pop('PYTHONUNBUFFERED', None)
+
+        for name, arguments in ENTRY_POINTS.items():
+            results[name] = {}
+
+            for mode in ('cold', 'warm'):
+                durations, requests, exit_codes = [], [], []
+                warm_path = os.path.join(temp_path, 'warm', name.replace(' ', '_'))
+
+                # The warm runs share a cache filled by a first (not measured) run
+                if mode == 'warm':
+                    run(arguments, dict(env, XDG_CACHE_HOME=warm_path, PYTHONPYCACHEPREFIX=os.path.join(warm_path, 'bytecode')))
+
+                for index in range(runs):
+                    if mode == 'cold':
+                        cache_path = os.path.join(temp_path, 'cold', '%s_%d' % (name.replace(' ', '_'), index))
+                    else:
+                        cache_path = warm_path
+
+                    server.requests.clear()
+                    duration, exit_code = run(arguments, dict(env, XDG_CACHE_HOME=cache_path, PYTHONPYCACHEPREFIX=os.path.join(cache_path, 'bytecode')))
+                    durations.append(duration)
+                    requests.append(sum(server.requests.values()))
+                    exit_codes.append(exit_code)
+
+                    if mode == 'cold':
+                        shutil.rmtree(cache_path, ignore_errors=True)
+
+                results[name][mode] = summary(durations, requests, exit_codes)
+
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(temp_path, ignore_errors=True)
+
+    return results
+
+def compare(results, baseline, tolerance):
+    '''
+        Compare the results with a baseline, return the list of the regressions
+    '''
+    regressions = []
+
+    for name, modes in results.items():
+        for mode, result in modes.items():
+            reference = baseline.get(name, {}).get(mode)
+            if reference is None:
+                continue
+
+            limit = reference['p50_ms'] * (1 + tolerance / 100)
+            if result['p50_ms'] > limit:
+                regressions.append('%s (%s): p50 %.1f ms > %.1f ms (baseline %.1f ms + %g%%)' % (name, mode, result['p50_ms'], limit, reference['p50_ms'], tolerance))
+
+            if result['requests'] > reference['requests']:
+                regressions.append('%s (%s): %d HTTP requests > %d in the baseline' % (name, mode, result['requests'], reference['requests']))
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold and warm start time of the GitPy commands')
+    parser.add_argument('--runs', type=int, default=10, help='runs per command and mode (default: 10)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='delay added by the mock GitHub to each response (default: 0)')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    parser.add_argument('--save-baseline', metavar='FILE', help='save the results as a baseline')
+    parser.add_argument('--baseline', metavar='FILE', help='compare the results with a baseline')
+    parser.add_argument('--tolerance', type=float, default=20.0, metavar='PERCENT', help='allowed p50 increase over the baseline (default: 20)')
+    args = parser.parse_args()
+
+    results = measure(args.runs, args.latency_ms / 1000)
+
+    if args.json:
+        print(json.dumps(results, indent=4))
+    else:
+        print('%-24s %-5s %9s %9s %9s %9s  %s' % ('Command', 'Mode', 'p50', 'p90', 'p99', 'Requests', 'Exit codes'))
+        for name, modes in results.items():
+            for mode, result in modes.items():
+                print('%-24s %-5s %6.1f ms %6.1f ms %6.1f ms %9d  %s' % (name, mode, result['p50_ms'], result['p90_ms'], result['p99_ms'], result['requests'], ','.join(map(str, result['exit_codes']))))
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=4)
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            regressions = compare(results, json.load(baseline_file), args.tolerance)
+        for regression in regressions:
+            print('REGRESSION: %s' % regression, file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
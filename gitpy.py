@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ gitpy.py                  [Created: 2023-03-26 | 10:37 - AM]  #
-#                                       [Updated: 2023-02-13 |  4:12 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The call methode of gitpy                                                #
 #  Language ~ Python3                                                       #
@@ -35,12 +35,25 @@
 import os
 import sys
 
-## Third party libraries
-from src import __main__
-
 # Where this file is executed
 cwd = os.path.dirname(os.path.abspath(__file__))
 
-# Call the entry point of the main file of GitPy
-__main__.entry_point(pwd=cwd)
+# Load the compiled bytecode from the persistent cache of GitPy instead of
+# recompiling everything (unless the user already set his own cache prefix)
+if sys.pycache_prefix is None:
+    sys.pycache_prefix = os.path.join(cwd, 'cache', 'bytecode', sys.implementation.cache_tag)
+
+# Only when run as a command: the compile workers of the bytecode cache
+# (see src/util/bytecode_cache.py) import this file without running it
+if __name__ == '__main__':
+    # If the GitPy daemon is running, let it run the command (see 'gitpy --daemon')
+    from src.util.daemon_client import forward
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    ## Third party libraries
+    from src import __main__
 
+    # Call the entry point of the main file of GitPy
+    __main__.entry_point(pwd=cwd)
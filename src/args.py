@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ args.py                   [Created: 2023-03-21 | 10:26 - AM]  #
-#                                       [Updated: 2023-04-10 | 13:18 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  All arguments of the 'gitpy' command                                     #
 #  Language ~ Python3                                                       #
@@ -57,6 +57,9 @@ class Arguments(argparse.ArgumentParser):
         All arguments of the 'gitpy' command
     '''
 
+    # The parser built by get_arguments()
+    _parser = None
+
     @classmethod
     def get_arguments(cls):
         '''
@@ -107,6 +110,10 @@ class Arguments(argparse.ArgumentParser):
                 help string. If None, the 'dest' value will be used as the name.
         """
 
+        # The parser is only built once per process (the daemon parses a command line per request)
+        if cls._parser is not None:
+            return cls._parser.parse_args()
+
         gitpy = Arguments(
             prog='gitpy',
             description='GitPy - A Python3 tool for search and download a GitHub\'s repository directly in the terminal',
@@ -127,6 +134,7 @@ class Arguments(argparse.ArgumentParser):
         # cls._add_test_args(gitpy.add_argument_group(Color.s('{SB2}{bold}Test options{W}')))
 
         # argcomplete.autocomplete(parser)
+        cls._parser = gitpy
         return gitpy.parse_args()
 
 
@@ -194,6 +202,13 @@ class Arguments(argparse.ArgumentParser):
             help=Color.s('check if the repository in the notification config file have a new commit avalable and send a notificarion via mail if it\'s the case')
         )
 
+        repo.add_argument(
+            '--digest',
+            action='store_true',
+            dest='digest',
+            help=Color.s('with {G}--check-repo{W}, send one email per receiver with all the new commits instead of one email per repository')
+        )
+
         repo.add_argument(
             '-us','--unsub',
             action='store_true',
@@ -288,7 +303,16 @@ class Arguments(argparse.ArgumentParser):
             '--remove-cache',
             action='store_true',
             dest='remove_cache',
-            help='delete any \'__pycache__\' folder in the GitPy\' directory'
+            help='delete the bytecode cache and any \'__pycache__\' folder in the GitPy\'s directory'
+        )
+        misc.add_argument(
+            '--daemon',
+            type=str,
+            nargs='?',
+            const='start',
+            choices=['start','stop','status'],
+            dest='daemon',
+            help='start, stop or show the status of the GitPy\'s resident daemon (const: start)'
         )
 
 
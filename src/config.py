@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ config.py                 [Created: 2023-03-28 |  8:35 - AM]  #
-#                                       [Updated: 2023-04-10 | 13:27 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The Python config file of gitpy                                          #
 #  Language ~ Python3                                                       #
@@ -32,17 +32,14 @@
 #---------------------------------------------------------------------------#
 
 # Imports section
-import re
 import os
 import sys
-import platform
-import subprocess
-import configparser
 from time import sleep
 from copy import deepcopy
 
 ## Third party libraries
-from src.util.github_repo import GitHub_Repo
+# Only the light modules are imported here. The other ones (like the vendored
+# HTTP stack or the core modules) are imported by the branch that use them.
 from src.util.exit_tool import exit_tool
 from src.util.colors import Color
 from src.util.help_messages import Help_Messages as HM
@@ -95,6 +92,133 @@ class Configuration():
     # The GitPy temporary directory
     TEMP_PATH = r'/tmp/gitpy/'
 
+    # The cache directory of the current user (version check, etc.)
+    CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'gitpy') + '/'
+
+    # The GitHub's endpoints. They can be moved with environment variables (for a
+    # GitHub Enterprise server or the local mock server of the benchmarks)
+    GITHUB_URL = os.environ.get('GITPY_GITHUB_URL', 'https://github.com').rstrip('/')
+    GITHUB_API_URL = os.environ.get('GITPY_GITHUB_API_URL', 'https://api.github.com').rstrip('/')
+    GITHUB_GRAPHQL_URL = os.environ.get('GITPY_GITHUB_GRAPHQL_URL', GITHUB_API_URL + '/graphql')
+
+    # The connectivity check: the hosts that GitPy depends on, how long a result
+    # is kept and the state file (in CACHE_PATH) shared by all the GitPy processes
+    CONNECTIVITY_HOSTS = [GITHUB_API_URL, GITHUB_URL]
+    CONNECTIVITY_CACHE_TTL = 30
+    CONNECTIVITY_STATE_FILE = 'connectivity.json'
+
+    # The HTTP client shared by all the requests sent to GitHub (src/util/github_client.py):
+    # the default (connect, read) timeouts in seconds and the size of its connection pools
+    HTTP_TIMEOUT = (3.05, 10)
+    HTTP_POOL_CONNECTIONS = 4
+    HTTP_POOL_MAXSIZE = 10
+
+    # The retries of the HTTP client (src/util/retry_policy.py): the max number of
+    # retries, the base and the max of the exponential backoff (with jitter, in
+    # seconds), the retried statuses and the max 'Retry-After' waited for. After
+    # CIRCUIT_BREAKER_FAILURES failures in a row, a host isn't requested anymore
+    # during CIRCUIT_BREAKER_COOLDOWN seconds
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_BACKOFF_MAX = 10
+    RETRY_STATUS_CODES = [500, 502, 503, 504]
+    RETRY_AFTER_MAX = 20
+    CIRCUIT_BREAKER_FAILURES = 5
+    CIRCUIT_BREAKER_COOLDOWN = 30
+
+    # The on-disk cache of the GitHub's responses (in CACHE_PATH), revalidated with
+    # their ETag: its max size (in bytes) and how long (in seconds) the responses of
+    # an endpoint are used without asking GitHub (0: always revalidated, a 304 costs
+    # no rate limit). Set GITPY_NO_HTTP_CACHE to disable it.
+    HTTP_CACHE_ENABLED = 'GITPY_NO_HTTP_CACHE' not in os.environ
+    HTTP_CACHE_PATH = 'http/'
+    HTTP_CACHE_MAX_SIZE = 20 * 1024 * 1024
+    HTTP_CACHE_FRESHNESS = [
+        (r'^/search/', 300),
+        (r'^/repos/[^/]+/[^/]+/branches$', 600),
+        (r'^/repos/[^/]+/[^/]+/commits', 0),
+        (r'^/repos/[^/]+/[^/]+$', 3600),
+    ]
+
+    # The rate limits of the GitHub API: the (requests, window in seconds) of an
+    # unauthenticated and of an authenticated client per resource, until GitHub
+    # sends the real ones. When less than RATE_LIMIT_RESERVE of a budget remains, the
+    # requests are paced (with bursts of RATE_LIMIT_BURST, waiting at most
+    # RATE_LIMIT_MAX_WAIT seconds). An exhausted budget defers the requests until its
+    # reset. The known budgets are kept in the state file (in CACHE_PATH) shared by
+    # all the GitPy processes, saved at most every RATE_LIMIT_SAVE_INTERVAL seconds
+    # and when the process exits
+    RATE_LIMITS = {'core': (60, 3600), 'search': (10, 60)}
+    AUTHENTICATED_RATE_LIMITS = {'core': (5000, 3600), 'search': (30, 60), 'graphql': (5000, 3600)}
+    RATE_LIMIT_RESERVE = 0.2
+    RATE_LIMIT_BURST = 10
+    RATE_LIMIT_MAX_WAIT = 10
+    RATE_LIMIT_STATE_FILE = 'rate_limit.json'
+    RATE_LIMIT_SAVE_INTERVAL = 5
+
+    # The personal access tokens sent to the GitHub API (separated by commas or
+    # spaces). With several tokens, each request uses the one with the most
+    # remaining budget. Without any token, GitPy is anonymous (60 requests/hour)
+    GITHUB_TOKENS = os.environ.get('GITPY_GITHUB_TOKENS', os.environ.get('GITHUB_TOKEN', '')).replace(',', ' ').split()
+
+    # The GraphQL backend (src/util/github_graphql.py) replaces several REST requests
+    # by one query (and checks the subscriptions by batches of GRAPHQL_BATCH_SIZE).
+    # It needs a token. Set GITPY_NO_GRAPHQL to only use the REST API
+    GRAPHQL_ENABLED = bool(GITHUB_TOKENS) and 'GITPY_NO_GRAPHQL' not in os.environ
+    GRAPHQL_BATCH_SIZE = 50
+
+    # The checks of --check-repo (src/util/check_engine.py): how many repositories
+    # (or GraphQL batches) are checked at the same time (the kept connections of
+    # the HTTP client are HTTP_POOL_MAXSIZE) and the max time of a check, in seconds
+    CHECK_CONCURRENCY = HTTP_POOL_MAXSIZE
+    CHECK_TIMEOUT = 30
+
+    # The subscriptions and their state (src/util/subscription_store.py): the SQLite
+    # database (in the install path), how long (in seconds) a process waits for
+    # another one to write in it and the old notification config file, migrated to
+    # the database at its first use
+    NOTIFICATION_STORE_FILE = 'src/config/new_version_notification.db'
+    NOTIFICATION_STORE_TIMEOUT = 30
+    NOTIFICATION_CONFIG_FILE = 'src/config/new_version_notification.conf'
+
+    # The adaptive polling of the subscriptions (src/util/poll_scheduler.py): the cron
+    # job runs --check-repo every CHECK_CRON_SCHEDULE and each run only checks the
+    # subscriptions that are due. A repository is checked POLL_FACTOR times per
+    # expected commit (learned with an average weighted by POLL_SMOOTHING), between
+    # POLL_INTERVAL_MIN and POLL_INTERVAL_MAX seconds (POLL_INTERVAL_DEFAULT before
+    # its first new commit), with +/- POLL_JITTER of jitter
+    CHECK_CRON_SCHEDULE = '*/15 * * * *'
+    POLL_INTERVAL_MIN = 15 * 60
+    POLL_INTERVAL_MAX = 7 * 24 * 3600
+    POLL_INTERVAL_DEFAULT = 6 * 3600
+    POLL_FACTOR = 2
+    POLL_SMOOTHING = 0.3
+    POLL_JITTER = 0.1
+
+    # The delivery of the notifications (src/util/mail_dispatcher.py): the SMTP
+    # sessions are upgraded to TLS (set GITPY_SMTP_NO_STARTTLS for a local relay),
+    # their timeout in seconds and how many connections a message can use when the
+    # server drops them
+    SMTP_STARTTLS = 'GITPY_SMTP_NO_STARTTLS' not in os.environ
+    SMTP_TIMEOUT = 30
+    SMTP_RECONNECT_ATTEMPTS = 2
+
+    # The number of search results of the console whose details are fetched in
+    # background while the user reads the list (3 API requests per result, so
+    # only the first one without a token)
+    CONSOLE_PREFETCH_COUNT = 3 if GITHUB_TOKENS else 1
+    # The number of search results printed at once (then with 'more')
+    CONSOLE_RESULTS_PER_PAGE = 30
+
+    # The resident daemon (gitpy --daemon): its Unix socket and PID file (in CACHE_PATH)
+    # Keep in sync with src/util/daemon_client.py, which can't import this file
+    DAEMON_SOCKET_FILE = 'daemon.sock'
+    DAEMON_PID_FILE = 'daemon.pid'
+
+    # The persistent bytecode cache (relative to the GitPy's directory).
+    # Compiled at install/update time and only purged with the --remove-cache option
+    BYTECODE_CACHE_PATH = r'cache/bytecode/'
+
     # For the environment variables
     ## The GitPy's install path
     gitpy_install_path_env_var_name = 'GITPY_INSTALL_PATH'
@@ -108,12 +232,16 @@ class Configuration():
     REPO_CLONE_URL = 'https://github.com/MyMeepSQL/GitPy.git'
     REPO_BRANCH = 'master'
     REPO_MASTER_BRANCH = 'master'
-    REPO_METADATA_URL = 'https://raw.githubusercontent.com/MyMeepSQL/GitPy/master/metadata.json'
+    REPO_METADATA_URL = os.environ.get('GITPY_REPO_METADATA_URL', 'https://raw.githubusercontent.com/MyMeepSQL/GitPy/master/metadata.json')
     REPO_CHANGELOG_URL = 'https://github.com/MyMeepSQL/GitPy/blob/master/src/docs/CHANGELOG.md'
     REPO_ISSUES_URL = 'https://github.com/MyMeepSQL/GitPy/issues'
     ## The GitPy's version from the Github's repo. Will be attributed by the 'compare_version' 
     ## function from the 'github_repo.py' file
     REPO_VERSION = None
+    ## The 'metadata.json' file is cached for this number of seconds before
+    ## being revalidated (in background) with its ETag
+    REPO_METADATA_CACHE_FILE = 'metadata.json'
+    REPO_METADATA_CACHE_TTL = 3600
 
     @classmethod
     def load_arguments(cls, pwd):
@@ -229,46 +357,46 @@ class Configuration():
         '''
         if args.check_repo:
             from src.core.send_email import send_email
-            send_email()
+            send_email(digest=args.digest)
 
         if args.unsub:
-            config = configparser.ConfigParser()
-            INSTALL_PATH = os.environ[cls.gitpy_install_path_env_var_name]
-            NOTIF_CONFIG_FILE_PATH = INSTALL_PATH + 'src/config/new_version_notification.conf'
-            config.read(NOTIF_CONFIG_FILE_PATH)
+            from src.util.subscription_store import Subscription_Store
 
-            # Obtient la liste de toutes les sections dans le fichier de configuration
-            sections = config.sections()
+            store = Subscription_Store()
+            try:
+                # Only the subscriptions matching the filter are listed (there can be thousands)
+                pattern = input(Color.s('  {*} Filter the subscriptions ({C}owner/repository@branch{W} or email, empty for all) :  ')).strip()
+                subscriptions = store.find(pattern)
 
-            # Vérifie si le fichier de configuration contient des sections
-            if len(sections) == 0:
-                Color.pl('  {!} The configuration file does not contain any sections.')
-            else:
-                Color.pl('  {*} Here are the sections of the configuration file :')
-                for i, section in enumerate(sections):
-                    Color.pl('  {D}[{W}{SB2}%s{W}{D}]{W} %s'% (i+1, section))
-                # Demande à l'utilisateur de sélectionner une section à supprimer
-                selection = input(Color.s("  {*} Enter the number of the section you wish to delete :  "))
+                # Vérifie si des abonnements correspondent au filtre
+                if len(subscriptions) == 0:
+                    Color.pl('  {!} No subscription found.')
+                    return
+
+                Color.pl('  {*} Here are the subscriptions :')
+                for i, subscription in enumerate(subscriptions):
+                    Color.pl('  {D}[{W}{SB2}%s{W}{D}]{W} %s {D}(%s){W}' % (i+1, subscription['key'], subscription['receiver_email_address']))
+                # Demande à l'utilisateur de sélectionner un abonnement à supprimer
+                selection = input(Color.s("  {*} Enter the number of the subscription you wish to delete :  "))
 
                 # Vérifie si l'utilisateur a entré un nombre valide
                 try:
                     selection = int(selection)
-                    if selection < 1 or selection > len(sections):
-                        Color.pl('  {!} Invalid selection. Please enter a valid section number.')
+                    if selection < 1 or selection > len(subscriptions):
+                        Color.pl('  {!} Invalid selection. Please enter a valid subscription number.')
                         return
                 except ValueError:
-                    Color.pl('  {!} Invalid selection. Please enter a valid section number.')
+                    Color.pl('  {!} Invalid selection. Please enter a valid subscription number.')
                     return
 
-                # Supprime la section sélectionnée
-                section_to_remove = sections[selection-1]
-                config.remove_section(section_to_remove)
+                # Supprime l'abonnement sélectionné
+                key = subscriptions[selection-1]['key']
+                store.remove(key)
+                Color.pl('  {*} The subscription %s has been successfully removed.' % key)
+
+            finally:
+                store.close()
 
-                # Écrit les modifications dans le fichier
-                with open(NOTIF_CONFIG_FILE_PATH, 'w') as configfile:
-                    config.write(configfile)
-                Color.pl('  {*} The section %s has been successfully removed.' %section_to_remove)
-                    
 
     # -------------------- [ INFORMATIONS ARGUMENTS ] -------------------- #
     @classmethod
@@ -281,6 +409,8 @@ class Configuration():
                 args (object): The arguments object
         '''
         if args.help:
+            from src.util.github_repo import GitHub_Repo
+
             # Show more help for wich command
             # ---------- [ Main options ] ---------- #
             if args.console:
@@ -394,6 +524,12 @@ class Configuration():
                 print()
                 GitHub_Repo.compare_version()
                 exit_tool(0,pwd=cls.pwd)
+            if args.daemon:
+                Color.pl(GitPy.Banner())
+                Color.pl(HM.option_daemon())
+                print()
+                GitHub_Repo.compare_version()
+                exit_tool(0,pwd=cls.pwd)
             
 
             # ---- No options ---- #
@@ -405,6 +541,7 @@ class Configuration():
                 exit_tool(0,pwd=cls.pwd)
     
         if args.info:
+            from src.util.github_repo import GitHub_Repo
             from src.util.informations import Informations
             Color.pl(GitPy.Banner())
             Color.pl(Informations.print_info())
@@ -470,6 +607,10 @@ class Configuration():
             from src.util.remove_python_cache import remove_python_cache
             remove_python_cache(pwd=pwd)
 
+        if args.daemon:
+            from src.core.daemon import entry_point as Daemon
+            Daemon(args.daemon, pwd=pwd)
+
     # @classmethod
     # def parse_test_args(cls, args):
     #     from src.util.process import Process
@@ -496,6 +637,7 @@ class Main_prompt():
         import gnureadline as global_readline
         Main_prompt.main_prompt_ready = True
         sys.stdout.write(prefix + Main_prompt.prompt + global_readline.get_line_buffer())
+        Color.flush()
 
     @staticmethod
     def set_main_prompt_ready():
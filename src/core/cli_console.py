@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ cli_console.py            [Created: 2023-01-14 |  5:49 - PM]  #
-#                                       [Updated: 2023-01-14 |  5:49 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The CLI console of gitpy                                             #
 #  Language ~ Python3                                                       #
@@ -348,6 +348,7 @@ class CLI_Console():
                         self.__init__(pwd=self.pwd)
 
                     if cmd == 'whoami':
+                        Color.flush()
                         subprocess.run('whoami' , shell = True)
 
             except KeyboardInterrupt:
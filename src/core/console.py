@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ console.py                [Created: 2023-03-28 | 10:26 - AM]  #
-#                                       [Updated: 2023-03-28 | 12:02 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The main console of gitpy                                                #
 #  Language ~ Python3                                                       #
@@ -33,8 +33,9 @@
 
 # Import section
 import os
-import json
 import getpass
+import itertools
+from operator import itemgetter
 import platform
 from time import sleep
 
@@ -51,7 +52,8 @@ from src.util.based_distro import Based_Distro
 from src.util.add_cron_job import add_cron_job
 from src.util.internet_check import internet_check
 from src.tools.colored.colored import fg, attr
-import src.tools.requests as requests
+from src.util.github_client import GitHub_Client, then
+from src.util.rate_limiter import Rate_Limit_Exceeded
 # from src.tools.box import box
 # from src.tools.box.table import Table
 # from src.tools.box.console import Console
@@ -73,6 +75,7 @@ class Main_Console():
     # Parameters
     remove_existing_folder = False
     promptname = 'GitPy'
+    prefetched = {}
     show_main_menu = True
     SPACE = '#>SPACE$<#'
 
@@ -89,9 +92,60 @@ class Main_Console():
         'help'
     ]
 
+    def fetch_repo_details(self, repo):
+        '''
+            Start fetching the details, the latest commit and the branches of a
+            repository of the search results (in background). With the GraphQL
+            backend it's a single query, else 3 concurrent REST requests.
+
+            Arguments:
+                repo (dict): An item of the search results
+
+            Returns:
+                dict: The futures of the 'info' (dict), the 'latest_sha' (str) and the 'branches' (list)
+        '''
+        if repo['url'] not in self.prefetched:
+            client = GitHub_Client.shared()
+
+            if Configuration.GRAPHQL_ENABLED:
+                from src.util.github_graphql import GitHub_GraphQL
+                details = client.executor.submit(GitHub_GraphQL(client).repository, repo['owner']['login'], repo['name'])
+                self.prefetched[repo['url']] = {key: then(details, itemgetter(key)) for key in ('info', 'latest_sha', 'branches')}
+
+            else:
+                self.prefetched[repo['url']] = {
+                    'info': client.submit(repo['url'], parse=lambda response: response.json()),
+                    'latest_sha': client.executor.submit(client.head_sha, repo['owner']['login'], repo['name']),
+                    'branches': client.submit('%s/branches' % repo['url'], parse=lambda response: response.json()),
+                }
+
+        return self.prefetched[repo['url']]
+
+    def show_more_results(self, results, items):
+        '''
+            Print the next results of a search (as they arrive from GitHub)
+
+            Arguments:
+                results (Paginator): The results of the search
+                items (list): The results already printed (the new ones are added)
+
+            Returns:
+                int: The number of new results printed
+        '''
+        count = 0
+        for repo in itertools.islice(results, Configuration.CONSOLE_RESULTS_PER_PAGE):
+            items.append(repo)
+            Color.pl('  {D}[{W}{SB2}%s{W}{D}]{W} %s'% (len(items),repo['full_name']))
+            count += 1
+
+        return count
+
     def get_github_repo_info(self,repo_name, username=None):
+        # The requests started in background for the results of this search
+        self.prefetched = {}
+
         # Recherche des dépôts ayant un nom similaire
-        search_url = 'https://api.github.com/search/repositories?q=%s' % repo_name
+        search_url = '%s/search/repositories?q=%s' % (Configuration.GITHUB_API_URL, repo_name)
         if username:
             search_url += f"+user:{username}"
 
@@ -99,17 +153,13 @@ class Main_Console():
             Color.pl('  {§}  Searching for similar repositories with the GitHub API...')
             Color.pl('   {SY1}╰──╼{W} URL: {C}%s{W}' % search_url)
 
-        response = requests.get(search_url)
+        # The results are requested by pages of 100, only when they are printed
+        search_results = GitHub_Client.shared().paginate(search_url, key='items')
 
-        search_results = json.loads(response.text)
-
-        # if Configuration.verbose >= 3:
-        #     Color.pl('  {§}  Response: {C}%s{W}' % search_results)
-
-
-        # Affichage des dépôts similaires trouvés
-        items = search_results['items']
-        if len(items) == 0:
+        # Affichage des dépôts similaires trouvés (the first page is requested here)
+        items = []
+        first_result = next(search_results, None)
+        if first_result is None:
             if Configuration.verbose >= 3:
                 Color.pl('  {§} No items found in the "items" key of the search results.')
             Color.pl('  {!} No repositories found with the name \'%s\'.' % repo_name)
@@ -118,12 +168,16 @@ class Main_Console():
         # while True:
         # clear()
         # Affichage des dépôts trouvés
-        Color.pl('  {*} Here are the similar repositories found for \'%s\':' % repo_name)
-        for index, repo in enumerate(search_results['items']):
-            Color.pl('  {D}[{W}{SB2}%s{W}{D}]{W} %s'% (index+1,repo['full_name']))
+        Color.pl('  {*} Here are the similar repositories found for \'%s\' (%s results):' % (repo_name, search_results.total_count))
+        self.show_more_results(itertools.chain([first_result], search_results), items)
+
+        # While the user is reading the list, fetch the first results in background
+        for repo in items[:Configuration.CONSOLE_PREFETCH_COUNT]:
+            self.fetch_repo_details(repo)
 
         # Demande de l'utilisateur pour choisir un dépôt
         Color.pl('  {*} Select the repository that you want to clone.')
+        Color.pl('  {*} Enter {G}more{W} to show more results.')
         Color.pl('  {*} Enter {G}back{W} to come back to the main menu.')
         
         while True:
@@ -133,6 +187,11 @@ class Main_Console():
                     self.show_main_menu = True
                     break
 
+                if selected_index == 'more':
+                    if self.show_more_results(search_results, items) == 0:
+                        Color.pl('  {!} No more results.')
+                    continue
+
                 if not selected_index:
                     continue
 
@@ -151,25 +210,20 @@ class Main_Console():
         # Récupération des informations sur le dépôt
         if Configuration.verbose >= 3:
             Color.pl('  {§}  Getting information about the selected repository...')
-            Color.pl('   {SY1}╰──╼{W} Python: {SY1}selected_repo = search_results[\'items\'][selected_index]{W}')
-        selected_repo = search_results['items'][selected_index]
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}selected_repo = items[selected_index]{W}')
+        selected_repo = items[selected_index]
 
-        # Récupération des informations sur le dépôt
+        # Récupération des informations sur le dépôt (the details, the commits and the branches are fetched at the same time)
         if Configuration.verbose >= 3:
             Color.pl('  {§}  Getting information about the selected repository...')
-            Color.pl('   {SY1}├──╼{W} Python: {SY1}repo_url = selected_repo[\'url\']{W}')
+            Color.pl('   {SY1}├──╼{W} Python: {SY1}futures = self.fetch_repo_details(selected_repo){W}')
 
-        repo_url = selected_repo['url']
+        futures = self.fetch_repo_details(selected_repo)
 
         if Configuration.verbose >= 3:
-            Color.pl('   {SY1}├──╼{W} Python: {SY1}response = requests.get(repo_url){W}')
-        
-        response = requests.get(repo_url)
-
-        if Configuration.verbose >= 3:
-            Color.pl('   {SY1}╰──╼{W} Python: {SY1}repo_info = json.loads(response.text){W}')
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}repo_info = futures[\'info\'].result(){W}')
 
-        repo_info = json.loads(response.text)
+        repo_info = futures['info'].result()
 
         # if Configuration.verbose >= 3:
         #     Color.pl('   {SY1}├──╼{W} value: {C}%s{W}' % repo_info['name'])
@@ -193,23 +247,8 @@ class Main_Console():
 
         seconde_line = '=' * information_line_length
 
-        # Replace with your GitHub username and repository name
-        username = repo_info['owner']['login']
-        repo_name = repo_info['name']
-
-        # Build the URL for the API call
-        url = 'https://api.github.com/repos/%s/%s/commits' % (username, repo_name)
-
-        # Send a GET request to the API with the appropriate headers
-        headers = {'Accept': 'application/vnd.github.v3+json'}
-        response = requests.get(url, headers=headers)
-
-        # Check the response status code
-        if response.status_code != 200:
-            raise Exception(f' Request failed with status code {response.status_code}')
-
-        # Parse the JSON response and get the SHA hash of the latest commit
-        current_commit_sha = response.json()[0]['sha']
+        # The latest commit of the repository (already requested with its details)
+        current_commit_sha = futures['latest_sha'].result()
 
         data = [
             ('',''), 
@@ -254,11 +293,9 @@ class Main_Console():
         # Demande de l'utilisateur pour choisir la branche
         if Configuration.verbose >= 3:
             Color.pl('  {§}  Getting information about the branches of the selected repository...')
-            Color.pl('   {SY1}╰──╼{W} Request: {SY1}GET %s/branches{W}' % repo_info['url'])
+            Color.pl('   {SY1}╰──╼{W} Request: {SY1}GET %s/branches{W} (already requested with its details)' % repo_info['url'])
 
-        branches_url = f"{repo_info['url']}/branches"
-        response = requests.get(branches_url)
-        branches_info = json.loads(response.text)
+        branches_info = futures['branches'].result()
 
         Color.pl('\n  {*} All branches avalable for \'%s\':' % repo_info['name'])
 
@@ -283,6 +320,8 @@ class Main_Console():
                 continue
 
         selected_branch = branches_info[selected_branch_index -1 ]['name']
+        # The subscription follows the head of the selected branch (not of the default one)
+        selected_branch_sha = branches_info[selected_branch_index -1 ]['commit']['sha']
 
         # Demande de l'utilisateur pour télécharger le dépôt
         download_url = repo_info['clone_url']
@@ -364,6 +403,8 @@ class Main_Console():
                 Color.pl('  {*} Enter the SMTP server username (the email).')
                 smtp_username =  input(self.prompt(menu='choose_smtp_username'))
                 Color.pl('  {*} Enter the SMTP server password.')
+                # getpass() writes on the terminal by itself, show the buffered lines first
+                Color.flush()
                 smtp_password = getpass.getpass(self.prompt(menu='choose_smtp_password'))
                 # print(smtp_password)
 
@@ -375,7 +416,7 @@ class Main_Console():
                     github_repo_branch=selected_branch,
                     github_repo_url=repo_info['html_url'],
                     github_repo_api_url=repo_info['url'],
-                    current_commit_sha=current_commit_sha,
+                    current_commit_sha=selected_branch_sha,
 
                     receiver_email_address=receiver_email_address,
 
@@ -391,7 +432,7 @@ class Main_Console():
                 if Configuration.verbose == 3:
                     Color.pl('  {§} Call the {P}add_cron_job(){W} function.')
                     Color.pl('   {SY1}├──╼{W} Python: {SY1}add_cron_job{W}')
-                    Color.pl('   {SY1}╰──╼{W} Crontab: {SY1}run the "gitpy --check-repo" every day at 19h{W}')
+                    Color.pl('   {SY1}╰──╼{W} Crontab: {SY1}run the "gitpy --check-repo" at %s{W}' % Configuration.CHECK_CRON_SCHEDULE)
                 add_cron_job()
 
             Color.pl('  {*} All done!')
@@ -520,11 +561,16 @@ class Main_Console():
                 if not cmd:
                     continue
 
-                self.get_github_repo_info(repo_name=text_input)
+                # Out of GitHub API budget: the console stays open until the reset
+                try:
+                    self.get_github_repo_info(repo_name=text_input)
+                except Rate_Limit_Exceeded as E:
+                    Color.pl('  {!} %s.' % E)
+                    Color.pl('  {*} Add a GitHub token (see {G}GITPY_GITHUB_TOKENS{W}) to get a bigger rate limit.')
 
         except KeyboardInterrupt:
             Color.pl('  {!} Interrupted, shutting down...')
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1,pwd=self.pwd)
 
     def __init__(self, pwd):
@@ -546,7 +592,7 @@ class Main_Console():
             Color.pl('  {!} You tried to run GitPy on a non-linux machine!')
             Color.pl('  {*} GitPy can be run only on a Linux kernel.')
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1,pwd=self.pwd)
 
         else:
@@ -585,7 +631,7 @@ class Main_Console():
                     Color.pl('   {SY1}╰──╼{W} The user is {C}not root{W}')
                 Color.pl('  {!} The GitPy Console must be run as root.')
                 Color.pl('  {*} Re-run with sudo or switch to root user.')
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=self.pwd)
             else:
                 if Configuration.verbose == 3:
@@ -612,14 +658,14 @@ class Main_Console():
                         Color.pl('   {SY1}╰──╼{W} The user\'s Linux distro is {C}not Arch or Debian{W}')
                     Color.pl('  {!} You\'re not running Debian or Arch variant.')
                     Color.pl('  {*} GitPy can only be run on Debian or Arch based Linux distros.')
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=self.pwd)
 
                 # Check if the use are connected to the Internet network with the internet_check() function
                 Color.pl('  {-} Checking for internet connexion...')
                 if Configuration.verbose == 3:
                     Color.pl('  {§} Call the {P}internet_check(){W} function.')
-                    Color.pl('   {SY1}╰──╼{W} Python: {SY1}request.urlopen(host, timeout=10){W}')
+                    Color.pl('   {SY1}╰──╼{W} Python: {SY1}internet_check(){W} (TCP probe of {C}%s{W})' % ', '.join(Configuration.CONNECTIVITY_HOSTS))
 
                 # Check if the user is connected to the Internet
                 if internet_check() == True:
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ daemon.py                 [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  The resident daemon of GitPy (gitpy --daemon)                            #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import io
+import os
+import sys
+import json
+import time
+import socket
+import struct
+import importlib
+import traceback
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.exit_tool import exit_tool
+from src.util.daemon_client import send_message, receive_message, request, DAEMON_ENVIRONMENT, REQUEST, STDOUT, STDERR, EXIT
+
+# Main
+class Frame_Writer(io.RawIOBase):
+    '''
+        A raw stream that sends everything written into it to the client, as
+        messages of one kind (STDOUT or STDERR). Wrapped in a TextIOWrapper,
+        it replaces sys.stdout/sys.stderr while a command runs.
+
+        Arguments:
+            conn (socket): The connection with the client
+            kind (bytes): The type of the messages
+            tty (bool): What isatty() returns (the client's terminal)
+    '''
+
+    def __init__(self, conn, kind, tty):
+        self.conn = conn
+        self.kind = kind
+        self.tty = tty
+
+    def writable(self):
+        return True
+
+    def isatty(self):
+        return self.tty
+
+    def write(self, data):
+        send_message(self.conn, self.kind, bytes(data))
+        return len(data)
+
+
+class Daemon():
+    '''
+        The resident daemon of GitPy. It keeps the interpreter, the imported
+        modules and the opened connections to GitHub, and runs the commands
+        forwarded by the 'gitpy' command (see src/util/daemon_client.py) one
+        after the other, in its own process.
+
+        Arguments:
+            pwd (str): The GitPy's directory
+    '''
+
+    # Imported before serving, so the first commands don't pay for it
+    PRELOAD_MODULES = [
+        'src.args',
+        'src.util.help_messages',
+        'src.util.github_repo',
+        'src.tools.requests',
+        'src.util.github_client',
+        'src.util.retry_policy',
+        'src.util.rate_limiter',
+        'src.util.http_cache',
+        'src.util.github_graphql',
+        'src.tools.packaging.version',
+        'src.core.send_email',
+    ]
+
+    def __init__(self, pwd):
+        self.pwd = pwd
+        self.socket_path = Configuration.CACHE_PATH + Configuration.DAEMON_SOCKET_FILE
+        self.pid_path = Configuration.CACHE_PATH + Configuration.DAEMON_PID_FILE
+        self.started_at = None
+        self.served = 0
+        # The environment the Configuration has been computed from
+        self.environment = dict(os.environ)
+
+    # -------------------- [ Client side ] -------------------- #
+    def ping(self):
+        '''
+            Ask the status of the running daemon
+
+            Returns:
+                dict: The status of the daemon, or None if it's not running
+        '''
+        sock = request({'command': 'status'}, timeout=2)
+        if sock is None:
+            return None
+
+        try:
+            kind, payload = receive_message(sock)
+            return json.loads(payload) if kind == STDOUT else None
+
+        except (OSError, ValueError):
+            return None
+
+        finally:
+            sock.close()
+
+    def start(self):
+        status = self.ping()
+        if status:
+            Color.pl('  {*} The GitPy daemon is already running (PID: {C}%s{W}).' % status['pid'])
+            return
+
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Starting the daemon in a detached process...')
+            Color.pl('   {SY1}╰──╼{W} Socket: {C}%s{W}' % self.socket_path)
+
+        # Flush the output first, else the buffered text would be printed twice
+        Color.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid != 0:
+            # Reap the intermediate child, the daemon is adopted by init
+            os.waitpid(pid, 0)
+
+            # Wait until the daemon answers
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline:
+                status = self.ping()
+                if status:
+                    Color.pl('  {+} GitPy daemon started (PID: {C}%s{W}).' % status['pid'])
+                    return
+                time.sleep(0.05)
+
+            Color.pl('  {!} The GitPy daemon did not start.')
+            exit_tool(1,pwd=self.pwd)
+
+        try:
+            os.setsid()
+            if os.fork() == 0:
+                # Detach from the terminal of the user
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for fd in (0, 1, 2):
+                    os.dup2(devnull, fd)
+
+                self.serve()
+
+        finally:
+            os._exit(0)
+
+    def stop(self):
+        sock = request({'command': 'stop'}, timeout=5)
+        if sock is None:
+            Color.pl('  {*} The GitPy daemon is not running.')
+            return
+
+        try:
+            receive_message(sock)
+        except (OSError, ValueError):
+            pass
+        finally:
+            sock.close()
+
+        Color.pl('  {+} GitPy daemon stopped.')
+
+    def status(self):
+        status = self.ping()
+        if status is None:
+            Color.pl('  {*} The GitPy daemon is {R}not running{W}.')
+            return
+
+        Color.pl('  {*} The GitPy daemon is {G}running{W}.')
+        Color.pl('   {G}├──╼{W} PID: {C}%s{W}' % status['pid'])
+        Color.pl('   {G}├──╼{W} Uptime: {C}%ds{W}' % status['uptime'])
+        Color.pl('   {G}├──╼{W} Commands served: {C}%s{W}' % status['served'])
+        Color.pl('   {G}╰──╼{W} Socket: {C}%s{W}' % self.socket_path)
+
+    # -------------------- [ Daemon side ] -------------------- #
+    def serve(self):
+        '''
+            Listen on the Unix socket and run the requests until a 'stop' request
+        '''
+        for module in self.PRELOAD_MODULES:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                # A missing dependency will be reported by the command that needs it
+                pass
+
+        os.makedirs(Configuration.CACHE_PATH, mode=0o700, exist_ok=True)
+
+        # A daemon killed without cleaning leaves its socket behind
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        # Only the user can connect to the socket (and every client is checked)
+        umask = os.umask(0o177)
+        try:
+            server.bind(self.socket_path)
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, 0o600)
+        server.listen(8)
+
+        with open(self.pid_path, 'w') as pid_file:
+            pid_file.write(str(os.getpid()))
+
+        self.started_at = time.monotonic()
+        try:
+            running = True
+            while running:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        running = self.handle(conn)
+                    except (OSError, ValueError):
+                        # The client went away or sent garbage
+                        pass
+
+        finally:
+            server.close()
+            for path in (self.socket_path, self.pid_path):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def is_allowed(self, conn):
+        '''
+            Only the user running the daemon can use it (SO_PEERCRED)
+        '''
+        credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i'))
+        _, uid, _ = struct.unpack('3i', credentials)
+        return uid == os.getuid()
+
+    def handle(self, conn):
+        '''
+            Answer a request
+
+            Returns:
+                bool: False if the daemon must stop
+        '''
+        if not self.is_allowed(conn):
+            return True
+
+        kind, payload = receive_message(conn)
+        if kind != REQUEST:
+            return True
+
+        message = json.loads(payload)
+
+        if message['command'] == 'status':
+            status = {'pid': os.getpid(), 'uptime': time.monotonic() - self.started_at, 'served': self.served}
+            send_message(conn, STDOUT, json.dumps(status).encode('utf-8'))
+            send_message(conn, EXIT, b'0')
+            return True
+
+        if message['command'] == 'stop':
+            send_message(conn, EXIT, b'0')
+            return False
+
+        if message['command'] == 'run':
+            if not self.same_environment(message['env']):
+                # Let the client run it with its own tokens, cache...
+                send_message(conn, EXIT, b'null')
+                return True
+
+            code = self.run_command(conn, message)
+            self.served += 1
+            send_message(conn, EXIT, json.dumps(code).encode('utf-8'))
+
+        return True
+
+    def same_environment(self, env):
+        '''
+            Check if the environment of a client gives the same Configuration
+            (and shared GitHub client) as the one this daemon has loaded
+
+            Arguments:
+                env (dict): The environment of the client
+
+            Returns:
+                bool: True if the daemon can run the client's commands
+        '''
+        return all(env.get(name) == self.environment.get(name) for name in DAEMON_ENVIRONMENT)
+
+    def run_command(self, conn, message):
+        '''
+            Run a gitpy command line in this process, as if it was run by the
+            client: same arguments, environment, working directory and
+            terminal, with its output sent to the client.
+
+            Returns:
+                int: The exit code of the command
+        '''
+        from src.__main__ import entry_point
+
+        saved = (sys.argv, dict(os.environ), os.getcwd(), sys.stdin, sys.stdout, sys.stderr, Color.enabled, Configuration.verbose)
+
+        sys.argv = ['gitpy'] + message['argv']
+        os.environ.clear()
+        os.environ.update(message['env'])
+        try:
+            os.chdir(message['cwd'])
+        except OSError:
+            # The directory of the client is not reachable from here
+            pass
+
+        # The forwarded commands never ask anything
+        sys.stdin = io.StringIO()
+        sys.stdout = io.TextIOWrapper(io.BufferedWriter(Frame_Writer(conn, STDOUT, message['color'])), encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(io.BufferedWriter(Frame_Writer(conn, STDERR, message['color'])), encoding='utf-8', errors='replace', write_through=True)
+        Color.enabled = message['color']
+        Configuration.verbose = 0
+
+        code = 0
+        try:
+            entry_point(pwd=self.pwd)
+
+        except SystemExit as e:
+            if isinstance(e.code, int):
+                code = e.code
+            elif e.code is not None:
+                # sys.exit('message')
+                sys.stderr.write('%s\n' % e.code)
+                code = 1
+
+        except BaseException:
+            sys.stderr.write(traceback.format_exc())
+            code = 1
+
+        finally:
+            for stream in (sys.stdout, sys.stderr):
+                try:
+                    stream.flush()
+                except (OSError, ValueError):
+                    pass
+
+            (sys.argv, environ, cwd, sys.stdin, sys.stdout, sys.stderr, Color.enabled, Configuration.verbose) = saved
+            os.environ.clear()
+            os.environ.update(environ)
+            os.chdir(cwd)
+
+        return code
+
+
+# Main (entry point)
+def entry_point(action, pwd):
+    '''
+        Start, stop or show the status of the daemon
+
+        Arguments:
+            action (str): 'start', 'stop' or 'status'
+            pwd (str): The GitPy's directory
+    '''
+    daemon = Daemon(pwd=pwd)
+
+    if action == 'start':
+        daemon.start()
+
+    elif action == 'stop':
+        daemon.stop()
+
+    elif action == 'status':
+        daemon.status()
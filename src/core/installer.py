@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ installer.py              [Created: 2023-03-07 | 10:27 - AM]  #
-#                                       [Updated: 2023-04-10 | 14:30 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The installer of GitPy for install GitPy and the                         #
 #  dependencies                                                             #
@@ -37,7 +37,6 @@ import os
 import shutil
 import platform
 import pkg_resources
-from time import sleep
 
 ## Third party libraries
 from src.util.github_repo import GitHub_Repo
@@ -49,10 +48,11 @@ from src.util.exit_tool import exit_tool
 from src.util.env_var import set_env_var
 from src.util.based_distro import Based_Distro
 from src.util.internet_check import internet_check
-from src.util.remove_python_cache import remove_python_cache
 from src.util.if_package_exist import package_exists
+from src.util.bytecode_cache import compile_bytecode_cache
 from src.util.create_bin_file import Create_bin_file
 from src.util.check_path import check_folder_path
+from src.util.step_engine import Step, Step_Engine
 
 # Main
 class Installer():
@@ -103,10 +103,172 @@ class Installer():
     REPO_BRANCH = Configuration.REPO_BRANCH
     REPO_MASTER_BRANCH = Configuration.REPO_MASTER_BRANCH
 
+    # -------------------- [ Installation steps ] -------------------- #
+    def system_update(self):
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Updating the packages database of the {C}%s{W} based system...' % self.based_distro)
+
+        if self.based_distro == 'Arch':
+            Process.call('pacman -Syy')
+
+        elif self.based_distro == 'Debian':
+            Process.call('apt update')
+
+    def install_packages(self):
+        if self.based_distro == 'Arch':
+            package_list = self.arch_package_list
+            install_command = 'pacman --needed --noconfirm %s -S %%s' % ('-q' if self.quiet else '-v')
+
+        elif self.based_distro == 'Debian':
+            package_list = self.debian_package_list
+            install_command = 'apt install %s-y %%s' % ('-qqq ' if self.quiet else '')
+
+        for package_name in package_list:
+            if package_exists(package=package_name):
+                if not self.quiet:
+                    Color.pl('  {*} The package \'%s\' are already installed.' % package_name)
+
+            else:
+                if not self.quiet:
+                    Color.pl('  {-} Installing \'%s\' package...' % package_name)
+                Process.call(install_command % package_name, shell=True)
+
+    def install_pip_packages(self):
+        for pip_package_name in self.pip_package_name_list:
+            try:
+                pkg_resources.get_distribution(pip_package_name)
+                if not self.quiet:
+                    Color.pl('  {*} PIP\'s package \'%s\' already intsalled.' % pip_package_name)
+
+            except pkg_resources.DistributionNotFound:
+                if not self.quiet:
+                    Color.pl('  {-} Installing \'%s\' PIP\'s package...' % pip_package_name)
+                Process.call('pip install %s' % pip_package_name, shell=True)
+
+    def prepare_folders(self):
+        # Remove the current GitPy instance (the user already accepted it)
+        if os.path.isdir(self.INSTALL_PATH):
+            if Configuration.verbose == 3:
+                Color.pl('  {§} Deleting current GitPy files...')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}' % self.INSTALL_PATH)
+            shutil.rmtree(self.INSTALL_PATH)
+
+        if os.path.isdir(self.TEMP_PATH):
+            if Configuration.verbose == 3:
+                Color.pl('  {§} GitPy\'s temporary folder detected.')
+                Color.pl('  {§} Remove it...')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.TEMP_PATH){W}')
+            shutil.rmtree(self.TEMP_PATH)
+
+        ### Create the main directory of GitPy
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Creating main folder ({C}%s{W})...' % self.INSTALL_PATH)
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(INSTALL_PATH, mode=0o777){W}')
+        os.makedirs(self.INSTALL_PATH, mode=0o777)
+
+        ### Create the temp folder that be use to download the latest GitPy version from GitHub
+        ### in it and install GitPy from this folder
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Creating temporary folder ({C}%s{W})...' % self.TEMP_PATH)
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.TEMP_PATH, mode=0o777){W}')
+        os.makedirs(self.TEMP_PATH, mode=0o777)
+
+    def clone_repo(self):
+        ### Clone the latest version of GitPy into the temp. folder
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Cloning files from GitHub to the temporary directory...')
+        Process.call('git clone %s --verbose --branch %s %s' % (self.REPO_CLONE_URL , self.REPO_BRANCH , self.TEMP_PATH), shell=True)
+
+        # Process.call() doesn't raise on failure, so stop the flow here if nothing was cloned
+        if not os.path.isfile(self.TEMP_PATH + 'gitpy.py'):
+            raise RuntimeError('Unable to clone GitPy from %s' % self.REPO_CLONE_URL)
+
+    def copy_files(self):
+        ### Install GitPy by moving all the files from the temp. folder to the main folder
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Copying all files from the GitPy\'s temporary folder to the main directory ({C}%s{W})...' % self.INSTALL_PATH)
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.copytree(src=self.TEMP_PATH, dst=INSTALL_PATH, dirs_exist_ok=True){W}')
+        shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
+
+    def compile_cache(self):
+        ### Compile the bytecode cache of the new GitPy instance
+        if Configuration.verbose == 3:
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}compile_bytecode_cache(path=self.INSTALL_PATH){W}')
+
+        for failed_file in compile_bytecode_cache(path=self.INSTALL_PATH):
+            if not self.quiet:
+                Color.pl('  {$} Cannot compile {C}%s{W}, it will be compiled at runtime.' % failed_file)
+
+    def create_bin_file(self):
+        ### Create the command 'gitpy' in /usr/bin
+        ### If a file called 'gitpy' already exist, inform the user and delete it
+        if os.path.isfile(self.BIN_PATH + 'gitpy'):
+            if Configuration.verbose == 3:
+                Color.pl('  {§} The gitpy command already exist in {C}%s{W}' % self.BIN_PATH)
+                Color.pl('  {§} Remove it...')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + \'gitpy\'){W})')
+            os.remove(self.BIN_PATH + 'gitpy')
+
+        # Create and write the 'gitpy' file into /usr/bin/
+        with open(self.BIN_PATH + 'gitpy', 'x') as gitpy_file:
+            gitpy_file.write(self.gitpy_command_bin)
+
+    def apply_permissions(self):
+        Process.call('chmod 777 %sgitpy' % self.BIN_PATH, shell=True)
+        Process.call('chmod 777 -R %s' % self.INSTALL_PATH, shell=True)
+
+    def remove_temp_folder(self):
+        # Deleting the temporary directory
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Remove the temporary directory ({C}%s{W})...' % self.TEMP_PATH)
+        shutil.rmtree(self.TEMP_PATH)
+
+    def create_env_var(self):
+        # Create the environment variable
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Create the {C}{bold}%s{W} environment variable...' % self.gitpy_install_path_env_var_name)
+            Color.pl('  {§} Call the {P}set_env_var(){W} function.')
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}set_env_var(name=self.gitpy_install_path_env_var_name, value=self.gitpy_install_path_env_var_value){W}')
+
+        ## The environment variable is used to know where GitPy is installed
+        set_env_var(var_name=self.gitpy_install_path_env_var_name, var_value=self.gitpy_install_path_env_var_value)
+
+    def installation_steps(self, args):
+        '''
+            The steps of the installation and their dependencies.
+            The independent steps (like the clone of GitPy and the system
+            packages) run at the same time. The command and the environment
+            variable are only created once the GitPy's files are installed.
+        '''
+        steps = []
+        package_requires = []
+
+        if not args.skip_update:
+            steps.append(Step('system_update', self.system_update, message='Updating your system'))
+            package_requires = ['system_update']
+
+        steps += [
+            Step('packages', self.install_packages, requires=package_requires, message='Checking the system packages'),
+            Step('pip_packages', self.install_pip_packages, requires=['packages'], message='Checking the PIP\'s packages'),
+            Step('prepare_folders', self.prepare_folders, message='Preparing the GitPy\'s folders'),
+            # The clone only has to wait for the packages if git is not installed yet
+            Step('clone', self.clone_repo, requires=['prepare_folders'] + ([] if shutil.which('git') else ['packages']),
+                 message='Downloading GitPy into {C}%s{W}' % self.TEMP_PATH),
+            Step('copy_files', self.copy_files, requires=['clone'], message='Installing GitPy files'),
+            Step('compile_cache', self.compile_cache, requires=['copy_files'], message='Compiling the GitPy\'s bytecode cache'),
+            Step('bin_file', self.create_bin_file, requires=['copy_files'], message='Create the {G}gitpy{W} command into {C}%s{W}' % self.BIN_PATH),
+            Step('permissions', self.apply_permissions, requires=['compile_cache', 'bin_file'], message='Apply rights to the new files'),
+            Step('remove_temp_folder', self.remove_temp_folder, requires=['copy_files']),
+            Step('env_var', self.create_env_var, requires=['copy_files'], message='Create the {C}{bold}%s{W} environment variable' % self.gitpy_install_path_env_var_name),
+        ]
+
+        return steps
+
     # Main
     def __init__(self, args, pwd):
 
         self.pwd = pwd
+        self.quiet = args.quiet
 
         # Check if the user's platform is a Linux machine or not
         if platform.system() != 'Linux':
@@ -126,12 +288,10 @@ class Installer():
             else:
                 # Distro check
                 if Based_Distro() == 'Arch':
-                    based_distro = 'Arch'
-                    pass
+                    self.based_distro = 'Arch'
 
                 elif Based_Distro() == 'Debian':
-                    based_distro = 'Debian'
-                    pass
+                    self.based_distro = 'Debian'
 
                 else:
                     Color.pl(GitPy.Banner())
@@ -153,100 +313,23 @@ class Installer():
             # self.gitpy_path_notification_config_file_env_var_value = self.INSTALL_PATH + 'config/new_version_notification.conf'
             
         # gitpy main file in /usr/bin/
-        gitpy_command_bin = Create_bin_file.__init__(path=self.INSTALL_PATH)
+        self.gitpy_command_bin = Create_bin_file.__init__(path=self.INSTALL_PATH)
 
         # Main
         if args.quiet:
             # -------------------- [ Quiet installation ] -------------------- #
             try:
-                ## System update
-                if args.skip_update:
-                    pass
-
-                else:
-                    sleep(0.5)
-                    if based_distro == 'Arch':
-                        Process.call('pacman -Syy')
-
-                    elif based_distro == 'Debian':
-                        Process.call('apt update')
-                    sleep(1)
-
-                ## Tools installation
-                if based_distro == 'Arch':
-                    for arch_package_name in self.arch_package_list:
-                        if package_exists(package=arch_package_name):
-                            pass
-
-                        else:
-                            Process.call('pacman --needed --noconfirm -q -S %s'% arch_package_name, shell=True)
-                elif based_distro == 'Debian':
-                    for debian_package_name in self.debian_package_list:
-                        if package_exists(package=debian_package_name):
-                            pass
-
-                        else:
-                            Process.call('apt install -qqq-y %s'% debian_package_name, shell=True)
-
-                ## PIP package
-                for pip_package_name in self.pip_package_name_list:
-                    try:
-                        pkg_resources.get_distribution(pip_package_name)
-
-                    except pkg_resources.DistributionNotFound:
-                        Process.call('pip install %s' % pip_package_name, shell=True)
-
-                ## GitPy installation
-                if os.path.isdir(self.INSTALL_PATH):
-                    shutil.rmtree(self.INSTALL_PATH)
-
-                    if os.path.isdir(self.TEMP_PATH):
-                        shutil.rmtree(self.TEMP_PATH)
-
-                ## GitPy files
-                ### Create the main folder in /usr/share/
-                os.makedirs(self.INSTALL_PATH, mode=0o777)    # Create the main directory of GitPy
-
-                ### Create the temp folder that be use to download the latest GitPy version from GitHub
-                ### in it and install GitPy from this folder
-                os.makedirs(self.TEMP_PATH, mode=0o777)
-
-                ### Clone the latest version of GitPy into the temp. folder
-                Process.call('git clone %s --verbose --branch %s %s' % (self.REPO_CLONE_URL , self.REPO_BRANCH , self.TEMP_PATH), shell=True)
+                Step_Engine(self.installation_steps(args), quiet=True).run()
 
-                ### Install GitPy by moving all the files from the temp. folder to the main folder
-                shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
+            except Exception as E:
+                Color.pexception(E)
+                # Exit
+                exit_tool(1,pwd=self.pwd)
 
-                ### Create the command 'gitpy' in /usr/bin
-                # If a file called 'gitpy' already exist, inform the user and delete it
-                if os.path.isfile(self.BIN_PATH + 'gitpy'):
-                    os.remove(self.BIN_PATH + 'gitpy')
-                else:
-                    pass
-
-                # Create and write the 'gitpy' file into /usr/bin/
-                with open(self.BIN_PATH + 'gitpy', 'x') as gitpy_file:
-                    gitpy_file.write(gitpy_command_bin)
-
-                ### Apply rights on files
-                sleep(1)
-                Process.call('chmod 777 %sgitpy' % self.BIN_PATH, shell=True)
-                Process.call('chmod 777 -R %s' % self.INSTALL_PATH, shell=True)
-                # Deleting the temporary directory
-                shutil.rmtree(self.TEMP_PATH)
-                sleep(1)
-                # Create the environment variable
-
-                ## The environment variable is used to know where GitPy is installed
-                set_env_var(var_name=self.gitpy_install_path_env_var_name, var_value=self.gitpy_install_path_env_var_value)
-
-                ## The environment variable is used to know where the News Version Notification config file is
-                # set_env_var(var_name=self.gitpy_path_notification_config_file_env_var_name, var_value=self.gitpy_path_notification_config_file_env_var_value)
-    
             except KeyboardInterrupt:
                 Color.pl('\n  {!} Installation process interrupted.')
                 Color.pl('  {!} You must re-run the installation process to install GitPy correctly.')  
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=self.pwd)
 
         else:
@@ -273,7 +356,7 @@ class Installer():
             Color.pl('  {-} Checking for internet connexion...')
             if Configuration.verbose == 3:
                 Color.pl('  {§} Call the {P}internet_check(){W} function.')
-                Color.pl('   {SY1}╰──╼{W} Python: {SY1}request.urlopen(host, timeout=10){W}')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}internet_check(){W} (TCP probe of {C}%s{W})' % ', '.join(Configuration.CONNECTIVITY_HOSTS))
 
             if internet_check() == True:
                 Color.pl('  {+} Internet status: {G}Connected{W}.')
@@ -322,58 +405,8 @@ class Installer():
 
             if choice_1.lower() == 'y' or not choice_1:
                 try:
-                    # System update
-                    if args.skip_update:
-                        Color.pl('  {*} System update skiped.')
-                        pass
-
-                    else:
-                        Color.pl('  {-} Updating your system...')
-                        if Configuration.verbose == 3:
-                            Color.pl('  {§} Python: {SY1}sleep(0.5){W}')
-
-                        sleep(0.5)
-                        if based_distro == 'Arch':
-                            Process.call('pacman -Syy')
-
-                        elif based_distro == 'Debian':
-                            Process.call('apt update')
-
-                        if Configuration.verbose == 3:
-                                Color.pl('  {§} Python: {SY1}sleep(1){W}')
-
-                        sleep(1)
-
-                    # Tools installation
-                    if based_distro == 'Arch':
-                        for arch_package_name in self.arch_package_list:
-                            if package_exists(package=arch_package_name):
-                                Color.pl('  {*} The package \'%s\' are already installed.' % arch_package_name)
-
-                            else:
-                                Color.pl('  {-} Installing \'%s\' package...' % arch_package_name)
-                                Process.call('pacman --needed --noconfirm -v -S %s'% arch_package_name, shell=True)
-
-                    elif based_distro == 'Debian':
-                        for debian_package_name in self.debian_package_list:
-                            if package_exists(package=debian_package_name):
-                                Color.pl('  {*} The package \'%s\' are already installed.' % debian_package_name)
-
-                            else:
-                                Color.pl('  {-} Installing \'%s\' package...' % debian_package_name)
-                                Process.call('apt install -y %s'% debian_package_name, shell=True)
-
-                    ## PIP package
-                    for pip_package_name in self.pip_package_name_list:
-                        try:
-                            pkg_resources.get_distribution(pip_package_name)
-                            Color.pl('  {*} PIP\'s package \'%s\' already intsalled.' % pip_package_name)
-
-                        except pkg_resources.DistributionNotFound:
-                            Color.pl('  {-} Installing \'%s\' PIP\'s package...' % pip_package_name)
-                            Process.call('pip install %s' % pip_package_name, shell=True)
-
                     # GitPy installation
+                    # Ask before running the steps, they run without any prompt
                     if os.path.isdir(self.INSTALL_PATH):
                         Color.pl('  {$} A GitPy instance already exist in {C}%s{W}.' % self.INSTALL_PATH)
 
@@ -384,112 +417,15 @@ class Installer():
                         else:
                             choice_2 = input(Color.s('  {?} Do you want to replace it? [Y/n]: '))
 
-                        if choice_2.lower() == 'y' or not choice_2:
-                            Color.pl('  {-} Deleting current GitPy files...')
-                            
-                            if Configuration.verbose == 3:
-                                Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}' % self.INSTALL_PATH)
-
-                            shutil.rmtree(self.INSTALL_PATH)
-
-                            if os.path.isdir(self.TEMP_PATH):
-                                if Configuration.verbose  == 3:
-                                    Color.pl('  {§} GitPy\'s temporary folder detected.')
-                                    Color.pl('  {§} Remove it...')
-                                    Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.TEMP_PATH){W}')
-
-                                shutil.rmtree(self.TEMP_PATH)
-
-                        else:
+                        if not (choice_2.lower() == 'y' or not choice_2):
                             Color.pl('  {!} You must remove the current GitPy files by yourself for continue the install process!')
-                            # Exit and removing the python cache
+                            # Exit
                             exit_tool(1,pwd=self.pwd)
 
-                    ## GitPy files
-                    Color.pl('  {-} Installing GitPy files...')
-
-                    ### Create the main directory of GitPy
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Creating main folder ({C}%s{W})...' % self.INSTALL_PATH)
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(INSTALL_PATH, mode=0o777){W}')
-
-                    os.makedirs(self.INSTALL_PATH, mode=0o777)    
-
-                    ### Create the temp folder that be use to download the latest GitPy version from GitHub
-                    ### in it and install GitPy from this folder
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Creating temporary folder ({C}%s{W})...' % self.TEMP_PATH)
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.TEMP_PATH, mode=0o777){W}')
-
-                    os.makedirs(self.TEMP_PATH, mode=0o777)
-
-                    ### Clone the latest version of GitPy into the temp. folder
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Cloning files from GitHub to the temporary directory...')
-                    Process.call('git clone %s --verbose --branch %s %s' % (self.REPO_CLONE_URL , self.REPO_BRANCH , self.TEMP_PATH), shell=True)
-
-                    ### Install GitPy by moving all the files from the temp. folder to the main folder
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Copying all files from the GitPy\'s temporary folder to the main directory ({C}%s{W})...' % self.INSTALL_PATH)
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.copytree(src=self.TEMP_PATH, dst=INSTALL_PATH, dirs_exist_ok=True){W}')
-                    shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-
-                    ### Create the command 'gitpy' in /usr/bin
-                    ### If a file called 'gitpy' already exist, inform the user and delete it
-                    if os.path.isfile(self.BIN_PATH + 'gitpy'):
-                        if Configuration.verbose == 3:
-                            Color.pl('  {§} The gitpy command already exist in {C}%s{W}' % self.BIN_PATH)
-                            Color.pl('  {§} Remove it...')
-                            Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + \'gitpy\'){W})')
-                        os.remove(self.BIN_PATH + 'gitpy')
-
-                    else:
-                        pass
-
-                    # Create the command 'gitpy' in /usr/bin/
-                    Color.pl('  {-} Create the {G}gitpy{W} command into {C}%s{W}...' % self.BIN_PATH)
-
-                    # Create and write the 'gitpy' file into /usr/bin/
-                    with open(self.BIN_PATH + 'gitpy', 'x') as gitpy_file:
-                        gitpy_file.write(gitpy_command_bin)
-
-                    ### Apply rights on files
-                    Color.pl('  {-} Apply rights to the new files...')
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Python: {SY1}sleep(1){W}')
-
-                    sleep(1)
-
-                    Process.call('chmod 777 %sgitpy' % self.BIN_PATH, shell=True)
-                    Process.call('chmod 777 -R %s' % self.INSTALL_PATH, shell=True)
-
-                    # Deleting the temporary directory
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Remove the temporary directory ({C}%s{W})...' % self.TEMP_PATH)
-
-                    shutil.rmtree(self.TEMP_PATH)
-
-                    if Configuration.verbose == 3:
-                        Color.pl('  {#} Python: {SY1}sleep(1){W}')
-
-                    sleep(1)
-
-                    # Create the environment variable
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Create the {C}{bold}%s{W} environment variable...' % self.gitpy_install_path_env_var_name)
-                        Color.pl('  {§} Call the {P}set_env_var(){W} function.')
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}set_env_var(name=self.gitpy_install_path_env_var_name, value=self.gitpy_install_path_env_var_value){W}')
-
-                    ## The environment variable is used to know where GitPy is installed
-                    set_env_var(var_name=self.gitpy_install_path_env_var_name, var_value=self.gitpy_install_path_env_var_value)
-
-                    # if Configuration.verbose == 3:
-                    #     Color.pl('  {§} Create the {C}{bold}%s{W} environment variable...' % self.gitpy_path_notification_config_file_env_var_name)
-                    #     Color.pl('  {§} Call the {P}set_env_var(){W} function.')
-                    #     Color.pl('   {SY1}╰──╼{W} Python: {SY1}set_env_var(name=self.gitpy_path_notification_config_file_env_var_name, value=self.gitpy_path_notification_config_file_env_var_value){W}')
+                    if args.skip_update:
+                        Color.pl('  {*} System update skiped.')
 
-                    # ## The environment variable is used to know where the News Version Notification config file is
-                    # set_env_var(var_name=self.gitpy_path_notification_config_file_env_var_name, var_value=self.gitpy_path_notification_config_file_env_var_value)
+                    Step_Engine(self.installation_steps(args)).run()
                     
                     # -------------------- [ FINISH ] -------------------- #
                     Color.pl('  {+} GitPy are successfully installed on your system.')
@@ -497,25 +433,28 @@ class Installer():
                     reboot = input(Color.s('  {?} Do you want to reboot your machine now? [y/N]: '))
 
                     if reboot.lower() == 'y':
-                        # Removing the python cache
-                        remove_python_cache(pwd=pwd)
                         Color.pl('  {-} Rebooting the machine...')
                         Process.call('reboot', shell=True)
 
                     else:
                         Color.pl('  {*} Now you can run the command {G}gitpy{W} anywhere in the terminal.')
-                        # Exit and removing the python cache
+                        # Exit
                         exit_tool(0,pwd=self.pwd)
 
+                except Exception as E:
+                    Color.pexception(E)
+                    # Exit
+                    exit_tool(1,pwd=self.pwd)
+
                 except KeyboardInterrupt:
                     Color.pl('\n  {!} Installation process interrupted.')
                     Color.pl('  {*} You must re-run the installation process to install GitPy correctly.')
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=self.pwd)
 
             else:
                 Color.pl('  {*} Aborted')
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=self.pwd)
 
 def entry_point(args, pwd):
@@ -524,10 +463,10 @@ def entry_point(args, pwd):
 
     except EOFError:
         Color.pl('\n  {*} Aborted')
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1,pwd=pwd)
         
     except KeyboardInterrupt:
         Color.pl('\n  {*} Aborted')
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1,pwd=pwd)
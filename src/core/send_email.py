@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ send_email.py             [Created: 2023-03-31 | 10:49 - AM]  #
-#                                       [Updated: 2023-04-10 | 15:30 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Send a email of the new Repo's version  via SMTP server                  #
 #  Language ~ Python3                                                       #
@@ -33,17 +33,38 @@
 
 # Imports section
 import os
-import requests
-import smtplib
-import configparser
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 
 ## Third party libraries
+from src.config import Configuration
+from src.util.github_client import GitHub_Client
+from src.util.rate_limiter import Rate_Limit_Exceeded
+from src.util.retry_policy import Circuit_Open
+from src.util.check_engine import Check_Engine
+from src.util.subscription_store import Subscription_Store
+from src.util.mail_dispatcher import Mail_Dispatcher
 from src.util.colors import Color
 
 # Functions section
-def check_for_new_commit(repo_owner, repo_name, current_sha):
+def get_latest_commit_sha(repo_owner, repo_name, repo_branch=None):
+    '''
+    Get the SHA hash of the latest commit of a branch of a GitHub repository using the GitHub API.
+
+    Parameters:
+        repo_owner (str): The username or organization that owns the repository.
+        repo_name (str): The name of the repository.
+        repo_branch (str): The branch (None for the default branch).
+
+    Returns:
+        str: The SHA hash of the latest commit (None if the repository or the branch doesn't exist).
+    '''
+
+    # Only the SHA of the head of the branch is downloaded (40 bytes), not the commits
+    return GitHub_Client.shared().head_sha(repo_owner, repo_name, repo_branch)
+
+def check_for_new_commit(repo_owner, repo_name, current_sha, repo_branch=None):
     '''
     Check whether a GitHub repository has a new commit using the GitHub API.
 
@@ -51,87 +72,260 @@ def check_for_new_commit(repo_owner, repo_name, current_sha):
         repo_owner (str): The username or organization that owns the repository.
         repo_name (str): The name of the repository.
         current_sha (str): The SHA hash of the current commit to compare against.
+        repo_branch (str): The branch (None for the default branch).
 
     Returns:
         bool: True if there is a new commit, False otherwise.
     '''
 
-    # Build the URL for the API call
-    url = 'https://api.github.com/repos/%s/%s/commits' % (repo_owner, repo_name)
+    # Compare the latest SHA hash to the current one
+    return get_latest_commit_sha(repo_owner, repo_name, repo_branch) != current_sha
+
+def check_batches(subscriptions):
+    '''
+    Group the subscriptions in the jobs of the check engine: one repository per
+    job with the REST API or, with the GraphQL backend, one batch of
+    repositories (checked with one query) per job.
 
-    # Send a GET request to the API with the appropriate headers
-    headers = {'Accept': 'application/vnd.github.v3+json'}
-    response = requests.get(url, headers=headers)
+    Parameters:
+        subscriptions (list): The subscriptions (see Subscription_Store).
 
-    # Check the response status code
-    if response.status_code != 200:
-        raise Exception(f'Request failed with status code {response.status_code}')
+    Returns:
+        list: The jobs, lists of subscriptions.
+    '''
 
-    # Parse the JSON response and get the SHA hash of the latest commit
-    latest_sha = response.json()[0]['sha']
+    size = Configuration.GRAPHQL_BATCH_SIZE if Configuration.GRAPHQL_ENABLED else 1
 
-    # Compare the latest SHA hash to the current one
-    if latest_sha != current_sha:
-        return True
-    else:
-        return False
+    return [subscriptions[start:start + size] for start in range(0, len(subscriptions), size)]
 
-def send_email():
+def check_batch(batch):
+    '''
+    Get the SHA hash of the latest commit of the subscribed branches of a job (see check_batches).
+
+    Parameters:
+        batch (list): The subscriptions.
+
+    Returns:
+        list: The SHA hash of each subscription (None if the repository can't be found).
+    '''
+
+    if Configuration.GRAPHQL_ENABLED:
+        from src.util.github_graphql import GitHub_GraphQL
+        return GitHub_GraphQL().batch_heads([(subscription['owner'], subscription['name'], subscription['branch']) for subscription in batch])
+
+    return [get_latest_commit_sha(subscription['owner'], subscription['name'], subscription['branch']) for subscription in batch]
+
+def compare_url(repo_url, old_sha, new_sha):
+    '''
+    The GitHub page of the commits between two SHA hashes.
+
+    Parameters:
+        repo_url (str): The URL of the repository.
+        old_sha (str): The SHA hash of the last notified commit (None if unknown).
+        new_sha (str): The SHA hash of the latest commit.
+
+    Returns:
+        str: The URL of the comparison (or of the latest commit if the old one is unknown).
+    '''
+
+    if not old_sha:
+        return '%s/commit/%s' % (repo_url.rstrip('/'), new_sha)
+    return '%s/compare/%s...%s' % (repo_url.rstrip('/'), old_sha, new_sha)
+
+def digest_message(sender, receiver, updates):
+    '''
+    Build the digest email of a receiver: one summary of all the new commits of the run.
+
+    Parameters:
+        sender (str): The SMTP account sending the email.
+        receiver (str): The email address of the receiver.
+        updates (list): The updates (dict with 'repository', 'branch', 'url', 'old_sha' and 'new_sha').
+
+    Returns:
+        MIMEText: The email.
+    '''
+
+    lines = ['New commits are available on the repositories you follow:', '']
+    for update in updates:
+        lines.append('  %s%s' % (update['repository'], ' (%s)' % update['branch'] if update['branch'] else ''))
+        lines.append('    %s -> %s' % ((update['old_sha'] or '?')[:7], update['new_sha'][:7]))
+        lines.append('    %s' % compare_url(update['url'], update['old_sha'], update['new_sha']))
+        lines.append('')
+
+    message = MIMEText('\n'.join(lines), 'plain')
+    message['From'] = 'GitPy Notification <%s>' % sender
+    message['To'] = receiver
+    message['Subject'] = 'New versions of %d repositories' % len(updates) if len(updates) > 1 else 'New version of %s' % updates[0]['repository']
+    return message
+
+def queue_digests(dispatcher, store, digests):
+    '''
+    Queue the digest email of each receiver in the dispatcher.
+
+    Parameters:
+        dispatcher (Mail_Dispatcher): The dispatcher of the run.
+        store (Subscription_Store): The subscriptions.
+        digests (dict): The updates per receiver.
+    '''
+
+    for receiver, updates in digests.items():
+
+        # Sent with the SMTP account of the first subscription of the receiver
+        smtp_server, smtp_port, smtp_username, smtp_password = updates[0]['smtp']
+
+        # Not sent: all its commits are notified by the next run
+        def on_sent(message, receiver=receiver, updates=updates):
+            Color.pl('  {*} Digest of {G}%s{W} new version(s) successfully sent to {G}%s{W}!' % (len(updates), receiver))
+
+        def on_failed(message, error, receiver=receiver, updates=updates):
+            for update in updates:
+                store.release(update['previous'])
+            Color.pl('  {!} The digest to {G}%s{W} can\'t be sent: %s' % (receiver, error))
+
+        dispatcher.queue(smtp_server, smtp_port, smtp_username, smtp_password, digest_message(smtp_username, receiver, updates), on_sent, on_failed)
+
+def send_email(digest=False):
     '''
         Send a email via SMTP server
+
+        Only the subscriptions that are due are checked: each repository has
+        its own polling interval, learned from its commits (see
+        src/util/poll_scheduler.py). They are checked concurrently, started
+        from the most overdue one. When the rate limit of GitHub
+        is reached, the remaining subscriptions are deferred to the next run
+        instead of failing. The last seen commit of each subscription is saved
+        in the subscription store (see src/util/subscription_store.py), so a
+        commit is only notified once. The emails are sent at the end of the
+        run, one SMTP session per server and account (see
+        src/util/mail_dispatcher.py).
+
+        Arguments:
+            digest (bool): Send one email per receiver with all its new commits
+                           (see queue_digests) instead of one per repository
     '''
 
-    # Variables
-    INSTALL_PATH = os.environ['GITPY_INSTALL_PATH']
-    NOTIF_CONFIG_FILE_PATH = INSTALL_PATH + 'src/config/new_version_notification.conf'
-    config_file = NOTIF_CONFIG_FILE_PATH
-
-    # Create the configparser object
-    config = configparser.ConfigParser()
-    config.read(config_file)
-
-    # Get the sections
-    sections = config.sections()
-
-    # Get all sections
-    for section in sections:
-
-        # Initialise a SMTP connection
-        smtp_server = config.get(section, 'smtp_server')
-        smtp_port = config.get(section, 'smtp_port')
-        smtp_username = config.get(section, 'smtp_username')
-        # smtp_password_env_var_name = os.environ[config.get(section, 'smtp_password')]
-        # print(smtp_password_env_var_name)
-        smtp_password = os.environ[config.get(section, 'smtp_password')]
-        # print(smtp_password) # for debugging
-        receiver_email = config.get(section, 'receiver_email_address')
-        github_repo_name = config.get(section, 'github_repo_name')
-        github_repo_owner = config.get(section, 'github_repo_owner')
-        github_repo_url = config.get(section, 'github_repo_url')
-        current_commit_sha = config.get(section, 'current_commit_sha')
-
-        # Check if the subsripted repo (in the section name) have a new version (if the repo got a new commit) using the GitHub API
-        if check_for_new_commit(github_repo_owner, github_repo_name, current_commit_sha) is True:
-
-            # Create the email message
-            message = MIMEMultipart()
-            message['From'] = 'GitPy Notification <%s>' % smtp_username
-            message['To'] = receiver_email
-            message['Subject'] = 'New version of %s' % github_repo_name
-
-
-            # Body of the email
-            body = 'A new version of %s is available on %s' % (github_repo_name, github_repo_url)
-            message.attach(MIMEText(body, 'plain'))
-
-            # Sending the emai via SMTP server
-            with smtplib.SMTP(smtp_server, smtp_port) as smtp:
-                smtp.starttls()
-                smtp.login(smtp_username, smtp_password)
-                smtp.send_message(message)
-
-            Color.pl('  {*} A vew version of {G}%s{W} are avalable!' % github_repo_name)
-            Color.pl('  {*} Email successfully sent to {G}%s{W}!' % receiver_email)
-        
+    # Get the subscriptions that are due, the most overdue first (never checked first)
+    store = Subscription_Store()
+    dispatcher = Mail_Dispatcher()
+    subscriptions = store.due()
+
+    if Configuration.verbose >= 1:
+        Color.pl('  {*} {G}%s{W} of {G}%s{W} subscription(s) due.' % (len(subscriptions), store.count()))
+
+    # Check all the subscriptions at the same time (see src/util/check_engine.py), the
+    # notifications are queued as soon as a check is done. When the rate limit of GitHub
+    # is reached (or when GitHub doesn't respond anymore), the subscriptions not checked
+    # yet are deferred to the next run.
+    deferred = []
+    digests = {} if digest else None
+
+    def on_result(batch, heads, error):
+        if error is None:
+            for subscription, latest_sha in zip(batch, heads):
+                notify(store, dispatcher, subscription, latest_sha, digests)
+
+        elif isinstance(error, (Rate_Limit_Exceeded, Circuit_Open)):
+            deferred.append((len(batch), error))
+
         else:
-            Color.pl('  {!} No new version of {G}%s{W} available!' % github_repo_name)
\ No newline at end of file
+            for subscription in batch:
+                Color.pl('  {!} The repository {G}%s{W} can\'t be checked: %s' % (subscription['key'], str(error) or 'timeout'))
+
+    # The new commits are saved as seen (claimed) before their email is sent: whatever
+    # happens, the queued emails are sent or their commits are released for the next run
+    try:
+        Check_Engine(check_batch, stop_on=(Rate_Limit_Exceeded, Circuit_Open)).run(check_batches(subscriptions), on_result)
+
+        if deferred:
+            error = deferred[0][1]
+            if isinstance(error, Rate_Limit_Exceeded):
+                Color.pl('  {!} The rate limit of the GitHub API is reached until {C}%s{W}.' % time.strftime('%H:%M:%S', time.localtime(error.reset)))
+            else:
+                Color.pl('  {!} GitHub ({C}%s{W}) is not responding.' % error.host)
+            Color.pl('  {*} {G}%s{W} subscription(s) deferred to the next run.' % sum(count for count, _ in deferred))
+
+    finally:
+        try:
+            if digests:
+                queue_digests(dispatcher, store, digests)
+            dispatcher.flush()
+        finally:
+            dispatcher.discard(RuntimeError('not sent, the run has been interrupted'))
+            store.close()
+
+    if Configuration.verbose >= 1:
+        GitHub_Client.shared().token_pool.report()
+
+def notify(store, dispatcher, subscription, latest_sha, digests=None):
+    '''
+        Queue the email of a subscription in the dispatcher if its repository
+        got a new commit (since the last notified one, or since the subscription)
+
+        In digest mode ('digests' is a dict), the new commit is only added to
+        the digest of the receiver (see queue_digests).
+    '''
+
+    # Initialise a SMTP connection
+    smtp_server = subscription['smtp_server']
+    smtp_port = subscription['smtp_port']
+    smtp_username = subscription['smtp_username']
+    receiver_email = subscription['receiver_email_address']
+    github_repo_name = subscription['name']
+    github_repo_url = subscription['url']
+
+    # The password is in an environment variable: without it, nothing is claimed (the
+    # commit stays new) and the subscription is checked again later
+    smtp_password = os.environ.get(subscription['smtp_password']) if subscription['smtp_password'] else None
+    if smtp_password is None:
+        Color.pl('  {!} The SMTP password of {G}%s{W} is missing (the {C}%s{W} environment variable).' % (subscription['key'], subscription['smtp_password']))
+        store.checked(subscription['key'])
+        return
+
+    # The subsripted repo have a new version if the repo got a new commit
+    if latest_sha is None:
+        Color.pl('  {!} The repository {G}%s{W} can\'t be reached.' % subscription['key'])
+        store.checked(subscription['key'])
+        return
+
+    # Another run may have notified this commit already
+    previous = store.claim(subscription['key'], latest_sha)
+
+    if previous is not None and digests is not None:
+        digests.setdefault(receiver_email, []).append({
+            'repository': '%s/%s' % (subscription['owner'], github_repo_name),
+            'branch': subscription['branch'],
+            'url': github_repo_url,
+            'old_sha': previous['last_seen_sha'] or previous['subscribed_sha'],
+            'new_sha': latest_sha,
+            'previous': previous,
+            'smtp': (smtp_server, smtp_port, smtp_username, smtp_password),
+        })
+        Color.pl('  {*} A vew version of {G}%s{W} are avalable!' % github_repo_name)
+
+    elif previous is not None:
+
+        # Create the email message
+        message = MIMEMultipart()
+        message['From'] = 'GitPy Notification <%s>' % smtp_username
+        message['To'] = receiver_email
+        message['Subject'] = subscription['email_subject'] or 'New version of %s' % github_repo_name
+
+
+        # Body of the email
+        body = subscription['email_message'] or 'A new version of %s is available on %s' % (github_repo_name, github_repo_url)
+        message.attach(MIMEText(body, 'plain'))
+
+        # Sent with the other emails of this SMTP account at the end of the run
+        # (not sent: the commit is notified by the next run)
+        def on_sent(message):
+            Color.pl('  {*} Email successfully sent to {G}%s{W}!' % receiver_email)
+
+        def on_failed(message, error):
+            store.release(previous)
+            Color.pl('  {!} The email to {G}%s{W} can\'t be sent: %s' % (receiver_email, error))
+
+        dispatcher.queue(smtp_server, smtp_port, smtp_username, smtp_password, message, on_sent, on_failed)
+        Color.pl('  {*} A vew version of {G}%s{W} are avalable!' % github_repo_name)
+
+    else:
+        Color.pl('  {!} No new version of {G}%s{W} available!' % github_repo_name)
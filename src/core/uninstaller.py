@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ uninstaller.py            [Created: 2023-03-14 | 10:25 - AM]  #
-#                                       [Updated: 2023-04-10 | 14:55 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Uninstall GitPy from your system                                         #
 #  Language ~ Python3                                                       #
@@ -46,7 +46,6 @@ from src.util.colors import Color
 from src.util.exit_tool import exit_tool
 from src.util.env_var import remove_env_var
 from src.util.process import Process
-from src.util.remove_python_cache import remove_python_cache
 from src.util.based_distro import Based_Distro
 
 # Main
@@ -91,7 +90,7 @@ class Uninstaller():
             Color.pl('  {!} You tried to run GitPy on a non-linux machine!')
             Color.pl('  {*} GitPy can be run only on a Linux kernel.')
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1,pwd=pwd)
 
         else:
@@ -103,7 +102,7 @@ class Uninstaller():
                 Color.pl('  {!} The GitPy Uninstaller must be run as root.')
                 Color.pl('  {*} Re-run with sudo or switch to root user.')
 
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
             else:
@@ -120,7 +119,7 @@ class Uninstaller():
                     Color.pl('  {!} You\'re not running Arch or Debian variant.')
                     Color.pl('  {*} GitPy can only run on Arch or Debian based distros.')
                     
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=pwd)
 
         if args.quiet: # -------------------- [ Quiet uninstallation ] -------------------- #
@@ -133,7 +132,7 @@ class Uninstaller():
             except KeyError:
                 Color.pl('GitPy is not installed on this machine.')
                 Color.pl('Because the {C}{bold}%s{W} environment variable is not set.' % self.gitpy_install_path_env_var_name)
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
             # Remove the main folder
@@ -148,7 +147,7 @@ class Uninstaller():
             # Remove the GITPY_NOTIFICATION_CONFIG_FILE_PATH environment variable 
             # remove_env_var(var_name=self.gitpy_notification_config_file_env_var_name)
 
-            # Exit and removing the python cache
+            # Exit
             exit_tool(0,pwd=pwd)
 
         else: # -------------------- [ No quiet uninstallation ] -------------------- #
@@ -177,7 +176,7 @@ class Uninstaller():
             except KeyError:
                 Color.pl('\n  {!} GitPy is not installed on this machine.')
                 Color.pl('  {*} Because the {C}{bold}%s{W} environment variable is not set.' % self.gitpy_install_path_env_var_name)
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
             # Inform the user what the uninstaller will do
@@ -229,23 +228,21 @@ class Uninstaller():
                     )
                     choice_2 = input(Color.s('  {?} Do you want to reboot your machine now? [y/n]: '))
                     if choice_2.lower() == 'y':
-                        # Removing the python cache
-                        remove_python_cache(pwd=pwd)
                         Color.pl('  {-} Rebooting the machine...')
                         Process.call('reboot', shell=True)
                     else:
-                        # Exit and removing the python cache
+                        # Exit
                         exit_tool(0,pwd=pwd)
 
                 except KeyboardInterrupt:
                     Color.pl('\n  {!} Uninstallation process interrupted.')
                     Color.pl('  {*} You must re-run the uninstalation process to uninstall GitPy correctly.')
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=pwd)
 
             else:
                 Color.pl('  {*} Aborted')
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
 def entry_point(args, pwd):
@@ -254,10 +251,10 @@ def entry_point(args, pwd):
 
     except EOFError:
         Color.pl('\n  {*} Aborted')
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1,pwd=pwd)
 
     except KeyboardInterrupt:
         Color.pl('\n  {*} Aborted')
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1,pwd=pwd)
@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ updater.py                [Created: 2023-03-21 |  8:32 - AM]  #
-#                                       [Updated: 2023-04-10 | 15:58 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The updater of GitPy for download and install the latest                 #
 #  version of GitPy from the GitHub repository.                             #
@@ -39,21 +39,23 @@ import shutil
 import platform
 import subprocess
 from json import loads
-from time import sleep
 
 ## Third party libraries
 from src.config import Configuration
 from src.__main__ import GitPy
 from src.tools.packaging import version
-from src.tools.requests import get
 from src.util.clear import clear
 from src.util.colors import Color
 from src.util.process import Process
 from src.util.github_repo import GitHub_Repo
+from src.util.github_client import GitHub_Client
+from src.util.rate_limiter import Rate_Limit_Exceeded
 from src.util.exit_tool import exit_tool
 from src.util.internet_check import internet_check
 from src.util.based_distro import Based_Distro
 from src.util.create_bin_file import Create_bin_file
+from src.util.bytecode_cache import compile_bytecode_cache
+from src.util.step_engine import Step, Step_Engine
 
 # Main
 class Updater():
@@ -82,8 +84,109 @@ class Updater():
 
     # cp_online_ver = None
 
+    # -------------------- [ Update steps ] -------------------- #
+    def prepare_temp_folder(self):
+        # Remove the temporary directory if it already exists
+        if os.path.isdir(self.TEMP_PATH):
+            if Configuration.verbose == 3:
+                Color.pl('  {§} GitPy\'s temporary folder detected.')
+                Color.pl('  {§} Remove it...')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.TEMP_PATH){W}')
+            shutil.rmtree(self.TEMP_PATH)
+
+        # Create the temp folder that be use to download the latest GitPy version from GitHub
+        # in it and install GitPy from this folder
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Creating temporary folder ({C}%s{W})...' % self.TEMP_PATH)
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.TEMP_PATH, mode=0o777){W}')
+        os.makedirs(self.TEMP_PATH, mode=0o777)
+
+    def clone_repo(self):
+        # Clone the latest version of GitPy into the temp. folder
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Cloning files from GitHub to the temporary directory...')
+        Process.call('git clone %s --branch %s %s' % (self.REPO_CLONE_URL , self.REPO_BRANCH , self.TEMP_PATH), shell=True)
+
+        # Process.call() doesn't raise on failure, so stop the flow here if nothing was cloned
+        if not os.path.isfile(self.TEMP_PATH + 'gitpy.py'):
+            raise RuntimeError('Unable to clone GitPy from %s' % self.REPO_CLONE_URL)
+
+    def remove_old_bin_file(self):
+        # If a file called 'gitpy' already exist in /usr/bin/, inform the user and delete it
+        if os.path.isfile(self.BIN_PATH + 'gitpy'):
+            if Configuration.verbose == 3:
+                Color.pl('  {§} The gitpy command already exist in {C}%s{W}' % self.BIN_PATH)
+                Color.pl('  {§} Remove it...')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + \'gitpy\'){W})')
+            os.remove(self.BIN_PATH + 'gitpy')
+
+    def replace_install(self):
+        # Remove the current GitPy instance (only once the new one is downloaded)
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Deleting current GitPy instance...')
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}' % self.INSTALL_PATH)
+        shutil.rmtree(self.INSTALL_PATH)
+
+        # Create the main folder where GitPy will be installed
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Creating main folder ({C}%s{W})...' % self.INSTALL_PATH)
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.INSTALL_PATH, mode=0o777){W}')
+        os.makedirs(self.INSTALL_PATH, mode=0o777)
+
+        # Install GitPy by moving all the files from the temp. folder to the main folder
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Copying all files from the GitPy\'s temporary folder to the main directory ({C}%s{W})...' % self.INSTALL_PATH)
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.copytree(src=self.TEMP_PATH, dst=INSTALL_PATH, dirs_exist_ok=True){W}')
+        shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
+
+    def compile_cache(self):
+        # Compile the bytecode cache of the new GitPy instance
+        if Configuration.verbose == 3:
+            Color.pl('   {SY1}╰──╼{W} Python: {SY1}compile_bytecode_cache(path=self.INSTALL_PATH){W}')
+
+        for failed_file in compile_bytecode_cache(path=self.INSTALL_PATH):
+            if not self.quiet:
+                Color.pl('  {$} Cannot compile {C}%s{W}, it will be compiled at runtime.' % failed_file)
+
+    def create_bin_file(self):
+        # Update the command 'gitpy' in /usr/bin/
+        with open(self.BIN_PATH + 'gitpy', 'x') as gitpy_file:
+            gitpy_file.write(self.gitpy_command_bin)
+
+    def apply_permissions(self):
+        Process.call('chmod 777 %sgitpy' % self.BIN_PATH, shell=True)
+        Process.call('chmod 777 -R %s' % self.INSTALL_PATH, shell=True)
+
+    def remove_temp_folder(self):
+        # Deleting the temporary directory
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Remove the temporary directory ({C}%s{W})...' % self.TEMP_PATH)
+        shutil.rmtree(self.TEMP_PATH)
+
+    def update_steps(self):
+        '''
+            The steps of the update and their dependencies.
+            The current instance and its command are only removed once the new
+            one is cloned.
+        '''
+        return [
+            Step('prepare_temp_folder', self.prepare_temp_folder),
+            Step('clone', self.clone_repo, requires=['prepare_temp_folder'],
+                 message='Downloading the latest GitPy\'s version into {C}%s{W}' % self.TEMP_PATH),
+            Step('remove_old_bin_file', self.remove_old_bin_file, requires=['clone']),
+            Step('replace_install', self.replace_install, requires=['clone'],
+                 message='Updating GitPy into {C}%s{W}' % self.INSTALL_PATH),
+            Step('bin_file', self.create_bin_file, requires=['remove_old_bin_file'],
+                 message='Updating the {G}gitpy{W} command into {C}%s{W}' % self.BIN_PATH),
+            Step('compile_cache', self.compile_cache, requires=['replace_install'], message='Compiling the GitPy\'s bytecode cache'),
+            Step('permissions', self.apply_permissions, requires=['compile_cache', 'bin_file'], message='Apply rights to the new files'),
+            Step('remove_temp_folder', self.remove_temp_folder, requires=['replace_install']),
+        ]
+
     # Main
     def __init__(self, args, pwd):
+        self.quiet = args.quiet
+
         # Check if the user's platform is a Linux machine or not
         if platform.system() != 'Linux':
             Color.pl(GitPy.Banner())
@@ -91,7 +194,7 @@ class Updater():
             Color.pl('  {!} You tried to run GitPy on a non-linux machine!')
             Color.pl('  {*} GitPy can be run only on a Linux kernel.')
             
-            # Exit and removing the python cache
+            # Exit
             exit_tool(1,pwd=pwd)
 
         else:
@@ -102,29 +205,27 @@ class Updater():
                 Color.pl('  {!} The GitPy Updater must be run as root.')
                 Color.pl('  {*} Re-run with sudo or switch to root user.')
 
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
             else:
                 # Distro check
                 if Based_Distro() == 'Arch':
                     based_distro = 'Arch'
-                    pass
 
                 elif Based_Distro() == 'Debian':
                     based_distro = 'Debian'
-                    pass
 
                 else:
                     Color.pl(GitPy.Banner())
                     print()
                     Color.pl('  {!} You\'re not running Arch or Debian variant.')
                     Color.pl('  {*} GitPy can only run on Arch or Debian based distros.')
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=pwd)
 
             # gitpy main file in /usr/bin/
-            gitpy_command_bin = Create_bin_file.__init__(path=self.INSTALL_PATH)
+            self.gitpy_command_bin = Create_bin_file.__init__(path=self.INSTALL_PATH)
 
         if args.quiet:
             # -------------------- [ Quiet update ] -------------------- #
@@ -156,14 +257,14 @@ class Updater():
                 if internet_check() == False:
                     Color.pl('Internet status: {R}Not connected{W}.')
                     Color.pl('No Internet connexion found, please check if you are connected to the Internet and retry.')
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=pwd)
 
                 ## Check if the GitPy repositorie on GitHub are reachable or not
                 GitHub_Repo.is_reachable(args)
 
                 ## Check if the GitPy version is up to date or not
-                rqst = get('%s' % self.REPO_METADATA_URL, timeout=5)
+                rqst = GitHub_Client.shared().get(self.REPO_METADATA_URL, timeout=5)
                 fetch_sc = rqst.status_code
 
                 if fetch_sc == 200:
@@ -176,63 +277,25 @@ class Updater():
 
                     else:
                         Color.pl('  {!} You already have the latest version of GitPy!')
-                        # Exit and removing the python cache
+                        # Exit
                         exit_tool(1,pwd=pwd)
 
-                sleep(0.5)
-
-                # Prepare the update
-
-                # If a file called 'gitpy' already exist in /usr/bin/, inform the user and delete it
-                if os.path.isfile(self.BIN_PATH + 'gitpy'):
-                    os.remove(self.BIN_PATH + 'gitpy')
-
-                # Remove the temporary directory if it already exists
-                if os.path.isdir(self.TEMP_PATH):
-                    shutil.rmtree(self.TEMP_PATH)
-
-                # Create the temp folder that be use to download the latest GitPy version from GitHub
-                # in it and install GitPy from this folder
-                os.makedirs(self.TEMP_PATH, mode=0o777)
-
-                # Remove the current GitPy instance
-                shutil.rmtree(self.INSTALL_PATH)
-
-                # Create the main folder where GitPy will be installed
-                os.makedirs(self.INSTALL_PATH, mode=0o777)
+                Step_Engine(self.update_steps(), quiet=True).run()
 
-                # Clone the latest version of GitPy into the temp. folder
-                Process.call('git clone %s --branch %s %s' % (self.REPO_CLONE_URL , self.REPO_BRANCH , self.TEMP_PATH), shell=True)
-                sleep(1)
-
-                # GitPy Update
-                # Install GitPy by moving all the files from the temp. folder to the main folder
-                shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-
-                # Update the command 'gitpy' in /usr/bin/
-                with open(self.BIN_PATH + 'gitpy', 'x') as gitpy_file:
-                    gitpy_file.write(gitpy_command_bin)
-
-                # Apply rights on files
-                sleep(1)
-
-                Process.call('chmod 777 %sgitpy' % self.BIN_PATH, shell=True)
-                Process.call('chmod 777 -R %s' % self.INSTALL_PATH, shell=True)
-
-                # Deleting the temporary directory
-                shutil.rmtree(self.TEMP_PATH)
-                sleep(1)
-
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(0,pwd=pwd)
 
+            except Rate_Limit_Exceeded as E:
+                Color.pl('%s, retry later.' % E)
+                # Exit
+                exit_tool(1,pwd=pwd)
             except Exception as E:
                 Color.pexception(E)
                 # Color.pl(f'Exception : %s' % str(E) )
             except KeyboardInterrupt:
                 Color.pl('\nUpdate process interrupted.')
                 Color.pl('You must re-run the update process to update GitPy correctly.')
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
         else:
             # -------------------- [ No quiet installation ] -------------------- #
@@ -278,14 +341,14 @@ class Updater():
             Color.pl('  {-} Checking for internet connexion...')
             if Configuration.verbose == 3:
                 Color.pl('  {§} Call the {P}internet_check(){W} function.')
-                Color.pl('   {SY1}╰──╼{W} Python: {SY1}request.urlopen(host, timeout=10){W}')
+                Color.pl('   {SY1}╰──╼{W} Python: {SY1}internet_check(){W} (TCP probe of {C}%s{W})' % ', '.join(Configuration.CONNECTIVITY_HOSTS))
             if internet_check() == True:
                 Color.pl('  {+} Internet status: {G}Connected{W}.')
                 pass
             else:
                 Color.pl('  {+} Internet status: {R}Not connected{W}.')
                 Color.pl('  {!} No Internet connexion found, please check if you are connected to the Internet and retry.')
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
             ## ---------- [ Check if the GitPy repositorie on GitHub are reachable or not ] ---------- ##
@@ -308,7 +371,7 @@ class Updater():
             if choice_1 == 'y' or choice_1 == 'Y' or not choice_1:
                 try:
                     Color.pl('  {-} Fetching metadata...')
-                    rqst = get('%s' % self.REPO_METADATA_URL, timeout=5)
+                    rqst = GitHub_Client.shared().get(self.REPO_METADATA_URL, timeout=5)
                     fetch_sc = rqst.status_code
                     if fetch_sc == 200:
                         metadata = rqst.text
@@ -319,91 +382,28 @@ class Updater():
                                 Color.pl('  {*} A new update are avalable : %s (current: %s)' % (cp_online_ver, self.VERSION))
                             else:
                                 Color.pl('  {!} You already have the latest version of GitPy!')
-                                # Exit and removing the python cache
+                                # Exit
                                 exit_tool(1,pwd=pwd)
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Python: {SY1}sleep(0.5){W}')
-                    sleep(0.5)
-
-                    # ---------- [ Prepare the update ] ---------- #
-                    # If a file called 'gitpy' already exist in /usr/bin/, inform the user and delete it
-                    if os.path.isfile(self.BIN_PATH + 'gitpy'):
-                        if Configuration.verbose == 3:
-                            Color.pl('  {§} The gitpy command already exist in {C}%s{W}' % self.BIN_PATH)
-                            Color.pl('  {§} Remove it...')
-                            Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.remove(self.BIN_PATH + \'gitpy\'){W})')
-                        os.remove(self.BIN_PATH + 'gitpy')
-                    # Remove the temporary directory if it already exists
-                    if os.path.isdir(self.TEMP_PATH):
-                        if args.verbose == 3:
-                            Color.pl('  {§} GitPy\'s temporary folder detected.')
-                            Color.pl('  {§} Remove it...')
-                            Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(self.TEMP_PATH){W}')
-                        shutil.rmtree(self.TEMP_PATH)
-                    # Create the temp folder that be use to download the latest GitPy version from GitHub
-                    # in it and install GitPy from this folder
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Creating temporary folder ({C}%s{W})...' % self.TEMP_PATH)
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.TEMP_PATH, mode=0o777){W}')
-                    os.makedirs(self.TEMP_PATH, mode=0o777)
-                    # Remove the current GitPy instance
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Deleting current GitPy instance...')
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(%s){W}' % self.INSTALL_PATH)
-                    shutil.rmtree(self.INSTALL_PATH)
-                    # Create the main folder where GitPy will be installed
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Creating main folder ({C}%s{W})...' % self.INSTALL_PATH)
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}os.makedirs(self.INSTALL_PATH, mode=0o777){W}')
-                    os.makedirs(self.INSTALL_PATH, mode=0o777)
-                    # Clone the latest version of GitPy into the temp. folder
-                    Color.pl('  {-} Downloading the latest GitPy\'s version into {C}%s{W}...' % self.TEMP_PATH)
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Cloning files from GitHub to the temporary directory...')
-                    Process.call('git clone %s --branch %s %s' % (self.REPO_CLONE_URL , self.REPO_BRANCH , self.TEMP_PATH), shell=True)
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Python: {SY1}sleep(1){W}')
-                    sleep(1)
-
-                    #  ---------- [ GitPy Update ] ---------- #
-                    Color.pl('  {-} Updating GitPy into {C}%s{W}...' % self.INSTALL_PATH)
-                    # Install GitPy by moving all the files from the temp. folder to the main folder
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Copying all files from the GitPy\'s temporary folder to the main directory ({C}%s{W})...' % self.INSTALL_PATH)
-                        Color.pl('   {SY1}╰──╼{W} Python: {SY1}shutil.copytree(src=self.TEMP_PATH, dst=INSTALL_PATH, dirs_exist_ok=True){W}')
-                    shutil.copytree(src=self.TEMP_PATH, dst=self.INSTALL_PATH, dirs_exist_ok=True)
-                    # Update the command 'gitpy' in /usr/bin/
-                    Color.pl('  {-} Updating the {G}gitpy{W} command into {C}%s{W}...' % self.BIN_PATH)
-                    with open(self.BIN_PATH + 'gitpy', 'x') as gitpy_file:
-                        gitpy_file.write(gitpy_command_bin)
-                    # Apply rights on files
-                    Color.pl('  {-} Apply rights to the new files...')
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Python: {SY1}sleep(1){W}')
-                    sleep(1)
-                    Process.call('chmod 777 %sgitpy' % self.BIN_PATH, shell=True)
-                    Process.call('chmod 777 -R %s' % self.INSTALL_PATH, shell=True)
-                    # Deleting the temporary directory
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Remove the temporary directory ({C}%s{W})...' % self.TEMP_PATH)
-                    shutil.rmtree(self.TEMP_PATH)
-                    if Configuration.verbose == 3:
-                        Color.pl('  {§} Python: {SY1}sleep(1){W}')
-                    sleep(1)
+                    Step_Engine(self.update_steps()).run()
+
                     Color.pl('  {*} GitPy successfully updated with the version: %s' % cp_online_ver)
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(0,pwd=pwd)
+                except Rate_Limit_Exceeded as E:
+                    Color.pl('  {!} %s, retry later.' % E)
+                    # Exit
+                    exit_tool(1,pwd=pwd)
                 except Exception as E:
                     Color.pexception(E)
                     # Color.pl(f'Exception : %s' % str(E) )
                 except KeyboardInterrupt:
                     Color.pl('\n  {!} Update process interrupted.')
                     Color.pl('  {!} You must re-run the update process to update GitPy correctly.')
-                    # Exit and removing the python cache
+                    # Exit
                     exit_tool(1,pwd=pwd)
             else:
                 Color.pl('  {*} Aborted')
-                # Exit and removing the python cache
+                # Exit
                 exit_tool(1,pwd=pwd)
 
 def entry_point(args, pwd):
@@ -411,10 +411,10 @@ def entry_point(args, pwd):
         Updater(args=args, pwd=pwd)
     except EOFError:
         Color.pl('\n  {*} Aborted')
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1,pwd=pwd)
     except KeyboardInterrupt:
         Color.pl('\n  {*} Aborted')
-        # Exit and removing the python cache
+        # Exit
         exit_tool(1,pwd=pwd)
 
@@ -261,38 +261,61 @@ _xterm_colors = {
 }
 
 
+# Reverse index: hex color -> xterm color, favoring lower numbers
+# (e.g. find 10 instead of 46 for #00FF00)
+_hex_to_xterm = {h: k for k, h in reversed(list(_xterm_colors.items()))}
+
+# Levels of each channel in the 6x6x6 color cube (16-231)
+_cube_levels = (0x00, 0x5f, 0x87, 0xaf, 0xd7, 0xff)
+
+# The system colors (0-15) don't follow any formula, they are checked one by one
+_system_colors = [(int(k), int(h[1:3], 16), int(h[3:5], 16), int(h[5:7], 16))
+                  for k, h in _xterm_colors.items() if int(k) < 16]
+
+
+def _nearest_cube_index(value):
+    # Lowest level with the smallest distance to the value
+    return min(range(6), key=lambda i: (abs(_cube_levels[i] - value), i))
+
+
 def HEX(color):
 
     # Extend shorthand #ABC -> #AABBCC, like in CSS
     if len(color) == 4:
         color = '#'+color[1]*2+color[2]*2+color[3]*2
 
-    # Try an exact lookup, trying to favor lower numbers
-    # (e.g. find 10 instead of 46 for #00FF00)
-    for xterm_color, hexcolor in _xterm_colors.items():
-        if hexcolor == color:
-            return xterm_color
+    # Try an exact lookup
+    xterm_color = _hex_to_xterm.get(color)
+    if xterm_color is not None:
+        return xterm_color
 
     # Try to find nearest match using a simple least squares fit.
     # We could try to factor in human perception bias by weighting
     # as suggested by <https://stackoverflow.com/a/1847112> but for
     # now lets just KISS and make upp our minds later, no?
     # (we do skip the sqrt since we just care for the relative value)
+    #
+    # Instead of scanning the 256 colors, only the best candidate of
+    # each part of the palette is compared: the system colors (0-15),
+    # the nearest point of the color cube (16-231, the distance is
+    # separable so each channel is rounded on its own) and the nearest
+    # step of the grayscale ramp (232-255, around the mean of r, g, b).
+    # Ties still go to the lowest number, like the full scan did.
 
     # The reference color
     r, g, b = (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
 
-    cube = lambda x: x * x
+    distance = lambda cr, cg, cb: (cr - r) ** 2 + (cg - g) ** 2 + (cb - b) ** 2
 
-    f = lambda hex_val, ref : cube(int(hex_val, 16) - ref)
+    candidates = [(distance(cr, cg, cb), k) for k, cr, cg, cb in _system_colors]
 
-    min_cube_d = cube(0xFFFFFF)
-    nearest = '15'
+    ir, ig, ib = _nearest_cube_index(r), _nearest_cube_index(g), _nearest_cube_index(b)
+    candidates.append((distance(_cube_levels[ir], _cube_levels[ig], _cube_levels[ib]), 16 + 36 * ir + 6 * ig + ib))
 
-    for k, h in _xterm_colors.items():
-        cube_d = f(h[1:3], r) + f(h[3:5], g) + f(h[5:7], b)
-        if cube_d < min_cube_d:
-            min_cube_d = cube_d
-            nearest = k
+    # Grayscale levels: 8 + 10 * i, try both steps around the mean
+    step = min(max((r + g + b) / 3 - 8, 0) // 10, 23)
+    for i in {int(step), min(int(step) + 1, 23)}:
+        level = 8 + 10 * i
+        candidates.append((distance(level, level, level), 232 + i))
 
-    return nearest
+    return str(min(candidates)[1])
@@ -3,7 +3,7 @@
 
 #---[Metadata]--------------------------------------------------------------#
 #  Filename ~ add_cron_job.py           [Created: 2023-04-05 | 11:12 - AM]  #
-#                                       [Updated: 2023-04-05 | 11:43 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Check if the folder_path finish with 'gitpy/'.                           # 
 #  Exemple: if the user enter '/home' for the install path, it will add     #
@@ -37,14 +37,23 @@
 import sys
 from crontab import CronTab
 
+## Third party libraries
+from src.config import Configuration
+
 # Functions section
 def add_cron_job():
     # Create an instance of CronTab for the current user
     cron = CronTab(user=True)
 
-    # Create a new CronTab task that runs at 7pm every day
-    job = cron.new(command='gitpy --check-repo')
-    job.setall('0 19 * * *')
+    # Only one CronTab task: the one of a previous subscription is reused (and
+    # moved from the old daily schedule)
+    jobs = list(cron.find_command('gitpy --check-repo'))
+    job = jobs[0] if jobs else cron.new(command='gitpy --check-repo')
+    for duplicate in jobs[1:]:
+        cron.remove(duplicate)
+
+    # Run often: each run only checks the subscriptions that are due (see src/util/poll_scheduler.py)
+    job.setall(Configuration.CHECK_CRON_SCHEDULE)
 
     # Activate the CronTab task
     job.enable()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ bytecode_cache.py         [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Compile, locate and purge the persistent bytecode cache of GitPy         #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import sys
+import shutil
+import py_compile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+## Third party libraries
+from src.config import Configuration
+
+# Functions section
+def bytecode_cache_path(path, versioned=True):
+    '''
+        Return the bytecode cache folder of a GitPy instance.
+
+        Arguments:
+            path (str): The GitPy's directory
+            versioned (bool): Return the folder of the running interpreter (ex: 'cpython-311')
+                              instead of the root of the cache
+    '''
+    cache_path = os.path.join(path, Configuration.BYTECODE_CACHE_PATH)
+
+    if versioned:
+        cache_path = os.path.join(cache_path, sys.implementation.cache_tag)
+
+    return cache_path
+
+def _list_sources(path):
+    '''
+        List all Python files of the 'src' folder of a GitPy instance
+    '''
+    sources = []
+    for root, dirs, files in os.walk(os.path.join(path, 'src')):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        sources += [os.path.join(root, f) for f in files if f.endswith('.py')]
+
+    return sources
+
+def _init_worker(cache_path):
+    '''
+        Point the bytecode of a compile worker into the cache folder
+    '''
+    sys.pycache_prefix = cache_path
+
+def _compile_source(source):
+    '''
+        Compile one Python file, return the file name if the compilation failed
+    '''
+    try:
+        py_compile.compile(source, doraise=True)
+    except py_compile.PyCompileError:
+        return source
+
+def compile_bytecode_cache(path, workers=None):
+    '''
+        Compile all the Python files of a GitPy instance, in parallel, into
+        its bytecode cache. The cache of the running interpreter is rebuilt
+        from scratch so no stale bytecode stays in it.
+
+        Arguments:
+            path (str): The GitPy's directory
+            workers (int): The number of compile processes (default: one per CPU)
+
+        Returns:
+            list: The Python files that could not be compiled
+    '''
+    cache_path = bytecode_cache_path(path)
+
+    if os.path.isdir(cache_path):
+        shutil.rmtree(cache_path)
+
+    os.makedirs(cache_path, mode=0o777, exist_ok=True)
+
+    # This runs in a thread of the step engine, and forking a process with
+    # other running threads can deadlock the child: the workers are forked by
+    # a single threaded forkserver instead
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload([__name__])
+
+    with ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(cache_path,)
+    ) as executor:
+        failed = [source for source in executor.map(_compile_source, _list_sources(path), chunksize=8) if source]
+
+    return failed
+
+def remove_bytecode_cache(path):
+    '''
+        Remove the whole bytecode cache of a GitPy instance (all interpreters)
+
+        Returns:
+            bool: True if a cache was removed, False if there was no cache
+    '''
+    cache_path = bytecode_cache_path(path, versioned=False)
+
+    if os.path.isdir(cache_path):
+        shutil.rmtree(cache_path)
+        return True
+
+    return False
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ check_engine.py           [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Run many checks concurrently with asyncio (--check-repo)                 #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+## Third party libraries
+from src.config import Configuration
+
+# Main
+class Check_Engine():
+    '''
+        Run a check on many jobs concurrently with asyncio, with at most
+        'concurrency' checks at the same time. The jobs are started in their
+        order and each result is given to 'on_result' (in the calling thread)
+        as soon as its check is done, so the next step (like the notifications)
+        doesn't wait for all the checks.
+
+        The checks are blocking functions (the HTTP client is synchronous),
+        they run in a pool of threads. Each check has a timeout, counted from
+        the start of its thread. A thread can't be stopped: a timed out check
+        keeps its place until its thread really ends (its HTTP requests have
+        their own timeouts), so the next jobs never wait in the pool with
+        their timeout running. When a check raises one of the 'stop_on'
+        exceptions (like the rate limit of GitHub), the jobs not started yet
+        are cancelled: they get the same error, so the caller can defer them.
+
+        Arguments:
+            check (callable): Called with a job, returns its result
+            concurrency (int): The max number of checks at the same time (default: Configuration.CHECK_CONCURRENCY)
+            timeout (float): The max time of a check, in seconds (default: Configuration.CHECK_TIMEOUT)
+            stop_on (tuple): The exceptions that cancel the jobs not started yet
+    '''
+
+    def __init__(self, check, concurrency=None, timeout=None, stop_on=()):
+        self.check = check
+        self.concurrency = concurrency or Configuration.CHECK_CONCURRENCY
+        self.timeout = timeout or Configuration.CHECK_TIMEOUT
+        self.stop_on = stop_on
+        self.stopped = None
+
+    def run(self, jobs, on_result):
+        '''
+            Run the check on all the jobs
+
+            Arguments:
+                jobs (list): The jobs
+                on_result (callable): Called with (job, result, error) for each job.
+                                      'error' is None if the check succeeded, else the
+                                      exception (asyncio.TimeoutError after the timeout)
+        '''
+        self.stopped = None
+        asyncio.run(self._run(jobs, on_result))
+
+    async def _run(self, jobs, on_result):
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='gitpy-check')
+
+        threads = []
+
+        async def run_job(job):
+            await semaphore.acquire()
+
+            # Cancelled by a previous check
+            if self.stopped is not None:
+                semaphore.release()
+                return job, None, self.stopped
+
+            thread = loop.run_in_executor(executor, self.check, job)
+            threads.append(thread)
+
+            try:
+                # The shield keeps wait_for from cancelling the thread's future at the timeout
+                result = await asyncio.wait_for(asyncio.shield(thread), self.timeout)
+                return job, result, None
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as error:
+                if isinstance(error, self.stop_on) and self.stopped is None:
+                    self.stopped = error
+                return job, None, error
+
+            finally:
+                # The place is given back when the thread ends, not at the timeout
+                if thread.done():
+                    semaphore.release()
+                else:
+                    thread.add_done_callback(lambda _: semaphore.release())
+
+        tasks = [asyncio.ensure_future(run_job(job)) for job in jobs]
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                on_result(*await task)
+
+        finally:
+            # Interrupted (Ctrl+C, an error in on_result...): nothing else is started.
+            # A check already running in a thread ends with the timeouts of its requests.
+            for task in tasks + threads:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ clear.py                  [Created: 2023-02-21 |  8:35 - AM]  #
-#                                       [Updated: 2023-02-21 |  9:24 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  The terminal prompt clear function                                       #
 #  Language ~ Python3                                                       #
@@ -35,6 +35,9 @@
 import os
 import subprocess
 
+## Third party libraries
+from src.util.colors import Color
+
 # Main
 def clear():
     # For Windows OS (probably for a future version compatible with Windows)
@@ -45,5 +48,6 @@ def clear():
     else:
         command = 'clear'
 
-    # Execute the command via the subprocess module
+    # Execute the command via the subprocess module (after the buffered output)
+    Color.flush()
     subprocess.call(command, shell=True)
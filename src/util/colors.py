@@ -3,7 +3,7 @@
 
 # ---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ colors.py                  [Created: 2023-02-21 |  8:37 - AM]  #
-#                                        [Updated: 2023-02-21 | 10:25 - AM]  #
+#                                        [Updated: 2026-10-18 | 10:12 - AM]  #
 # ---[Info]------------------------------------------------------------------#
 #  All colors directly from the system                                       #
 #  Language ~ Python3                                                        #
@@ -33,10 +33,12 @@
 
 # Import section
 import os
+import re
 import sys
+from functools import lru_cache
 
 # Third party libraries
-from src. tools.colored.colored import fg, attr
+from src.util.output_sink import Output_Sink
 
 # Main
 class Color():
@@ -46,6 +48,19 @@ class Color():
 
     last_sameline_length = 0
 
+    # Where the text is written, the complete lines are buffered until Color.flush()
+    sink = Output_Sink()
+
+    # Color the output only in a terminal, and never if NO_COLOR is set (https://no-color.org)
+    enabled = 'NO_COLOR' not in os.environ and sys.stdout is not None and sys.stdout.isatty()
+
+    # A '{X}' markup tag, rendered in a single pass by Color.s()
+    markup = re.compile(r'\{([^{}\s]+)\}')
+
+    # Tag name -> rendered value, built from 'colors' and 'replacements' at the first use
+    # (one table with the colors and one, used to strip the markup, without them)
+    _tables = None
+
     # Basic colors
     colors = {
         'W'             : '\033[0m',       # white (like 'reset')
@@ -82,18 +97,19 @@ class Color():
         'italic'        : '\033[3m',
         'underscore'    : '\033[4m',
 
-        # Colored's PIP package color
+        # Colored's PIP package color, resolved once to their xterm-256 code
+        # (with src.tools.colored.hex.HEX) so nothing is computed at import
         # The 'S' is for 'Special'
-        'SG1'           : fg('#00FF80'),   # Green n°1
-        'SG2'           : fg('#00FF37'),   # Green n°2
-        'SY1'           : fg('#FFEB3B'),   # Yellow n°1
-        'SB1'           : fg('#2190B5'),   # Blue n°1
-        'SB2'           : fg('#1898CC'),   # Blue n°2
-        'SB3'           : fg('#00658E'),   # Darker Blue n°3
-        'SB4'           : fg('#1d9bf0'),   # Twitter's Blue n°4
-        'SGR1'          : fg('#777777'),   # Grey n°1
-        'SW1'           : fg('#FFFFFF'),   # White n°1 (real white)
-        'SW0'           : attr('reset')    # Reset
+        'SG1'           : '\033[38;5;48m',    # Green n°1 (#00FF80)
+        'SG2'           : '\033[38;5;47m',    # Green n°2 (#00FF37)
+        'SY1'           : '\033[38;5;221m',   # Yellow n°1 (#FFEB3B)
+        'SB1'           : '\033[38;5;31m',    # Blue n°1 (#2190B5)
+        'SB2'           : '\033[38;5;32m',    # Blue n°2 (#1898CC)
+        'SB3'           : '\033[38;5;24m',    # Darker Blue n°3 (#00658E)
+        'SB4'           : '\033[38;5;33m',    # Twitter's Blue n°4 (#1d9bf0)
+        'SGR1'          : '\033[38;5;243m',   # Grey n°1 (#777777)
+        'SW1'           : '\033[38;5;15m',    # White n°1 (real white) (#FFFFFF)
+        'SW0'           : '\033[0m'           # Reset
     }
 
     # Helper string replacements
@@ -115,8 +131,7 @@ class Color():
         '''
         Prints text using colored format on same line.
         '''
-        sys.stdout.write(Color.s(text))
-        sys.stdout.flush()
+        Color.sink.write(Color.s(text))
         if '\r' in text:
             text = text[text.rfind('\r')+1:]
             Color.last_sameline_length = len(text)
@@ -136,26 +151,62 @@ class Color():
         '''
         Prints text using colored format with leading and trailing new line to STDERR.
         '''
+        # Keep the order with the buffered STDOUT
+        Color.flush()
         sys.stderr.write(Color.s('%s\n' % text))
         Color.last_sameline_length = 0
 
+    @staticmethod
+    def flush():
+        '''
+        Flush the buffered output. Needed before a prompt that doesn't go
+        through input() (getpass), before a command that writes on the
+        terminal by itself and at the end of a step.
+        '''
+        Color.sink.flush()
+
     @staticmethod
     def s(text):
         '''
-        Returns colored string
+        Returns colored string (or the string without its markup if the colors are disabled)
         '''
-        output = text
+        if '{' not in text:
+            return text
+        return Color._render(text, Color.enabled)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _render(text, enabled):
+        '''
+        Render all the tags of a text in one pass. The result is cached,
+        most of the texts are static templates printed again and again.
+        '''
+        if Color._tables is None:
+            Color._tables = Color._compile_tables()
+
+        table = Color._tables[enabled]
+        return Color.markup.sub(lambda match: table.get(match.group(1), match.group(0)), text)
+
+    @staticmethod
+    def _compile_tables():
+        '''
+        Returns the tag tables: {False: stripped values, True: colored values}
+        '''
+        colored = dict(Color.colors)
+        stripped = dict.fromkeys(Color.colors, '')
+
+        # The helpers ('{+}', '{!}'...) are made of colors, render them once here
         for (key, value) in Color.replacements.items():
-            output = output.replace(key, value)
-        for (key, value) in Color.colors.items():
-            output = output.replace('{%s}' % key, value)
-        return output
+            colored[key[1:-1]] = Color.markup.sub(lambda match: colored.get(match.group(1), match.group(0)), value)
+            stripped[key[1:-1]] = Color.markup.sub(lambda match: stripped.get(match.group(1), match.group(0)), value)
+
+        return {True: colored, False: stripped}
 
     @staticmethod
     def clear_line():
         spaces = ' ' * Color.last_sameline_length
-        sys.stdout.write('\r%s\r' % spaces)
-        sys.stdout.flush()
+        Color.sink.write('\r%s\r' % spaces)
+        Color.flush()
         Color.last_sameline_length = 0
 
     @staticmethod
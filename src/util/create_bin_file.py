@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ create_bin_file.py        [Created: 2023-02-21 | 11:25 - AM]  #
-#                                       [Updated: 2023-02-21 | 11:39 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Create the content of the bin file (gitpy) with the correct install      #
 #  path                                                                     #
@@ -81,6 +81,17 @@ import sys
 # Import all files from the install path
 sys.path.insert(0, '%s')
 
+# Load the compiled bytecode from the persistent cache of GitPy instead of
+# recompiling everything (unless the user already set his own cache prefix)
+if sys.pycache_prefix is None:
+    sys.pycache_prefix = os.path.join('%s', 'cache', 'bytecode', sys.implementation.cache_tag)
+
+# If the GitPy daemon is running, let it run the command (see 'gitpy --daemon')
+from src.util.daemon_client import forward
+exit_code = forward(sys.argv[1:])
+if exit_code is not None:
+    sys.exit(exit_code)
+
 ## Third party libraries
 from src import __main__
 from src.util.colors import Color
@@ -96,6 +107,6 @@ try:
 
 except KeyboardInterrupt:
     Color.pl('\\n  {!} Interrupted, shutting down...')
-    exit_tool(1)''' % path
+    exit_tool(1)''' % (path, path)
 
 
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ daemon_client.py          [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Forward a gitpy command to the resident daemon (stdlib only)             #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import sys
+import json
+import socket
+import struct
+
+# This module is imported by the 'gitpy' command before anything else, so it
+# must only import the standard library (no src.config, no src.util.colors)
+
+# The cache directory and the socket of the daemon (same as Configuration.CACHE_PATH
+# and Configuration.DAEMON_SOCKET_FILE)
+CACHE_PATH = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'gitpy') + '/'
+SOCKET_PATH = CACHE_PATH + 'daemon.sock'
+
+# The options that always run in the gitpy process: they ask questions, need
+# root, replace the GitPy files or manage the daemon itself
+LOCAL_OPTIONS = [
+    '-i', '--install',
+    '--uninstall',
+    '--update',
+    '-fu', '--force-update',
+    '--console',
+    '--cli',
+    '-us', '--unsub',
+    '--remove-cache',
+    '--daemon',
+]
+
+# The environment variables read once, when GitPy starts (the Configuration, the
+# tokens of the shared GitHub client...): a command is only run by the daemon if
+# they are the same in the client, else it would use the daemon's ones
+DAEMON_ENVIRONMENT = [
+    'HOME',
+    'XDG_CACHE_HOME',
+    'GITHUB_TOKEN',
+    'GITPY_GITHUB_TOKENS',
+    'GITPY_NO_GRAPHQL',
+    'GITPY_NO_HTTP_CACHE',
+    'GITPY_SMTP_NO_STARTTLS',
+    'GITPY_GITHUB_URL',
+    'GITPY_GITHUB_API_URL',
+    'GITPY_GITHUB_GRAPHQL_URL',
+    'GITPY_REPO_METADATA_URL',
+]
+
+# Message types of the protocol, each message is: type (1 byte), length (4 bytes), payload
+HEADER = struct.Struct('!cI')
+REQUEST = b'R'      # client -> daemon: JSON request
+STDOUT = b'O'       # daemon -> client: output
+STDERR = b'E'       # daemon -> client: errors
+EXIT = b'X'         # daemon -> client: JSON exit code (null: run it locally), last message
+
+# Functions section
+def send_message(sock, kind, payload):
+    '''
+        Send a message (bytes payload) on the socket
+    '''
+    sock.sendall(HEADER.pack(kind, len(payload)) + payload)
+
+def _receive_exactly(sock, size):
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError('The connection was closed by the other side')
+        data += chunk
+    return data
+
+def receive_message(sock):
+    '''
+        Receive a message from the socket
+
+        Returns:
+            tuple: (kind, payload)
+    '''
+    kind, length = HEADER.unpack(_receive_exactly(sock, HEADER.size))
+    return kind, _receive_exactly(sock, length)
+
+def is_forwardable(argv):
+    '''
+        Check if a command line can be run by the daemon
+    '''
+    if not argv or os.environ.get('GITPY_NO_DAEMON'):
+        return False
+
+    return not any(argument.split('=')[0] in LOCAL_OPTIONS for argument in argv)
+
+def request(payload, timeout=None):
+    '''
+        Connect to the daemon and send it a request
+
+        Arguments:
+            payload (dict): The request
+            timeout (float): The timeout of the connection (None: no timeout)
+
+        Returns:
+            socket: The connected socket, or None if no daemon is listening
+    '''
+    if not os.path.exists(SOCKET_PATH):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # A stale socket (daemon killed) refuses the connection immediately
+        sock.settimeout(1)
+        sock.connect(SOCKET_PATH)
+        sock.settimeout(timeout)
+        send_message(sock, REQUEST, json.dumps(payload).encode('utf-8'))
+
+    except OSError:
+        sock.close()
+        return None
+
+    return sock
+
+def forward(argv):
+    '''
+        Run a command line in the daemon and stream back its output
+
+        Arguments:
+            argv (list): The arguments of gitpy (without the program name)
+
+        Returns:
+            int: The exit code of the command, or None if it must run locally
+                 (no daemon running, not a forwardable command or another
+                 environment than the daemon's one, see DAEMON_ENVIRONMENT)
+    '''
+    if not is_forwardable(argv):
+        return None
+
+    sock = request({
+        'command': 'run',
+        'argv': argv,
+        'cwd': os.getcwd(),
+        'env': dict(os.environ),
+        # The daemon colors the output like this process would
+        'color': 'NO_COLOR' not in os.environ and sys.stdout.isatty(),
+    })
+    if sock is None:
+        return None
+
+    received = False
+    try:
+        while True:
+            kind, payload = receive_message(sock)
+            received = True
+
+            if kind == STDOUT:
+                sys.stdout.buffer.write(payload)
+                sys.stdout.flush()
+
+            elif kind == STDERR:
+                sys.stderr.buffer.write(payload)
+                sys.stderr.flush()
+
+            elif kind == EXIT:
+                return json.loads(payload)
+
+    except KeyboardInterrupt:
+        # Closing the socket stops the output, the daemon finishes the command alone
+        sys.stderr.write('\n  [!] Interrupted, shutting down...\n')
+        return 1
+
+    except (OSError, ValueError):
+        # The daemon died before running anything: run the command locally
+        if not received:
+            return None
+        sys.stderr.write('gitpy: the connection with the daemon was lost\n')
+        return 1
+
+    finally:
+        sock.close()
@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ email_utils.py            [Created: 2023-03-29 |  9:31 - AM]  #
-#                                       [Updated: 2023-03-31 |  9:31 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Check if the entered value are a correct email and detect the email      #
 #  domain.                                                                  #
@@ -34,13 +34,7 @@
 #  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
 #---------------------------------------------------------------------------#
 
-# Imports section
-import os
-import requests
-import configparser
-
 ## Third party imports
-from src.config import Configuration
 from src.util.env_var import set_env_var
 from src.util.colors import Color
 from src.core.send_email import send_email
@@ -50,7 +44,7 @@ class Email_Utils():
     '''
         Check if the entered value are a correct email and detect the email domain.
         Detect the domain of the email.
-        Save the email configuration in a .conf file.
+        Save the email configuration in the subscription store.
 
         Attributes:
             mail_server (str): The email server.
@@ -137,45 +131,37 @@ class Email_Utils():
         current_commit_sha
         ):
 
-        GITPY_PATH = os.environ[Configuration.gitpy_install_path_env_var_name]
-        INSTALL_PATH = GITPY_PATH
+        from src.util.subscription_store import Subscription_Store, subscription_key, password_env_var_name
 
         # Create the name of a environment variable that will contain the password of the email account
-        smtp_password_env_var_name = 'GITPY_%s_SMTP_PASSWORD' % github_repo_name.upper()
-
-        # Create the configparser object
-        config_file = '%ssrc/config/new_version_notification.conf' % INSTALL_PATH
-        config = configparser.ConfigParser()
-        config.read(config_file)
-
-        # Add the sections
-        config.add_section(section=github_repo_name)
-
-        # Add the options
-        config.set(github_repo_name, 'github_repo_name', github_repo_name)
-        config.set(github_repo_name, 'github_repo_owner', github_repo_owner)
-        config.set(github_repo_name, 'github_repo_branch', github_repo_branch)
-        config.set(github_repo_name, 'github_repo_url', github_repo_url)
-        config.set(github_repo_name, 'github_repo_api_url', github_repo_api_url)
-        config.set(github_repo_name, 'current_commit_sha', current_commit_sha)
-
-        config.set(github_repo_name, 'receiver_email_address', receiver_email_address)
-
-        config.set(github_repo_name, 'smtp_server', smtp_server)
-        config.set(github_repo_name, 'smtp_port', smtp_port)
-
-        config.set(github_repo_name, 'smtp_username', smtp_username)
-        
-        # The 'smtp_password' will contain the name of the environment variable 
-        # that will contain the password of the email account
-        config.set(github_repo_name, 'smtp_password', smtp_password_env_var_name)
-
-        config.set(github_repo_name, 'email_subject', 'New version of %s' % github_repo_name)
-        config.set(github_repo_name, 'email_message', 'A new version of %s is available on %s' % (github_repo_name, github_repo_url))
-
-        # Write the updated configuration back to the file
-        with open(config_file, 'w') as configfile:
-            config.write(configfile)
+        smtp_password_env_var_name = password_env_var_name(subscription_key(github_repo_owner, github_repo_name, github_repo_branch))
+
+        # Add the subscription (keyed by owner/repository@branch) to the store
+        store = Subscription_Store()
+        try:
+            store.add(
+                owner=github_repo_owner,
+                name=github_repo_name,
+                branch=github_repo_branch,
+                url=github_repo_url,
+                api_url=github_repo_api_url,
+                subscribed_sha=current_commit_sha,
+
+                receiver_email_address=receiver_email_address,
+
+                smtp_server=smtp_server,
+                smtp_port=smtp_port,
+                smtp_username=smtp_username,
+
+                # The 'smtp_password' will contain the name of the environment variable
+                # that will contain the password of the email account
+                smtp_password=smtp_password_env_var_name,
+
+                email_subject='New version of %s' % github_repo_name,
+                email_message='A new version of %s is available on %s' % (github_repo_name, github_repo_url),
+            )
+        finally:
+            store.close()
 
         # Create the environment variable that will contain the password of the email account
         Color.pl('  {-} Creating the environment variable that will contain the password of the email account...')
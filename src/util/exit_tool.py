@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ exit_tool.py              [Created: 2023-03-28 |  8:54 - PM]  #
-#                                       [Updated: 2023-04-03 | 15:00 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Just a small function to prompt a exit message if verbose was applied    #
 #  Language ~ Python3                                                       #
@@ -40,7 +40,8 @@ from src.util.colors import Color
 # Function section
 def exit_tool(code,pwd):
     '''
-        Exit and removing the python cache with a message if verbose was applied
+        Exit with a message if verbose was applied.
+        The bytecode cache is kept between runs (use --remove-cache to purge it).
 
         Args:
             code (int): The exit code
@@ -48,11 +49,7 @@ def exit_tool(code,pwd):
 
     '''
     from src.config import Configuration
-    from src.util.remove_python_cache import remove_python_cache
 
-    if not pwd:
-        pwd = Configuration.pwd
-    remove_python_cache(pwd=pwd)
     if Configuration.verbose == 3:
         if code == 0:
             Color.pl('  {§} Exiting with the exit code: {G}0{W}')
@@ -60,4 +57,6 @@ def exit_tool(code,pwd):
         else:
             Color.pl('  {§} Exiting with the exit code: {R}1{W}')
             Color.pl('   {SY1}╰──╼{W} Python: {SY1}sys.exit(1){W}')
+
+    Color.flush()
     sys.exit(code)
\ No newline at end of file
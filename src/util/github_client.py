@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ github_client.py          [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  The HTTP client shared by all the requests sent to GitHub                #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import threading
+from urllib.parse import quote
+from concurrent.futures import Future, ThreadPoolExecutor
+
+## Third party libraries
+from src.config import Configuration
+
+# Functions section
+def then(future, function):
+    '''
+        Return a future of function(result of the future), without a new thread
+
+        Arguments:
+            future (concurrent.futures.Future): The first future
+            function (function): Called with its result when it's done
+
+        Returns:
+            concurrent.futures.Future: The new future
+    '''
+    chained = Future()
+
+    def done(future):
+        try:
+            chained.set_result(function(future.result()))
+        except BaseException as e:
+            chained.set_exception(e)
+
+    future.add_done_callback(done)
+    return chained
+
+# Main
+class GitHub_Client():
+    '''
+        The HTTP client used by every GitPy code path that talks to GitHub
+        (the console, the notifications, the version check and the updater).
+
+        It's built on a single session of the vendored 'requests', so the
+        connections are kept alive and reused between the requests (and between
+        the commands run by the daemon) instead of paying a new TCP and TLS
+        handshake for each call. The requests of the GitHub API are authenticated
+        with the configured tokens (GITPY_GITHUB_TOKENS or GITHUB_TOKEN) and
+        paced with their rate limits. Use GitHub_Client.shared() to get it.
+
+        Arguments:
+            timeout (tuple): The default (connect, read) timeouts, in seconds
+            pool_connections (int): The number of hosts that keep a connection pool
+            pool_maxsize (int): The max number of kept connections per host
+    '''
+
+    # The instance returned by shared()
+    _shared = None
+    _lock = threading.Lock()
+
+    def __init__(self, timeout=None, pool_connections=None, pool_maxsize=None):
+        # Imported here, the vendored HTTP stack is only loaded when a request is really sent
+        import src.tools.requests as requests
+        from src.util.rate_limiter import Token_Pool, Rate_Limited_Adapter
+
+        self.timeout = timeout or Configuration.HTTP_TIMEOUT
+
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'GitPy/%s' % Configuration.VERSION,
+            'Accept': 'application/vnd.github+json',
+        })
+
+        # The requests are sent with the tokens of GitPy (if any) and paced with
+        # the rate limits of GitHub (see src/util/rate_limiter.py)
+        self.token_pool = Token_Pool()
+
+        options = {
+            'token_pool': self.token_pool,
+            'pool_connections': pool_connections or Configuration.HTTP_POOL_CONNECTIONS,
+            'pool_maxsize': pool_maxsize or Configuration.HTTP_POOL_MAXSIZE,
+        }
+
+        # The responses are kept on disk and revalidated with their ETag (see src/util/http_cache.py)
+        if Configuration.HTTP_CACHE_ENABLED:
+            from src.util.http_cache import Caching_Adapter
+            adapter = Caching_Adapter(**options)
+        else:
+            adapter = Rate_Limited_Adapter(**options)
+
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # The requests sent in background (as many as the kept connections per host)
+        self.executor = ThreadPoolExecutor(max_workers=options['pool_maxsize'], thread_name_prefix='gitpy-http')
+
+    @classmethod
+    def shared(cls):
+        '''
+            Return the client shared by the whole process (created at the first call)
+        '''
+        if cls._shared is None:
+            with cls._lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+
+        return cls._shared
+
+    @classmethod
+    def _reset(cls):
+        # A forked child must never use the sockets of its parent
+        cls._shared = None
+        cls._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        '''
+            Send a GET request (with the default timeouts if none is given)
+
+            Arguments:
+                url (str): A full URL, or a path of the GitHub API (ex: '/repos/<owner>/<repo>')
+
+            Returns:
+                requests.Response: The response
+        '''
+        if url.startswith('/'):
+            url = Configuration.GITHUB_API_URL + url
+
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def head_sha(self, owner, name, branch=None):
+        '''
+            The SHA of the latest commit of a branch. Only the SHA is asked
+            (the 'application/vnd.github.sha' media type), not the commits.
+
+            Arguments:
+                owner (str): The owner of the repository
+                name (str): The name of the repository
+                branch (str): The branch (None: the default branch)
+
+            Returns:
+                str: The SHA, None if the repository or the branch doesn't exist
+        '''
+        url = '/repos/%s/%s/commits/%s' % (owner, name, quote(branch or 'HEAD', safe=''))
+        response = self.get(url, headers={'Accept': 'application/vnd.github.sha'})
+
+        if response.status_code in (404, 422):
+            return None
+        if response.status_code != 200:
+            raise Exception('Request failed with status code %s' % response.status_code)
+
+        return response.text.strip()
+
+    def post(self, url, **kwargs):
+        '''
+            Send a POST request (with the default timeouts if none is given)
+
+            Returns:
+                requests.Response: The response
+        '''
+        if url.startswith('/'):
+            url = Configuration.GITHUB_API_URL + url
+
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.post(url, **kwargs)
+
+    def paginate(self, url, key=None, per_page=100):
+        '''
+            Iterate lazily on all the items of a paginated endpoint (see Paginator)
+
+            Arguments:
+                url (str): The URL (or API path) of the first page
+                key (str): The key of the items in the responses (ex: 'items' for
+                           a search), None if the responses are lists
+                per_page (int): The number of items per request (100 at most)
+
+            Returns:
+                Paginator: The items
+        '''
+        return Paginator(self, url, key, per_page)
+
+    def submit(self, url, parse=None, **kwargs):
+        '''
+            Send a GET request in background
+
+            Arguments:
+                url (str): A full URL, or a path of the GitHub API
+                parse (function): Called (in background) with the response, its
+                                  return value becomes the result of the future
+
+            Returns:
+                concurrent.futures.Future: The future of the response (see get())
+        '''
+        if parse is None:
+            return self.executor.submit(self.get, url, **kwargs)
+        return self.executor.submit(lambda: parse(self.get(url, **kwargs)))
+
+    def close(self):
+        '''
+            Wait for the requests sent in background and close all the kept connections
+        '''
+        self.executor.shutdown()
+        self.session.close()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=GitHub_Client._reset)
+
+
+class Paginator():
+    '''
+        The items of a paginated endpoint of the GitHub API, requested one page
+        at a time when they are iterated (by following the 'Link: rel=next'
+        header). Only the current page is kept in memory, and the iteration can
+        be resumed later (ex: to show more results) without any new request for
+        the items already seen.
+
+        Arguments:
+            client (GitHub_Client): The client that sends the requests
+            url (str): The URL (or API path) of the first page
+            key (str): The key of the items in the responses, None for lists
+            per_page (int): The number of items per request
+
+        Attributes:
+            total_count (int): The total number of items, if GitHub gives it (after the first page)
+    '''
+
+    def __init__(self, client, url, key=None, per_page=100):
+        self.client = client
+        self.key = key
+        self.next_url = url
+        self.params = {'per_page': per_page}
+        self.total_count = None
+        self.page = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self.page:
+            if self.next_url is None:
+                raise StopIteration
+            self._fetch()
+
+        return self.page.pop(0)
+
+    def _fetch(self):
+        response = self.client.get(self.next_url, params=self.params)
+
+        if response.status_code != 200:
+            raise Exception('Request failed with status code %s' % response.status_code)
+
+        data = response.json()
+        if self.key is not None:
+            self.total_count = data.get('total_count', self.total_count)
+            data = data[self.key]
+
+        # The next URLs already have all the parameters
+        self.page = data
+        self.params = None
+        self.next_url = response.links.get('next', {}).get('url')
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ github_graphql.py         [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  GraphQL backend of the GitHub API (batched queries)                      #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+
+## Third party libraries
+from src.config import Configuration
+from src.util.github_client import GitHub_Client
+
+# The fields of a repository, with the same names as in the REST API
+REPOSITORY_QUERY = '''
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    owner { login }
+    description
+    diskUsage
+    stargazerCount
+    forkCount
+    primaryLanguage { name }
+    createdAt
+    updatedAt
+    url
+    licenseInfo { name }
+    defaultBranchRef { name target { oid } }
+    refs(refPrefix: "refs/heads/", first: 100) { nodes { name target { oid } } }
+  }
+}
+'''
+
+# Main
+class GitHub_GraphQL():
+    '''
+        The GraphQL (v4) backend of the GitHub API. One query returns what
+        costs several REST requests: the details, the head and the branches of
+        a repository, or the heads of dozens of repositories at once.
+
+        The GraphQL API needs a token, so this backend is only used when
+        Configuration.GRAPHQL_ENABLED is True (at least one token, and
+        GITPY_NO_GRAPHQL not set).
+    '''
+
+    def __init__(self, client=None):
+        self.client = client or GitHub_Client.shared()
+
+    def query(self, query, variables=None):
+        '''
+            Send a query, return its 'data' and its errors
+
+            Returns:
+                tuple: (data, errors)
+        '''
+        response = self.client.post(Configuration.GITHUB_GRAPHQL_URL, json={'query': query, 'variables': variables or {}})
+
+        if response.status_code != 200:
+            raise Exception('Request failed with status code %s' % response.status_code)
+
+        result = response.json()
+        return result.get('data') or {}, result.get('errors') or []
+
+    def repository(self, owner, name):
+        '''
+            The details, the latest commit and the branches of a repository
+
+            Returns:
+                dict: 'info' (like the REST API's repository), 'latest_sha' (of the
+                      default branch) and 'branches' (like the REST API's branches)
+        '''
+        data, errors = self.query(REPOSITORY_QUERY, {'owner': owner, 'name': name})
+        repository = data.get('repository')
+
+        if repository is None:
+            raise Exception(errors[0]['message'] if errors else 'Repository %s/%s not found' % (owner, name))
+
+        default_branch = repository['defaultBranchRef'] or {'name': None, 'target': {'oid': None}}
+
+        return {
+            'info': {
+                'name': repository['name'],
+                'owner': {'login': repository['owner']['login']},
+                'description': repository['description'],
+                'size': repository['diskUsage'],
+                'stargazers_count': repository['stargazerCount'],
+                'forks_count': repository['forkCount'],
+                'language': (repository['primaryLanguage'] or {}).get('name'),
+                'created_at': repository['createdAt'],
+                'updated_at': repository['updatedAt'],
+                'html_url': repository['url'],
+                'url': '%s/repos/%s/%s' % (Configuration.GITHUB_API_URL, repository['owner']['login'], repository['name']),
+                'license': repository['licenseInfo'],
+                'clone_url': repository['url'] + '.git',
+                'default_branch': default_branch['name'],
+            },
+            'latest_sha': default_branch['target']['oid'],
+            'branches': [{'name': ref['name'], 'commit': {'sha': ref['target']['oid']}} for ref in repository['refs']['nodes']],
+        }
+
+    def batch_heads(self, batch):
+        '''
+            The latest commit of a batch of repositories (up to
+            Configuration.GRAPHQL_BATCH_SIZE), with one aliased query
+
+            Arguments:
+                batch (list): The (owner, name, branch) of the repositories
+
+            Returns:
+                list: The SHA of each repository (None if it can't be found), in the same order
+        '''
+        declarations, fields, variables = [], [], {}
+
+        # The names are given as variables, never written in the query
+        for index, (owner, name, branch) in enumerate(batch):
+            declarations.append('$o%d: String!, $n%d: String!' % (index, index))
+            variables.update({'o%d' % index: owner, 'n%d' % index: name})
+
+            if branch is None:
+                ref = 'defaultBranchRef { target { oid } }'
+            else:
+                declarations.append('$b%d: String!' % index)
+                variables['b%d' % index] = branch
+                ref = 'ref(qualifiedName: $b%d) { target { oid } }' % index
+
+            fields.append('r%d: repository(owner: $o%d, name: $n%d) { %s }' % (index, index, index, ref))
+
+        data, _ = self.query('query(%s) {\n%s\n}' % (', '.join(declarations), '\n'.join(fields)), variables)
+
+        # A missing repository (or branch) is null, with an error for it
+        heads = []
+        for index, (_, _, branch) in enumerate(batch):
+            repository = data.get('r%d' % index) or {}
+            ref = repository.get('defaultBranchRef' if branch is None else 'ref') or {}
+            heads.append((ref.get('target') or {}).get('oid'))
+
+        return heads
@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ github_repo.py            [Created: 2023-02-21 | 11:12 - AM]  #
-#                                       [Updated: 2023-02-21 | 12:03 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Compare the version between the GitPy instance on the system and         #
 #  the GitHub's repositorie one.                                            #               
@@ -36,15 +36,19 @@
 # Imports section
 import os
 import sys
-from json import loads
+from time import time
+from json import loads, dumps
 
 ## Third party libraries
-from src.tools.packaging import version
-import src.tools.requests as requests
-from src.tools.requests import get
+from src.util.lazy_import import lazy_import
 from src.util.colors import Color
-from src.util.internet_check import internet_check
 from src.util.exit_tool import exit_tool
+from src.util.github_client import GitHub_Client
+
+# The vendored HTTP stack is only imported when a request is really sent (for its exceptions)
+requests = lazy_import('src.tools.requests')
+version = lazy_import('src.tools.packaging.version')
+rate_limiter = lazy_import('src.util.rate_limiter')
 
 # Class section
 class GitHub_Repo():
@@ -59,55 +63,171 @@ class GitHub_Repo():
             the system and the GitHub repositorie's version
             with the 'metadata.json' file.
 
+            The 'metadata.json' file is read from the cache of GitPy so the
+            help pages are never blocked by the network. When the cache is
+            missing or too old, it's refreshed in background for the next run.
+
             Arguments:
                 mode (str): Where tis function have been called. 
                             It can be have 2 values:
                               - None: Display after using the -h/--help option
-                              - 'update': Called by the '--update' option (so called by the 'updater.py' file)
+                              - 'update': Called by the '--update' option (so called by the 'updater.py' file),
+                                          the cache is refreshed before the comparison
 
         '''
 
         from src.config import Configuration
 
-        # if os.path.isdir(Configuration.DEFAULT_INSTALL_PATH):
-        if internet_check() == True:
-            rqst = get(Configuration.REPO_METADATA_URL, timeout=3)
-            fetch_sc = rqst.status_code
+        if mode == 'update':
+            metadata = GitHub_Repo.refresh_metadata_cache()
 
-            if fetch_sc == 404:
-                Color.pl('  {!} The GitPy\'s repositorie can\'t be reach for checking if a new version are avalable.')
-                Color.pl('  {*} Maybe the repository has been switched to private mode.')
-                Color.pl('  {*} Please contact MyMeepSQL by sending an email or add him on Discord (use the {G}--info{W} option for author\'s informations).')
+        else:
+            metadata = GitHub_Repo.read_metadata_cache()
 
-            if fetch_sc == 200:
-                metadata = rqst.text
-                json_data = loads(metadata)
-                # print(json_data)
-                cp_online_ver = json_data['version']
+            if metadata is None or time() - metadata['checked_at'] > Configuration.REPO_METADATA_CACHE_TTL:
+                GitHub_Repo.refresh_metadata_in_background()
 
-                Configuration.REPO_VERSION = cp_online_ver
-                # print(Configuration.VERSION)
-                # print(cp_online_ver)
-                # print(Configuration.REPO_VERSION)
+            # Nothing known yet, the next run will use the refreshed cache
+            if metadata is None:
+                return
 
-                if version.parse(cp_online_ver) > version.parse(Configuration.VERSION):
-                    Color.pl('  {*} A new update are avalable: %s (Current %s)' % (cp_online_ver, Configuration.VERSION))
+        fetch_sc = metadata['status']
 
-                    if mode == None:
-                        # Color.pl('  {*} A new update are avalable: %s (Current %s)' % (cp_online_ver, Configuration.VERSION))
-                        Color.pl('  {*} You can update your GitPy instance with the {G}--update{W} option.')
+        if fetch_sc == 404:
+            Color.pl('  {!} The GitPy\'s repositorie can\'t be reach for checking if a new version are avalable.')
+            Color.pl('  {*} Maybe the repository has been switched to private mode.')
+            Color.pl('  {*} Please contact MyMeepSQL by sending an email or add him on Discord (use the {G}--info{W} option for author\'s informations).')
 
-                else:
+        if fetch_sc == 200:
+            cp_online_ver = metadata['version']
 
-                    if mode == 'update':
-                        Color.pl('  {!} You already have the latest version of GitPy!')
-                        exit_tool(1,pwd=Configuration.pwd)
-                        
-        else:
+            Configuration.REPO_VERSION = cp_online_ver
+
+            if version.parse(cp_online_ver) > version.parse(Configuration.VERSION):
+                Color.pl('  {*} A new update are avalable: %s (Current %s)' % (cp_online_ver, Configuration.VERSION))
+
+                if mode == None:
+                    Color.pl('  {*} You can update your GitPy instance with the {G}--update{W} option.')
+
+            else:
+
+                if mode == 'update':
+                    Color.pl('  {!} You already have the latest version of GitPy!')
+                    exit_tool(1,pwd=Configuration.pwd)
+
+        if fetch_sc == 0:
             Color.pl('  {!} You are not connected to the internet.')
             Color.pl('  {*} Cannot check if a new version of GitPy are avalable or not.')
             Configuration.REPO_VERSION = 'no-internet'
 
+    @staticmethod
+    def read_metadata_cache():
+        '''
+            Read the cached 'metadata.json' of the GitPy's repository.
+
+            Returns:
+                dict: The cache ('status', 'version', 'etag' and 'checked_at' keys)
+                      or None if there is no (valid) cache
+        '''
+
+        from src.config import Configuration
+
+        try:
+            with open(Configuration.CACHE_PATH + Configuration.REPO_METADATA_CACHE_FILE, 'r') as cache_file:
+                metadata = loads(cache_file.read())
+            if 'status' not in metadata or 'checked_at' not in metadata:
+                return None
+
+            return metadata
+
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def refresh_metadata_cache():
+        '''
+            Fetch the 'metadata.json' file of the GitPy's repository and save it in the cache.
+            The cached ETag is sent so an unchanged file costs a '304 Not Modified'.
+
+            Returns:
+                dict: The new cache
+        '''
+
+        from src.config import Configuration
+
+        metadata = GitHub_Repo.read_metadata_cache() or {'status': None, 'version': None, 'etag': None}
+        headers = {'If-None-Match': metadata['etag']} if metadata.get('etag') and metadata['status'] == 200 else {}
+
+        try:
+            rqst = GitHub_Client.shared().get(Configuration.REPO_METADATA_URL, headers=headers, timeout=3)
+
+            if rqst.status_code == 200:
+                metadata['version'] = loads(rqst.text)['version']
+                metadata['etag'] = rqst.headers.get('ETag')
+                metadata['status'] = 200
+
+            # 304: not modified, the cached version is still the right one
+            elif rqst.status_code != 304:
+                metadata['status'] = rqst.status_code
+
+        except (requests.exceptions.RequestException, rate_limiter.Rate_Limit_Exceeded):
+            metadata['status'] = 0
+
+        # An invalid 'metadata.json' file, keep the last known values
+        except (ValueError, KeyError):
+            pass
+
+        metadata['checked_at'] = time()
+
+        # Write in a temporary file first, so a reader never sees a half written cache
+        try:
+            os.makedirs(Configuration.CACHE_PATH, exist_ok=True)
+            cache_file_path = Configuration.CACHE_PATH + Configuration.REPO_METADATA_CACHE_FILE
+            with open('%s.%s.tmp' % (cache_file_path, os.getpid()), 'w') as cache_file:
+                cache_file.write(dumps(metadata))
+            os.replace('%s.%s.tmp' % (cache_file_path, os.getpid()), cache_file_path)
+
+        except OSError:
+            pass
+
+        return metadata
+
+    @staticmethod
+    def refresh_metadata_in_background():
+        '''
+            Refresh the cached 'metadata.json' in a detached process, so the
+            current command can print its output and exit without waiting.
+        '''
+
+        # Flush the output first, else the buffered text would be printed twice
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        try:
+            pid = os.fork()
+
+        except (AttributeError, OSError):
+            GitHub_Repo.refresh_metadata_cache()
+            return
+
+        if pid != 0:
+            # Reap the intermediate child, the refresh process is adopted by init
+            os.waitpid(pid, 0)
+            return
+
+        try:
+            os.setsid()
+            if os.fork() == 0:
+                # Detach from the terminal (or the pipe) of the user
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for fd in (0, 1, 2):
+                    os.dup2(devnull, fd)
+
+                GitHub_Repo.refresh_metadata_cache()
+
+        finally:
+            os._exit(0)
+
     @staticmethod
     def is_reachable(args):
         '''
@@ -121,7 +241,7 @@ class GitHub_Repo():
 
         try:
             repository_url = Configuration.REPO_URL
-            rqst = requests.get(repository_url, timeout=7)
+            rqst = GitHub_Client.shared().get(repository_url, timeout=7)
 
             # If the repository is in private mode, the page returns a 404 status (Not Found)
             if rqst.status_code == 404:
@@ -135,6 +255,10 @@ class GitHub_Repo():
                     Color.pl('  {*} Please contact MyMeepSQL by sending an email or add him on Discord (use the {G}--info{W} option for author\'s informations).')
                     exit_tool(1,pwd=Configuration.pwd)
 
+        # The rate limit only concerns the API, the repository can still be reachable
+        except rate_limiter.Rate_Limit_Exceeded:
+            pass
+
         except KeyboardInterrupt:
             Color.pl('\n  {*} Aborted')
             exit_tool(1,pwd=Configuration.pwd)
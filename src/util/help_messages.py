@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ help_messages.py          [Created: 2023-02-21 | 10:26 - AM]  #
-#                                       [Updated: 2023-04-10 | 13:34 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  All help messages for GitPy                                              #
 #  Language ~ Python3                                                       #
@@ -80,6 +80,8 @@ class Help_Messages():
         \r  -------                                  -----------
         \r  -cr,        --check-repo                 Check if the repository in the notification config file have a new 
         \r                                           commit avalable and send a notificarion via mail if it\'s the case.
+        \r              --digest                     With {G}--check-repo{W}, send one email per receiver with all the new
+        \r                                           commits instead of one email per repository.
         \r              --unsub                      Allows you to unsubscribe from a repository registered with GitPy.
 
         
@@ -118,7 +120,9 @@ class Help_Messages():
         \r              --show-config                Prompt the content of the config file.
         \r              --show-env-var         [+]   Prompt the value of the a environment variable.
         \r                                           (const: {G}install_path{W}).
-        \r              --remove-cache         [+]   Delete python cache from the GitPy directory.
+        \r              --remove-cache         [+]   Delete the bytecode cache from the GitPy directory.
+        \r              --daemon               [+]   Start, stop or show the status of the GitPy's resident daemon.
+        \r                                           (const: {G}start{W}).
 
         \r{SB2}{bold}Others avalable informations{W}:
         \r=============================
@@ -647,7 +651,9 @@ class Help_Messages():
 
         \r  Option's Description
         \r  --------------------
-        \r  Delete all __pycache__ directories and .pyc files of GitPy.
+        \r  Delete the bytecode cache, all __pycache__ directories and .pyc files of GitPy.
+        \r  The bytecode cache is compiled during the installation/update of GitPy and kept
+        \r  between runs, so GitPy does not recompile its files at each start.
 
         \r  Options                         Description
         \r  -------                         -----------
@@ -661,6 +667,42 @@ class Help_Messages():
         \r  gitpy --remove-cache [OPTIONS]'''
 
 
+
+    def option_daemon():
+        '''
+            The help message for the --daemon option
+        '''
+        return '''
+        \r{SB2}{bold}Daemon option{W}:
+        \r==============
+
+        \r  Category
+        \r  --------
+        \r  Miscellaneous options
+
+        \r  Option's Description
+        \r  --------------------
+        \r  Keep a GitPy process running in the background, with all its modules imported and its
+        \r  connections to GitHub opened. While it runs, the {G}gitpy{W} command sends its options to it
+        \r  over a Unix socket (only usable by the same user) instead of starting Python again, so
+        \r  the repeated commands (like the {G}--check-repo{W} of the cron job) are almost instant.
+        \r  The interactive commands (install, update, uninstall, consoles...) always run locally.
+        \r  Set the {G}GITPY_NO_DAEMON{W} environment variable to never use the daemon.
+
+        \r  Arguments         Description
+        \r  ---------         -----------
+        \r  start             Start the daemon (default).
+        \r  stop              Stop the daemon.
+        \r  status            Show if the daemon is running, its PID and how many commands it served.
+
+        \r{SB2}{bold}Others avalable informations{W}:
+        \r=============================
+
+        \r  Usage
+        \r  -----
+        \r  gitpy --daemon [ARGUMENT]'''
+
+
     # -------------------- [ Consoles ] -------------------- #
     
     
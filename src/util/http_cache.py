@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ http_cache.py             [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  On-disk cache of the GitHub API's responses, revalidated with their ETag #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import re
+import json
+import time
+import base64
+import hashlib
+import tempfile
+import threading
+from urllib.parse import urlsplit
+
+## Third party libraries
+from src.config import Configuration
+from src.tools.requests.models import Response
+from src.tools.requests.structures import CaseInsensitiveDict
+from src.tools.requests.utils import get_encoding_from_headers
+from src.util.rate_limiter import Rate_Limited_Adapter
+
+# Main
+class Caching_Adapter(Rate_Limited_Adapter):
+    '''
+        A transport adapter that keeps the GET responses of GitHub on disk with
+        their validators (ETag, Last-Modified).
+
+        A cached response is used as is while it's fresh (see HTTP_CACHE_FRESHNESS
+        in the config), then it's revalidated with a conditional request: GitHub
+        answers '304 Not Modified' (which doesn't count in the rate limit) and
+        the cached body is used again. The cache is bounded in size, the least
+        recently used responses are removed first. Only the requests really
+        sent to GitHub go through the rate limiter.
+
+        Arguments:
+            cache_path (str): The directory of the cache
+            max_size (int): The max size of the cache, in bytes
+            freshness (list): The (regex on the URL's path, seconds) rules
+            Any other argument is given to Rate_Limited_Adapter
+    '''
+
+    def __init__(self, cache_path=None, max_size=None, freshness=None, **kwargs):
+        super().__init__(**kwargs)
+        self.cache_path = cache_path or Configuration.CACHE_PATH + Configuration.HTTP_CACHE_PATH
+        self.max_size = max_size or Configuration.HTTP_CACHE_MAX_SIZE
+        self.freshness = [(re.compile(pattern), seconds) for pattern, seconds in (freshness or Configuration.HTTP_CACHE_FRESHNESS)]
+        # The size of the cache, measured at the first write then tracked
+        self.size = None
+        self.size_lock = threading.Lock()
+
+    def send(self, request, stream=False, **kwargs):
+        # Only the plain GET requests are cached. A request that is already
+        # conditional (like the version check) manages its own cache.
+        if request.method != 'GET' or stream or 'If-None-Match' in request.headers or 'If-Modified-Since' in request.headers:
+            return super().send(request, stream=stream, **kwargs)
+
+        cache_file = self.cache_file(request)
+        entry = self.read(cache_file)
+
+        if entry is not None and time.time() - entry['stored_at'] < self.max_age(request.url):
+            return self.build_cached_response(request, entry)
+
+        if entry is not None:
+            if entry['headers'].get('ETag'):
+                request.headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                request.headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            # Still the same: the cached response is fresh again
+            entry['stored_at'] = time.time()
+            self.write(cache_file, entry)
+            return self.build_cached_response(request, entry)
+
+        if response.status_code == 200 and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            self.write(cache_file, {
+                'url': response.url,
+                'headers': dict(response.headers),
+                'body': base64.b64encode(response.content).decode(),
+                'stored_at': time.time(),
+            })
+
+        return response
+
+    def max_age(self, url):
+        '''
+            How long (in seconds) a response of this URL is used without revalidation
+        '''
+        path = urlsplit(url).path
+        for pattern, seconds in self.freshness:
+            if pattern.search(path):
+                return seconds
+        return 0
+
+    def cache_file(self, request):
+        # The representation depends on the URL and on the media type asked
+        key = '%s %s' % (request.url, request.headers.get('Accept', ''))
+        return os.path.join(self.cache_path, hashlib.sha1(key.encode()).hexdigest() + '.json')
+
+    def build_cached_response(self, request, entry):
+        '''
+            Build a response from a cache entry (marked with 'from_cache')
+        '''
+        response = Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = base64.b64decode(entry['body'])
+        response.request = request
+        response.connection = self
+        response.from_cache = True
+        return response
+
+    def read(self, cache_file):
+        try:
+            with open(cache_file, 'r') as entry_file:
+                entry = json.loads(entry_file.read())
+            # Used: the file becomes the most recently used one
+            os.utime(cache_file)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def write(self, cache_file, entry):
+        '''
+            Save an entry (atomically). The least recently used entries are
+            only evicted when the cache goes over its max size.
+        '''
+        try:
+            os.makedirs(self.cache_path, exist_ok=True)
+
+            # A temporary file of its own, renamed over the entry at once
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.cache_path)
+            try:
+                with os.fdopen(fd, 'w') as entry_file:
+                    entry_file.write(json.dumps(entry))
+                entry_size = os.path.getsize(tmp_path)
+                try:
+                    entry_size -= os.path.getsize(cache_file)
+                except OSError:
+                    pass
+                os.replace(tmp_path, cache_file)
+            except OSError:
+                os.remove(tmp_path)
+                raise
+
+            with self.size_lock:
+                if self.size is None:
+                    self.size = self.evict()
+                else:
+                    self.size += entry_size
+                    if self.size > self.max_size:
+                        self.size = self.evict()
+
+        except OSError:
+            pass
+
+    def evict(self):
+        '''
+            Remove the least recently used entries until the cache is under its
+            max size
+
+            Returns:
+                int: The size of the cache, in bytes
+        '''
+        entries = []
+        for file in os.scandir(self.cache_path):
+            if file.name.endswith('.json'):
+                try:
+                    stat = file.stat()
+                except OSError:
+                    # Removed by another process
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, file.path))
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+
+        return size
@@ -3,9 +3,9 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ internet_check.py         [Created: 2023-02-21 |  8:32 - PM]  #
-#                                       [Updated: 2023-02-21 |  9:10 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
-#  Check if the user are connected to the Internet or not                   #
+#  Check if the hosts that GitPy depends on are reachable                   #
 #  Language ~ Python3                                                       #
 #---[Authors]---------------------------------------------------------------#
 #  Thomas Pellissier (MyMeepSQL)                                            #
@@ -32,15 +32,163 @@
 #---------------------------------------------------------------------------#
 
 # Import section
-from urllib import request
+import os
+import json
+import time
+import errno
+import socket
+import selectors
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 
-# Main
-def internet_check(host='https://google.com'):
+# The results of this process: (hosts, port, tls) -> (reachable, checked_at)
+_probes = {}
+
+# Functions section
+def _address(host, port):
+    '''
+    Accept a hostname or an URL (ex: 'https://github.com') and return the
+    hostname and the port to probe (the port of the URL, if it has one)
+    '''
+    if '://' not in host:
+        return host, port
+
+    url = urlsplit(host)
+    return url.hostname, url.port or port
+
+def _resolve(host, port):
     '''
-    Check if the user have an Internet connection by connecting to google.com over https
+    Return all the addresses of a host, or an empty list if it can't be resolved
     '''
     try:
-        request.urlopen(host, timeout=4)
-        return True
-    except:
+        return socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        return []
+
+def _probe(host, addresses, timeout, tls):
+    '''
+    Open a TCP connection to all the addresses of a host at the same time
+    and keep the first one that answers (with a TLS handshake if asked)
+    '''
+    deadline = time.monotonic() + timeout
+    selector = selectors.DefaultSelector()
+    sockets = []
+
+    try:
+        for family, sock_type, proto, _, address in addresses:
+            sock = socket.socket(family, sock_type, proto)
+            sock.setblocking(False)
+            sockets.append(sock)
+            if sock.connect_ex(address) in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                selector.register(sock, selectors.EVENT_WRITE)
+
+        while selector.get_map() and time.monotonic() < deadline:
+            for key, _ in selector.select(timeout=deadline - time.monotonic()):
+                sock = key.fileobj
+                selector.unregister(sock)
+
+                # The connection failed (refused, unreachable...), wait for the other addresses
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                    continue
+
+                if not tls:
+                    return True
+
+                # Imported here, 'ssl' is only needed for the TLS probes
+                import ssl
+
+                try:
+                    sock.setblocking(True)
+                    sock.settimeout(max(deadline - time.monotonic(), 0.1))
+                    ssl.create_default_context().wrap_socket(sock, server_hostname=host).close()
+                    return True
+                except (ssl.SSLError, OSError):
+                    continue
+
         return False
+
+    finally:
+        selector.close()
+        for sock in sockets:
+            sock.close()
+
+def _read_shared_state(state_file):
+    try:
+        with open(state_file, 'r') as state:
+            return json.loads(state.read())
+    except (OSError, ValueError):
+        return {}
+
+def _write_shared_state(state_file, key, reachable, checked_at):
+    '''
+    Save a result in the state file shared by all the GitPy processes
+    '''
+    try:
+        state = _read_shared_state(state_file)
+        state[key] = {'reachable': reachable, 'checked_at': checked_at}
+
+        os.makedirs(os.path.dirname(state_file), exist_ok=True)
+        with open('%s.%s.tmp' % (state_file, os.getpid()), 'w') as tmp_state:
+            tmp_state.write(json.dumps(state))
+        os.replace('%s.%s.tmp' % (state_file, os.getpid()), state_file)
+    except OSError:
+        pass
+
+# Main
+def internet_check(host=None, port=443, timeout=3, tls=False, ttl=None, shared=True):
+    '''
+    Check if the hosts that GitPy depends on (GitHub by default) are reachable.
+
+    All the addresses of the hosts are probed in parallel with a TCP connection
+    (and a TLS handshake if asked). The result is memoized in the process and,
+    if 'shared' is True, in a small state file used by all the GitPy processes,
+    so the repeated checks cost nothing during 'ttl' seconds.
+
+    Arguments:
+        host (str|list): A hostname/URL or a list of them (default: Configuration.CONNECTIVITY_HOSTS)
+        port (int): The port to probe (if not given in the URL of a host)
+        timeout (float): The max time of the probe, in seconds
+        tls (bool): Do a TLS handshake after the TCP connection
+        ttl (float): How long a result is kept, in seconds (default: Configuration.CONNECTIVITY_CACHE_TTL)
+        shared (bool): Share the result with the other GitPy processes
+
+    Returns:
+        bool: True if all the hosts are reachable, False otherwise
+    '''
+    from src.config import Configuration
+
+    if host is None:
+        host = Configuration.CONNECTIVITY_HOSTS
+    if ttl is None:
+        ttl = Configuration.CONNECTIVITY_CACHE_TTL
+
+    hosts = tuple(_address(h, port) for h in ([host] if isinstance(host, str) else host))
+    if not hosts:
+        # Nothing that could be reached
+        return False
+
+    key = '%s%s' % (','.join('%s:%s' % h for h in hosts), '/tls' if tls else '')
+    state_file = Configuration.CACHE_PATH + Configuration.CONNECTIVITY_STATE_FILE
+    now = time.time()
+
+    # Already checked by this process
+    if key in _probes and now - _probes[key][1] < ttl:
+        return _probes[key][0]
+
+    # Already checked by another GitPy process
+    if shared:
+        state = _read_shared_state(state_file).get(key)
+        if isinstance(state, dict) and now - state.get('checked_at', 0) < ttl:
+            _probes[key] = (state['reachable'], state['checked_at'])
+            return state['reachable']
+
+    # Resolve and probe all the hosts at the same time
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        addresses = list(executor.map(lambda h: _resolve(*h), hosts))
+        reachable = all(executor.map(lambda h, a: bool(a) and _probe(h[0], a, timeout, tls), hosts, addresses))
+
+    _probes[key] = (reachable, now)
+    if shared:
+        _write_shared_state(state_file, key, reachable, now)
+
+    return reachable
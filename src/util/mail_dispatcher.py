@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ mail_dispatcher.py        [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Send the emails by SMTP session (one per server and account)             #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import smtplib
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+
+# Main
+class Mail_Dispatcher():
+    '''
+        Send emails by groups: the messages queued for the same SMTP server and
+        account are sent one after the other in one authenticated session,
+        instead of a connection (with its TLS and login handshakes) per message.
+
+        When the server drops the connection during a group, the dispatcher
+        reconnects and sends the message again (up to SMTP_RECONNECT_ATTEMPTS
+        connections per message). A message refused by the server only fails
+        itself.
+
+        Arguments:
+            starttls (bool): Upgrade the sessions to TLS (default: Configuration.SMTP_STARTTLS)
+            timeout (float): The timeout of the SMTP connections, in seconds (default: Configuration.SMTP_TIMEOUT)
+    '''
+
+    def __init__(self, starttls=None, timeout=None):
+        self.starttls = Configuration.SMTP_STARTTLS if starttls is None else starttls
+        self.timeout = timeout or Configuration.SMTP_TIMEOUT
+        self.groups = {}
+        self.connections = 0
+
+    def queue(self, server, port, username, password, message, on_sent=None, on_failed=None):
+        '''
+            Queue a message, sent by flush()
+
+            Arguments:
+                server (str): The SMTP server
+                port (int): Its port
+                username (str): The account on the server
+                password (str): Its password
+                message (Message): The email
+                on_sent (callable): Called with the message once it's sent
+                on_failed (callable): Called with the message and the error if it can't be sent
+        '''
+        group = self.groups.setdefault((server, int(port), username), {'password': password, 'messages': []})
+        group['messages'].append((message, on_sent, on_failed))
+
+    def _connect(self, server, port, username, password):
+        smtp = smtplib.SMTP(server, port, timeout=self.timeout)
+        self.connections += 1
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if username and password:
+                smtp.login(username, password)
+        except BaseException:
+            smtp.close()
+            raise
+
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Connected to the SMTP server {G}%s:%s{W} as {G}%s{W}.' % (server, port, username))
+        return smtp
+
+    @staticmethod
+    def _fail(messages, error):
+        # The messages are removed from their queue first: a failed message is never sent
+        while messages:
+            message, _, on_failed = messages.pop(0)
+            if on_failed is not None:
+                on_failed(message, error)
+
+    def _send_group(self, server, port, username, password, pending):
+        smtp = None
+        attempts = 0
+
+        try:
+            while pending:
+                message, on_sent, on_failed = pending[0]
+                try:
+                    if smtp is None:
+                        attempts += 1
+                        smtp = self._connect(server, port, username, password)
+                    smtp.send_message(message)
+
+                except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError) as error:
+                    # The connection is lost (or can't be opened): the message is sent again
+                    # with a new one, until the last attempt
+                    if smtp is not None:
+                        smtp.close()
+                        smtp = None
+                    if attempts < Configuration.SMTP_RECONNECT_ATTEMPTS:
+                        continue
+                    self._fail(pending, error)
+                    return
+
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as error:
+                    # Only this message is refused, the session is still usable
+                    self._fail([pending.pop(0)], error)
+                    continue
+
+                except (smtplib.SMTPException, OSError) as error:
+                    # Refused login, unknown server...: nothing can be sent with this account
+                    self._fail(pending, error)
+                    return
+
+                pending.pop(0)
+                attempts = 0
+                if on_sent is not None:
+                    on_sent(message)
+
+            if smtp is not None:
+                smtp.quit()
+                smtp = None
+
+        except (smtplib.SMTPException, OSError):
+            # The emails are sent, only the QUIT failed
+            pass
+
+        finally:
+            if smtp is not None:
+                smtp.close()
+
+    def flush(self):
+        '''
+            Send the queued messages, one session per server and account. A
+            group stays queued until it's done, so the messages not sent
+            because of an unexpected error can be given to discard().
+        '''
+        while self.groups:
+            key, group = next(iter(self.groups.items()))
+            self._send_group(*key, group['password'], group['messages'])
+            del self.groups[key]
+
+    def discard(self, error):
+        '''
+            Give up the messages still queued: their 'on_failed' is called with
+            the error
+        '''
+        groups, self.groups = self.groups, {}
+        for group in groups.values():
+            self._fail(group['messages'], error)
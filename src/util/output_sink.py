@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ output_sink.py            [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Buffered output of GitPy, flushed at prompts, steps and exit             #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import sys
+
+# Main
+class Output_Sink():
+    '''
+        The output of Color. The complete lines are written into the buffer
+        of sys.stdout and are only flushed when it's needed: before a prompt,
+        at the end of a step, before another process writes on the terminal
+        and at exit (see Color.flush()). When stdout is not a terminal (a pipe,
+        a file, the daemon), hundreds of verbose lines cost a few syscalls
+        instead of one per line.
+
+        A partial line (like '... ' before ' OK') or a line rewritten after a
+        carriage return is flushed at once, so the progress is always shown.
+
+        The stream is looked up at each write, so a redirected sys.stdout
+        (like in the daemon) is used as well.
+    '''
+
+    def write(self, text):
+        stream = sys.stdout
+        stream.write(text)
+
+        if not text.endswith('\n') or '\r' in text:
+            stream.flush()
+
+    def flush(self):
+        try:
+            sys.stdout.flush()
+        except (AttributeError, ValueError):
+            # No stdout or already closed (at exit)
+            pass
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ poll_scheduler.py         [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  When each subscription is checked again (adaptive polling)               #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import random
+
+## Third party libraries
+from src.config import Configuration
+
+# Functions section
+def poll_interval(change_interval, last_change, now):
+    '''
+        The polling interval of a repository, from its history
+
+        The expected time between two commits is the average of the observed
+        ones (change_interval), or the time since the last commit when it's
+        longer (a repository that stopped moving). A repository is checked
+        POLL_FACTOR times per expected commit, within the POLL_INTERVAL_MIN
+        and POLL_INTERVAL_MAX bounds. Before its first new commit, it's checked
+        every POLL_INTERVAL_DEFAULT (or less often if nothing moves).
+
+        Arguments:
+            change_interval (float): The average time between two commits (None if unknown)
+            last_change (float): When the last new commit has been seen (or the first check)
+            now (float): The current time
+
+        Returns:
+            float: The interval, in seconds
+    '''
+    expected = change_interval if change_interval is not None else Configuration.POLL_INTERVAL_DEFAULT * Configuration.POLL_FACTOR
+    if last_change is not None:
+        expected = max(expected, now - last_change)
+
+    return min(max(expected / Configuration.POLL_FACTOR, Configuration.POLL_INTERVAL_MIN), Configuration.POLL_INTERVAL_MAX)
+
+def schedule(subscription, changed, now):
+    '''
+        Update the history of a subscription after a check and plan the next one
+
+        Arguments:
+            subscription (dict): The 'change_interval' and 'last_change' of the subscription
+            changed (bool): The check saw a new commit
+            now (float): The time of the check
+
+        Returns:
+            dict: The new 'change_interval', 'last_change' and 'next_check'
+    '''
+    change_interval = subscription['change_interval']
+    last_change = subscription['last_change']
+
+    if changed and last_change is not None:
+        # Exponentially weighted average of the observed times between two commits
+        observed = now - last_change
+        if change_interval is None:
+            change_interval = observed
+        else:
+            change_interval = Configuration.POLL_SMOOTHING * observed + (1 - Configuration.POLL_SMOOTHING) * change_interval
+
+    # The first check is the start of the history
+    if changed or last_change is None:
+        last_change = now
+
+    # With jitter: the repositories with the same interval don't stay checked in the same run
+    interval = poll_interval(change_interval, last_change, now)
+    jitter = random.uniform(-Configuration.POLL_JITTER, Configuration.POLL_JITTER)
+
+    return {
+        'change_interval': change_interval,
+        'last_change': last_change,
+        'next_check': now + interval * (1 + jitter),
+    }
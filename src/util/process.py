@@ -3,7 +3,7 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ process.py                [Created: 2023-02-05 | 10:45 - AM]  #
-#                                       [Updated: 2023-02-10 |  4:53 - PM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
 #  Execute command and prompt the STDOUT and STDERR                         #
 #  Language ~ Python3                                                       #
@@ -124,6 +124,8 @@ class Process(object):
 
         self.start_time = time.time()
 
+        # The command may write on the same terminal
+        Color.flush()
         self.pid = Popen(command, stdout=sout, stderr=serr, stdin=stdin, cwd=cwd, bufsize=bufsize)
 
     def __del__(self):
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ rate_limiter.py           [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Pace the requests sent to the GitHub API with its rate limits            #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import json
+import time
+import atexit
+import hashlib
+import tempfile
+import threading
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.retry_policy import Resilient_Adapter
+
+# Class section
+class Rate_Limit_Exceeded(Exception):
+    '''
+        Raised when a request can't be sent before the end of the rate limit's window
+
+        Arguments:
+            resource (str): The rate limit's bucket ('core', 'search'...)
+            reset (float): When the bucket is refilled (UNIX timestamp)
+    '''
+
+    def __init__(self, resource, reset):
+        self.resource = resource
+        self.reset = reset
+        super().__init__('The GitHub API\'s rate limit (%s) is reached until %s' % (resource, time.strftime('%H:%M:%S', time.localtime(reset))))
+
+
+class Rate_Limiter():
+    '''
+        Track the rate limits of the GitHub API per resource bucket (from the
+        X-RateLimit-* headers of the responses) and pace the requests with a
+        token bucket.
+
+        The requests are only paced when the remaining budget is short (under
+        RATE_LIMIT_RESERVE of the limit): the bucket then refills at the rate
+        that spends exactly the remaining budget before the reset of the
+        window, with a small burst. Pacing never refuses a request that the
+        budget allows, only a request without any remaining budget (until a
+        reset more than RATE_LIMIT_MAX_WAIT away) raises Rate_Limit_Exceeded,
+        so the caller can defer it to the next window. The known budgets are saved in
+        the cache of GitPy (every few seconds and at exit), so the next processes
+        (like the cron job) start with them.
+
+        Arguments:
+            identity (str): Who the budgets belong to (an anonymous client or a token)
+            limits (dict): The default (requests, window) per resource (default: Configuration.RATE_LIMITS)
+            max_wait (float): The max time to wait for a token, in seconds
+    '''
+
+    def __init__(self, identity='anonymous', limits=None, max_wait=None):
+        self.identity = identity
+        self.limits = limits or Configuration.RATE_LIMITS
+        self.max_wait = Configuration.RATE_LIMIT_MAX_WAIT if max_wait is None else max_wait
+        self.state_file = Configuration.CACHE_PATH + Configuration.RATE_LIMIT_STATE_FILE
+        self.condition = threading.Condition()
+        self.buckets = {}
+        self.save_lock = threading.Lock()
+        self.changed = False
+        self.saved_at = time.monotonic()
+        atexit.register(self._write_state)
+
+        # The budgets saved by a previous process, if their window isn't over
+        now = time.time()
+        for resource, saved in self._read_state().get(identity, {}).items():
+            if saved['reset'] > now:
+                self._bucket(resource, now).update(limit=saved['limit'], remaining=saved['remaining'], reset=saved['reset'])
+
+    def _bucket(self, resource, now):
+        # A new bucket starts with the default budget of its resource
+        if resource not in self.buckets:
+            limit, window = self.limits.get(resource, self.limits['core'])
+            self.buckets[resource] = {'window': window, 'limit': limit, 'remaining': limit, 'reset': now + window, 'tokens': Configuration.RATE_LIMIT_BURST, 'updated': now}
+        return self.buckets[resource]
+
+    @staticmethod
+    def resource(url):
+        '''
+            The bucket of a request, or None if it's not sent to the GitHub API
+        '''
+        if url.startswith(Configuration.GITHUB_GRAPHQL_URL):
+            return 'graphql'
+        if not url.startswith(Configuration.GITHUB_API_URL + '/'):
+            return None
+
+        if url[len(Configuration.GITHUB_API_URL):].startswith('/search/'):
+            return 'search'
+        return 'core'
+
+    @staticmethod
+    def _capacity(bucket):
+        # The whole remaining budget can be spent at once, until it's short
+        if bucket['remaining'] > bucket['limit'] * Configuration.RATE_LIMIT_RESERVE:
+            return bucket['remaining']
+        return min(Configuration.RATE_LIMIT_BURST, bucket['remaining'])
+
+    def _refill(self, bucket, now):
+        # A new window: the whole budget is available again
+        if now >= bucket['reset']:
+            bucket.update(remaining=bucket['limit'], reset=now + bucket['window'])
+
+        rate = bucket['remaining'] / max(bucket['reset'] - now, 1)
+        capacity = self._capacity(bucket)
+        bucket['tokens'] = capacity if capacity == bucket['remaining'] else min(bucket['tokens'] + (now - bucket['updated']) * rate, capacity)
+        bucket['updated'] = now
+        return rate
+
+    def wait_time(self, resource):
+        '''
+            How long (in seconds) a request of this bucket would wait now
+        '''
+        with self.condition:
+            now = time.time()
+            bucket = self._bucket(resource, now)
+            rate = self._refill(bucket, now)
+
+            if bucket['tokens'] >= 1:
+                return 0
+            if bucket['remaining'] < 1 or rate <= 0:
+                return bucket['reset'] - now
+            return (1 - bucket['tokens']) / rate
+
+    def remaining(self, resource):
+        '''
+            The remaining budget of a bucket
+        '''
+        with self.condition:
+            bucket = self._bucket(resource, time.time())
+            self._refill(bucket, time.time())
+            return bucket['remaining']
+
+    def acquire(self, resource):
+        '''
+            Take a token of a bucket, waiting for it if needed.
+            Raise Rate_Limit_Exceeded if the wait would be longer than max_wait.
+        '''
+        with self.condition:
+            while True:
+                wait = self.wait_time(resource)
+                bucket = self.buckets[resource]
+
+                # Sent now, or after a pacing wait longer than max_wait (the budget allows it)
+                if wait <= 0 or (wait > self.max_wait and bucket['remaining'] >= 1):
+                    bucket['tokens'] = max(bucket['tokens'] - 1, 0)
+                    bucket['remaining'] -= 1
+                    return
+
+                if wait > self.max_wait:
+                    raise Rate_Limit_Exceeded(resource, bucket['reset'])
+
+                self.condition.wait(wait)
+
+    def release(self, resource):
+        '''
+            Give back a token (the request didn't count, like a '304 Not Modified')
+        '''
+        with self.condition:
+            bucket = self._bucket(resource, time.time())
+            bucket['remaining'] = min(bucket['remaining'] + 1, bucket['limit'])
+            bucket['tokens'] = min(bucket['tokens'] + 1, self._capacity(bucket))
+            self.condition.notify_all()
+
+    def update(self, resource, headers):
+        '''
+            Update a bucket with the X-RateLimit-* headers of a response
+        '''
+        try:
+            resource = headers.get('X-RateLimit-Resource', resource)
+            limit = int(headers['X-RateLimit-Limit'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset = float(headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+
+        with self.condition:
+            bucket = self._bucket(resource, time.time())
+            bucket.update(limit=limit, remaining=remaining, reset=reset)
+            bucket['tokens'] = min(bucket['tokens'], remaining)
+            self.changed = True
+            self.condition.notify_all()
+
+        if time.monotonic() - self.saved_at >= Configuration.RATE_LIMIT_SAVE_INTERVAL:
+            self._write_state()
+
+    def _read_state(self):
+        try:
+            with open(self.state_file, 'r') as state:
+                return json.loads(state.read())
+        except (OSError, ValueError):
+            return {}
+
+    def _write_state(self):
+        '''
+            Save the budgets in the state file shared by all the GitPy processes
+            (throttled by update(), and called at exit)
+        '''
+        with self.save_lock:
+            with self.condition:
+                if not self.changed:
+                    return
+                self.changed = False
+                self.saved_at = time.monotonic()
+                budgets = {resource: {key: bucket[key] for key in ('limit', 'remaining', 'reset')} for resource, bucket in self.buckets.items()}
+
+            try:
+                state = self._read_state()
+                state[self.identity] = budgets
+
+                # A temporary file of its own, renamed over the state file at once
+                directory = os.path.dirname(self.state_file)
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.state_file) + '.', suffix='.tmp', dir=directory)
+                try:
+                    with os.fdopen(fd, 'w') as tmp_state:
+                        tmp_state.write(json.dumps(state))
+                    os.replace(tmp_path, self.state_file)
+                except OSError:
+                    os.remove(tmp_path)
+                    raise
+            except OSError:
+                pass
+
+
+class Token_Pool():
+    '''
+        The personal access tokens sent to the GitHub API, each one with its own
+        Rate_Limiter. A request uses the token that can send it the soonest
+        (then the one with the most remaining budget), so the load rotates on
+        all the tokens and an exhausted token is skipped until its reset.
+        Without any token, the pool only has the anonymous client.
+
+        Arguments:
+            tokens (list): The tokens (default: Configuration.GITHUB_TOKENS)
+            max_wait (float): The max time to wait for a budget, in seconds
+    '''
+
+    def __init__(self, tokens=None, max_wait=None):
+        tokens = Configuration.GITHUB_TOKENS if tokens is None else tokens
+
+        # The state file only knows the tokens by a hash of them
+        if tokens:
+            self.entries = [(token, Rate_Limiter('token-%s' % hashlib.sha256(token.encode()).hexdigest()[:12], Configuration.AUTHENTICATED_RATE_LIMITS, max_wait)) for token in tokens]
+        else:
+            self.entries = [(None, Rate_Limiter(max_wait=max_wait))]
+
+    @staticmethod
+    def label(token):
+        '''
+            A printable name of a token (never the whole token)
+        '''
+        return 'anonymous' if token is None else '%s...%s' % (token[:4], token[-4:])
+
+    def select(self, resource):
+        '''
+            Return the (token, rate limiter) to use for a request of a bucket
+        '''
+        return min(self.entries, key=lambda entry: (entry[1].wait_time(resource), -entry[1].remaining(resource)))
+
+    def report(self):
+        '''
+            Print the rate limits of all the tokens (verbose mode)
+        '''
+        Color.pl('  {*} Rate limits of the GitHub API:')
+        for index, (token, rate_limiter) in enumerate(self.entries):
+            last = index == len(self.entries) - 1
+            Color.pl('   {SY1}%s──╼{W} {C}%s{W}' % ('╰' if last else '├', self.label(token)))
+
+            for position, resource in enumerate(sorted(rate_limiter.buckets)):
+                bucket = rate_limiter.buckets[resource]
+                Color.pl('   %s    {SY1}%s──╼{W} %s: {G}%s{W}/%s remaining (reset at %s)' % (
+                    ' ' if last else '{SY1}│{W}', '╰' if position == len(rate_limiter.buckets) - 1 else '├',
+                    resource, bucket['remaining'], bucket['limit'], time.strftime('%H:%M:%S', time.localtime(bucket['reset']))
+                ))
+
+
+class Rate_Limited_Adapter(Resilient_Adapter):
+    '''
+        A transport adapter that sends the requests of the GitHub API with the
+        token of a Token_Pool (and through its Rate_Limiter). When GitHub says
+        that a token is exhausted, the request is sent again with the next one.
+
+        Arguments:
+            token_pool (Token_Pool): The tokens of the client
+            Any other argument is given to Resilient_Adapter
+    '''
+
+    def __init__(self, token_pool=None, **kwargs):
+        super().__init__(**kwargs)
+        self.token_pool = token_pool or Token_Pool()
+
+    def send(self, request, **kwargs):
+        resource = Rate_Limiter.resource(request.url)
+        if resource is None:
+            return super().send(request, **kwargs)
+
+        for _ in self.token_pool.entries:
+            token, rate_limiter = self.token_pool.select(resource)
+            rate_limiter.acquire(resource)
+
+            if token is not None:
+                request.headers['Authorization'] = 'token %s' % token
+
+            try:
+                response = super().send(request, **kwargs)
+            except Exception:
+                # Not sent (open circuit) or not answered: it doesn't count either
+                rate_limiter.release(resource)
+                raise
+
+            # A '304 Not Modified' doesn't count in the rate limit
+            if response.status_code == 304:
+                rate_limiter.release(resource)
+
+            rate_limiter.update(resource, response.headers)
+
+            if Configuration.verbose >= 3:
+                Color.pl('  {§}  Rate limit of {C}%s{W} (%s): {G}%s{W} remaining' % (self.token_pool.label(token), resource, rate_limiter.remaining(resource)))
+
+            # Out of budget: rotate on the next token
+            if response.status_code not in (403, 429) or response.headers.get('X-RateLimit-Remaining') != '0':
+                return response
+
+            # Give the connection back to the pool before the next try
+            response.close()
+
+        # All the tokens are exhausted: the caller defers its work instead of failing
+        raise Rate_Limit_Exceeded(resource, min(rate_limiter.buckets[resource]['reset'] for _, rate_limiter in self.token_pool.entries))
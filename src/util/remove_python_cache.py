@@ -3,9 +3,9 @@
 
 #---[Name & Dates]----------------------------------------------------------#
 #  Filename ~ remove_python_cache.py    [Created: 2023-03-07 |  9:21 - AM]  #
-#                                       [Updated: 2023-03-07 | 10:18 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
 #---[Info]------------------------------------------------------------------#
-#  Remove the __pycache__'s folder in the GitPy's folder                   #
+#  Remove the __pycache__'s folders and the bytecode cache of GitPy         #
 #  Language ~ Python3                                                       #
 #---[Authors]---------------------------------------------------------------#
 #  Thomas Pellissier (MyMeepSQL)                                            #
@@ -38,12 +38,19 @@ import shutil
 ## Third party libraries
 from src.util.colors import Color
 from src.config import Configuration
+from src.util.bytecode_cache import bytecode_cache_path, remove_bytecode_cache
 
 # Main
 def remove_python_cache(pwd,line_enter=None):
+    # The bytecode cache belongs to the running GitPy instance
+    # (when called from the 'gitpy' command, 'pwd' is the bin folder)
+    gitpy_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
     try:
         if Configuration.verbose == 0:
 
+            remove_bytecode_cache(gitpy_path)
+
             if os.path.isdir('%s/src/__pycache__/' % pwd):
                 shutil.rmtree('%s/src/__pycache__/' % pwd)
 
@@ -158,7 +165,7 @@ def remove_python_cache(pwd,line_enter=None):
 
 
             if Configuration.verbose == 3:
-                Color.p('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(\'%s/src/tools/colored/__pycache__/\' % pwd){W} ...')
+                Color.p('   {SY1}├──╼{W} Python: {SY1}shutil.rmtree(\'%s/src/tools/colored/__pycache__/\' % pwd){W} ...')
 
             if os.path.isdir('%s/src/tools/colored/__pycache__/' % pwd):
                 shutil.rmtree('%s/src/tools/colored/__pycache__/' % pwd)
@@ -169,6 +176,19 @@ def remove_python_cache(pwd,line_enter=None):
             else:
                 if Configuration.verbose == 3:
                     Color.p(' {O}NOT FOUND{W}\n')
+
+
+            if Configuration.verbose == 3:
+                Color.p('   {SY1}╰──╼{W} Python: {SY1}shutil.rmtree(\'%s\'){W} ...' % bytecode_cache_path(gitpy_path, versioned=False))
+
+            if remove_bytecode_cache(gitpy_path):
+
+                if Configuration.verbose == 3:
+                    Color.p(' {G}OK{W}\n')
+
+            else:
+                if Configuration.verbose == 3:
+                    Color.p(' {O}NOT FOUND{W}\n')
     
     except PermissionError as pe:
         Color.pexception(pe)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ retry_policy.py           [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Retries with backoff and circuit breaker of the HTTP client              #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import time
+import random
+import threading
+from itertools import takewhile
+from urllib.parse import urlsplit
+
+## Third party libraries
+from src.config import Configuration
+# The Retry class of the urllib3 used by the vendored requests
+from src.tools.requests.adapters import HTTPAdapter, Retry
+from src.tools.requests.exceptions import ConnectionError, Timeout
+
+# Class section
+class Jittered_Retry(Retry):
+    '''
+        The retry policy of the HTTP client: the transient errors (connection
+        errors and 5xx) are retried with an exponential backoff with full jitter,
+        so the clients that failed together don't retry together. A 'Retry-After'
+        header (also sent by GitHub with a 403 for its secondary rate limits)
+        is honoured, up to Configuration.RETRY_AFTER_MAX seconds.
+    '''
+
+    # GitHub sends its secondary rate limits as a 403 (or 429) with 'Retry-After'.
+    # Without this header, a 403 is not retried.
+    RETRY_AFTER_STATUS_CODES = frozenset([403, 413, 429, 503])
+    DEFAULT_BACKOFF_MAX = Configuration.RETRY_BACKOFF_MAX
+
+    @classmethod
+    def default(cls):
+        '''
+            The retry policy of the configuration
+        '''
+        return cls(
+            total=Configuration.RETRY_TOTAL,
+            backoff_factor=Configuration.RETRY_BACKOFF_FACTOR,
+            status_forcelist=Configuration.RETRY_STATUS_CODES,
+            # The GraphQL queries (POST) only read data, they can be sent again
+            allowed_methods=frozenset(['GET', 'HEAD', 'POST']),
+            # After the last retry, the last response is returned (not an exception)
+            raise_on_status=False,
+        )
+
+    def get_backoff_time(self):
+        # The consecutive errors only (not the redirects)
+        errors = len(list(takewhile(lambda attempt: attempt.redirect_location is None, reversed(self.history))))
+        if errors == 0:
+            return 0
+
+        return random.uniform(0, min(self.DEFAULT_BACKOFF_MAX, self.backoff_factor * 2 ** (errors - 1)))
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+
+        return min(retry_after, Configuration.RETRY_AFTER_MAX)
+
+
+class Circuit_Open(ConnectionError):
+    '''
+        Raised instead of sending a request to a host whose circuit is open
+
+        Arguments:
+            host (str): The host
+            until (float): When a new request will be tried (UNIX timestamp)
+    '''
+
+    def __init__(self, host, until):
+        self.host = host
+        self.until = until
+        super().__init__('%s is not responding, no request is sent until %s' % (host, time.strftime('%H:%M:%S', time.localtime(until))))
+
+
+class Circuit_Breaker():
+    '''
+        A circuit breaker per host. After 'failures' failures in a row (errors
+        or 5xx responses, once the retries are done), the circuit of the host
+        opens: its requests fail at once with Circuit_Open during 'cooldown'
+        seconds, instead of tying up the workers. Then one request is let
+        through: if it succeeds the circuit closes, else it opens again.
+
+        Arguments:
+            failures (int): The failures in a row that open the circuit (default: Configuration.CIRCUIT_BREAKER_FAILURES)
+            cooldown (float): How long a circuit stays open, in seconds (default: Configuration.CIRCUIT_BREAKER_COOLDOWN)
+    '''
+
+    def __init__(self, failures=None, cooldown=None):
+        self.failures = failures or Configuration.CIRCUIT_BREAKER_FAILURES
+        self.cooldown = cooldown or Configuration.CIRCUIT_BREAKER_COOLDOWN
+        self.lock = threading.Lock()
+        # host -> {'failures': int, 'open_until': float, 'trial': bool}
+        self.circuits = {}
+
+    def before(self, host):
+        '''
+            Raise Circuit_Open if the circuit of the host is open
+        '''
+        with self.lock:
+            circuit = self.circuits.get(host)
+            if circuit is None or circuit['failures'] < self.failures:
+                return
+
+            # Half-open: a single request tries the host again
+            if time.time() >= circuit['open_until'] and not circuit['trial']:
+                circuit['trial'] = True
+                return
+
+            raise Circuit_Open(host, circuit['open_until'])
+
+    def success(self, host):
+        with self.lock:
+            self.circuits.pop(host, None)
+
+    def failure(self, host):
+        with self.lock:
+            circuit = self.circuits.setdefault(host, {'failures': 0, 'open_until': 0, 'trial': False})
+            circuit['failures'] += 1
+            circuit['trial'] = False
+
+            if circuit['failures'] >= self.failures:
+                circuit['open_until'] = time.time() + self.cooldown
+
+
+class Resilient_Adapter(HTTPAdapter):
+    '''
+        A transport adapter with the retry policy (Jittered_Retry) and a
+        circuit breaker per host
+
+        Arguments:
+            circuit_breaker (Circuit_Breaker): The breaker of the client
+            Any other argument is given to HTTPAdapter
+    '''
+
+    def __init__(self, circuit_breaker=None, **kwargs):
+        kwargs.setdefault('max_retries', Jittered_Retry.default())
+        super().__init__(**kwargs)
+        self.circuit_breaker = circuit_breaker or Circuit_Breaker()
+
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        self.circuit_breaker.before(host)
+
+        try:
+            response = super().send(request, **kwargs)
+        except (ConnectionError, Timeout):
+            self.circuit_breaker.failure(host)
+            raise
+
+        if response.status_code >= 500:
+            self.circuit_breaker.failure(host)
+        else:
+            self.circuit_breaker.success(host)
+
+        return response
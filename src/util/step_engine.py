@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ step_engine.py            [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  Run the steps of a flow (install, update...) following their deps        #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+## Third party libraries
+from src.util.colors import Color
+from src.config import Configuration
+
+# Main
+class Step():
+    '''
+        A step of a flow. A step starts as soon as all the steps it requires are
+        finished, so the independent steps of a flow run at the same time.
+
+        Arguments:
+            name (str): The name of the step, used by the other steps to require it
+            function (callable): The function of the step (called without arguments)
+            requires (list): The names of the steps that must be finished before this one
+            message (str): The message printed when the step starts (None: silent step)
+    '''
+
+    def __init__(self, name, function, requires=(), message=None):
+        self.name = name
+        self.function = function
+        self.requires = list(requires)
+        self.message = message
+        self.duration = None
+
+    def run(self):
+        '''
+            Run the function of the step and time it
+        '''
+        start_time = time.monotonic()
+        try:
+            return self.function()
+        finally:
+            self.duration = time.monotonic() - start_time
+
+
+class Step_Engine():
+    '''
+        Run a list of steps as a DAG: each step is started as soon as its
+        requirements are finished. If a step fails, no new step is started
+        and the error is raised once the running steps are finished.
+
+        Arguments:
+            steps (list): The Step objects of the flow
+            quiet (bool): Don't print the messages and the timing of the steps
+            max_workers (int): The max number of steps running at the same time
+    '''
+
+    def __init__(self, steps, quiet=False, max_workers=4):
+        self.steps = {step.name: step for step in steps}
+        self.quiet = quiet
+        self.max_workers = max_workers
+
+        # Check the graph before running anything
+        for step in steps:
+            for required in step.requires:
+                if required not in self.steps:
+                    raise ValueError('The step \'%s\' requires the unknown step \'%s\'' % (step.name, required))
+        self._check_cycles()
+
+    def _check_cycles(self):
+        '''
+            Raise a ValueError if the steps can't be ordered (dependency cycle)
+        '''
+        done = set()
+        remaining = dict(self.steps)
+
+        while remaining:
+            ready = [name for name, step in remaining.items() if all(r in done for r in step.requires)]
+            if not ready:
+                raise ValueError('Dependency cycle between the steps: %s' % ', '.join(remaining))
+            for name in ready:
+                done.add(name)
+                del remaining[name]
+
+    def _start(self, executor, step):
+        if not self.quiet and step.message:
+            Color.pl('  {-} %s...' % step.message)
+
+        if Configuration.verbose == 3:
+            Color.pl('  {§} Starting the step {C}%s{W} (requires: %s)' % (step.name, ', '.join(step.requires) or 'nothing'))
+
+        # Show the step before it starts, it may take a while
+        Color.flush()
+
+        return executor.submit(step.run)
+
+    def _report(self, step):
+        if not self.quiet and step.message:
+            Color.pl('  {+} %s {D}(%.2fs){W}' % (step.message, step.duration))
+
+        Color.flush()
+
+    def run(self):
+        '''
+            Run all the steps.
+
+            Returns:
+                dict: The duration of each step, in seconds
+        '''
+        done = set()
+        pending = dict(self.steps)
+        running = {}
+        error = None
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while pending or running:
+                # Start all the steps whose requirements are finished
+                if error is None:
+                    for name, step in list(pending.items()):
+                        if all(required in done for required in step.requires):
+                            running[self._start(executor, step)] = step
+                            del pending[name]
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    try:
+                        future.result()
+                    except BaseException as e:
+                        if error is None:
+                            error = e
+                        continue
+
+                    done.add(step.name)
+                    self._report(step)
+
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        executor.shutdown(wait=True)
+
+        if error is not None:
+            raise error
+
+        if Configuration.verbose >= 1 and not self.quiet:
+            Color.pl('  {*} Steps duration:')
+            for index, step in enumerate(self.steps.values()):
+                if step.duration is not None:
+                    Color.pl('   {G}%s──╼{W} %-20s %.2fs' % ('╰' if index == len(self.steps) - 1 else '├', step.name, step.duration))
+
+        return {name: step.duration for name, step in self.steps.items()}
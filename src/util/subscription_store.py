@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#---[Name & Dates]----------------------------------------------------------#
+#  Filename ~ subscription_store.py     [Created: 2026-10-18 | 10:12 - AM]  #
+#                                       [Updated: 2026-10-18 | 10:12 - AM]  #
+#---[Info]------------------------------------------------------------------#
+#  The subscriptions of the notifications and their state (SQLite)          #
+#  Language ~ Python3                                                       #
+#---[Authors]---------------------------------------------------------------#
+#  Thomas Pellissier (MyMeepSQL)                                            #
+#  Jonas Petitpierre (Bashy)                                                #
+#---[Operating System]------------------------------------------------------#
+#  Developed for Linux                                                      #
+#---[License]---------------------------------------------------------------#
+#  GNU General Public License v3.0                                          #
+#  -------------------------------                                          #
+#                                                                           #
+#  This program is free software; you can redistribute it and/or modify     #
+#  it under the terms of the GNU General Public License as published by     #
+#  the Free Software Foundation; either version 2 of the License, or        #
+#  (at your option) any later version.                                      #
+#                                                                           #
+#  This program is distributed in the hope that it will be useful,          #
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of           #
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the             #
+#  GNU General Public License for more details.                             #
+#                                                                           #
+#  You should have received a copy of the GNU General Public License along  #
+#  with this program; if not, write to the Free Software Foundation, Inc.,  #
+#  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.              #
+#---------------------------------------------------------------------------#
+
+# Imports section
+import os
+import re
+import time
+import sqlite3
+from contextlib import contextmanager
+
+## Third party libraries
+from src.config import Configuration
+from src.util.colors import Color
+from src.util.poll_scheduler import schedule
+
+# Functions section
+def subscription_key(owner, name, branch=None):
+    '''
+        The key of a subscription: 'owner/repository@branch' ('owner/repository'
+        for the default branch)
+    '''
+    return '%s/%s@%s' % (owner, name, branch) if branch else '%s/%s' % (owner, name)
+
+def password_env_var_name(key):
+    '''
+        The environment variable holding the SMTP password of a subscription
+    '''
+    return 'GITPY_%s_SMTP_PASSWORD' % re.sub(r'[^A-Z0-9]+', '_', key.upper()).strip('_')
+
+# Main
+class Subscription_Store():
+    '''
+        The subscriptions of the New Version Notification, in a SQLite database
+        next to the old notification config file. Each subscription is keyed by
+        'owner/repository@branch' (see subscription_key) and holds its settings
+        (repository, receiver, SMTP account) and its state: the last commit
+        seen (and notified), when it has been checked and notified, and the
+        history of its commits that plans its next check (see
+        src/util/poll_scheduler.py).
+
+        A subscription is read, added or removed with one indexed query, without
+        reading or rewriting the others. Each change is a transaction (BEGIN
+        IMMEDIATE) and the database is in WAL mode: the runs of --check-repo
+        started at the same time (cron and a manual run...) wait for each other
+        instead of corrupting the store, and a commit is only notified by one
+        of them.
+
+        The subscriptions of the old notification config file (an INI file, by
+        repository name) are migrated at the first use, the file is then kept
+        as '<file>.migrated'.
+
+        Arguments:
+            path (str): The database (default: the NOTIFICATION_STORE_FILE of the install path)
+            config_file (str): The old notification config file (default: the NOTIFICATION_CONFIG_FILE of the install path)
+    '''
+
+    # The settings of a subscription, the other columns are its state
+    SETTINGS = [
+        'owner', 'name', 'branch', 'url', 'api_url', 'subscribed_sha',
+        'receiver_email_address', 'smtp_server', 'smtp_port', 'smtp_username', 'smtp_password',
+        'email_subject', 'email_message',
+    ]
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS subscriptions (
+            key TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            name TEXT NOT NULL,
+            branch TEXT,
+            url TEXT,
+            api_url TEXT,
+            subscribed_sha TEXT,
+            receiver_email_address TEXT,
+            smtp_server TEXT,
+            smtp_port INTEGER,
+            smtp_username TEXT,
+            smtp_password TEXT,
+            email_subject TEXT,
+            email_message TEXT,
+            last_seen_sha TEXT,
+            last_checked REAL,
+            last_notified REAL,
+            change_interval REAL,
+            last_change REAL,
+            next_check REAL
+        ) WITHOUT ROWID
+    '''
+    COLUMNS = ['key'] + SETTINGS + ['last_seen_sha', 'last_checked', 'last_notified', 'change_interval', 'last_change', 'next_check']
+
+    # The columns added after the first version of the table
+    ADDED_COLUMNS = ['change_interval REAL', 'last_change REAL', 'next_check REAL']
+
+    INDEXES = [
+        'CREATE INDEX IF NOT EXISTS subscriptions_last_checked ON subscriptions (last_checked)',
+        'CREATE INDEX IF NOT EXISTS subscriptions_next_check ON subscriptions (next_check)',
+        'CREATE INDEX IF NOT EXISTS subscriptions_receiver ON subscriptions (receiver_email_address)',
+    ]
+
+    def __init__(self, path=None, config_file=None):
+        install_path = os.environ[Configuration.gitpy_install_path_env_var_name]
+        self.path = path or install_path + Configuration.NOTIFICATION_STORE_FILE
+        self.config_file = config_file or install_path + Configuration.NOTIFICATION_CONFIG_FILE
+
+        # Autocommit mode: the transactions are opened by transaction()
+        self.connection = sqlite3.connect(self.path, timeout=Configuration.NOTIFICATION_STORE_TIMEOUT, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+
+        if self._columns() != self.COLUMNS or os.path.isfile(self.config_file):
+            self._migrate()
+
+    def _columns(self):
+        return [row['name'] for row in self.connection.execute('PRAGMA table_info(subscriptions)')]
+
+    def _migrate(self):
+        # In a transaction: only one of the runs started at the same time migrates
+        with self.transaction() as connection:
+
+            # The first versions of the database only kept the state, by section of the config file
+            state = {}
+            if 'section' in self._columns():
+                state = {row['section']: dict(row) for row in connection.execute('SELECT * FROM subscriptions')}
+                connection.execute('DROP TABLE subscriptions')
+
+            connection.execute(self.SCHEMA)
+            columns = self._columns()
+            for column in self.ADDED_COLUMNS:
+                if column.split()[0] not in columns:
+                    connection.execute('ALTER TABLE subscriptions ADD COLUMN %s' % column)
+            for index in self.INDEXES:
+                connection.execute(index)
+
+            if not os.path.isfile(self.config_file):
+                return
+
+            import configparser
+            config = configparser.ConfigParser()
+            config.read(self.config_file)
+
+            for section in config.sections():
+                subscription = {
+                    'owner': config.get(section, 'github_repo_owner'),
+                    'name': config.get(section, 'github_repo_name'),
+                    'branch': config.get(section, 'github_repo_branch', fallback=None) or None,
+                    'url': config.get(section, 'github_repo_url', fallback=None),
+                    'api_url': config.get(section, 'github_repo_api_url', fallback=None),
+                    'subscribed_sha': config.get(section, 'current_commit_sha', fallback=None),
+                    'receiver_email_address': config.get(section, 'receiver_email_address', fallback=None),
+                    'smtp_server': config.get(section, 'smtp_server', fallback=None),
+                    'smtp_port': config.getint(section, 'smtp_port', fallback=None),
+                    'smtp_username': config.get(section, 'smtp_username', fallback=None),
+                    'smtp_password': config.get(section, 'smtp_password', fallback=None),
+                    'email_subject': config.get(section, 'email_subject', fallback=None),
+                    'email_message': config.get(section, 'email_message', fallback=None),
+                }
+                saved = state.get(section, {})
+                connection.execute(
+                    'INSERT OR IGNORE INTO subscriptions (key, %s, last_seen_sha, last_checked, last_notified) VALUES (%s)' % (', '.join(self.SETTINGS), ', '.join('?' * (len(self.SETTINGS) + 4))),
+                    [subscription_key(subscription['owner'], subscription['name'], subscription['branch'])] + [subscription[column] for column in self.SETTINGS] + [
+                        saved.get('last_seen_sha'),
+                        saved.get('last_checked') or config.getfloat(section, 'last_checked', fallback=None),
+                        saved.get('last_notified'),
+                    ]
+                )
+
+            os.replace(self.config_file, self.config_file + '.migrated')
+            Color.pl('  {-} {G}%s{W} subscription(s) migrated from {C}%s{W}.' % (len(config.sections()), self.config_file))
+
+    @contextmanager
+    def transaction(self):
+        '''
+            A write transaction: the other processes wait for its end (up to
+            NOTIFICATION_STORE_TIMEOUT seconds), it's rolled back on an error
+        '''
+        self.connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield self.connection
+        except BaseException:
+            self.connection.execute('ROLLBACK')
+            raise
+        self.connection.execute('COMMIT')
+
+    def add(self, **settings):
+        '''
+            Add a subscription (or update the settings of an existing one, its
+            state is kept)
+
+            Arguments:
+                **settings: The columns of SETTINGS
+
+            Returns:
+                str: The key of the subscription
+        '''
+        key = subscription_key(settings['owner'], settings['name'], settings.get('branch'))
+        values = [settings.get(column) for column in self.SETTINGS]
+        with self.transaction() as connection:
+            connection.execute(
+                'INSERT INTO subscriptions (key, %s) VALUES (%s) ON CONFLICT (key) DO UPDATE SET %s' % (
+                    ', '.join(self.SETTINGS),
+                    ', '.join('?' * (len(self.SETTINGS) + 1)),
+                    ', '.join('%s = excluded.%s' % (column, column) for column in self.SETTINGS),
+                ),
+                [key] + values
+            )
+        return key
+
+    def get(self, key):
+        '''
+            A subscription (a dict), or None if it doesn't exist
+        '''
+        row = self.connection.execute('SELECT * FROM subscriptions WHERE key = ?', (key,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def all(self):
+        '''
+            All the subscriptions, the most overdue first (never checked first)
+        '''
+        return [dict(row) for row in self.connection.execute('SELECT * FROM subscriptions ORDER BY last_checked IS NOT NULL, last_checked')]
+
+    def due(self, now=None):
+        '''
+            The subscriptions whose next check is planned before now (never
+            checked first, then the most overdue)
+        '''
+        return [dict(row) for row in self.connection.execute(
+            'SELECT * FROM subscriptions WHERE next_check IS NULL OR next_check <= ? ORDER BY next_check IS NOT NULL, next_check',
+            (now or time.time(),)
+        )]
+
+    def count(self):
+        '''
+            The number of subscriptions
+        '''
+        return self.connection.execute('SELECT COUNT(*) FROM subscriptions').fetchone()[0]
+
+    def find(self, pattern=''):
+        '''
+            The subscriptions whose key or receiver contains a pattern (all of
+            them with an empty pattern), sorted by key
+        '''
+        pattern = '%%%s%%' % pattern.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return [dict(row) for row in self.connection.execute(
+            "SELECT * FROM subscriptions WHERE key LIKE ? ESCAPE '\\' OR receiver_email_address LIKE ? ESCAPE '\\' ORDER BY key",
+            (pattern, pattern)
+        )]
+
+    def remove(self, key):
+        '''
+            Remove a subscription
+
+            Returns:
+                bool: False if it doesn't exist
+        '''
+        with self.transaction() as connection:
+            return connection.execute('DELETE FROM subscriptions WHERE key = ?', (key,)).rowcount > 0
+
+    def checked(self, key, when=None):
+        '''
+            Save when a subscription has been checked without result (the
+            repository can't be reached): it's checked again after
+            POLL_INTERVAL_MIN
+        '''
+        when = when or time.time()
+        with self.transaction() as connection:
+            connection.execute('UPDATE subscriptions SET last_checked = ?, next_check = ? WHERE key = ?', (when, when + Configuration.POLL_INTERVAL_MIN, key))
+
+    def claim(self, key, latest_sha):
+        '''
+            Save the latest commit of a subscription and tell if it has to be
+            notified: it differs from the last seen one (or from the one of the
+            subscription if it was never checked). It's atomic: if several runs
+            see the same new commit, only one of them gets it. The next check
+            of the subscription is planned with its updated history.
+
+            Arguments:
+                key (str): The key of the subscription
+                latest_sha (str): The SHA hash of the latest commit of the repository
+
+            Returns:
+                dict: The previous state (for release()) if the commit is new, else None
+        '''
+        now = time.time()
+        with self.transaction() as connection:
+            row = connection.execute(
+                'SELECT key, subscribed_sha, last_seen_sha, last_checked, last_notified, change_interval, last_change, next_check FROM subscriptions WHERE key = ?',
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            previous = dict(row)
+            changed = latest_sha != (previous['last_seen_sha'] or previous['subscribed_sha'])
+            plan = schedule(previous, changed, now)
+
+            connection.execute(
+                'UPDATE subscriptions SET last_seen_sha = ?, last_checked = ?, last_notified = ?, change_interval = ?, last_change = ?, next_check = ? WHERE key = ?',
+                (latest_sha, now, now if changed else previous['last_notified'], plan['change_interval'], plan['last_change'], plan['next_check'], key)
+            )
+            return previous if changed else None
+
+    def release(self, previous):
+        '''
+            Restore the state saved by claim() when the notification couldn't be
+            sent, so the commit is notified by the next run (the subscription is
+            due again)
+        '''
+        with self.transaction() as connection:
+            connection.execute(
+                'UPDATE subscriptions SET last_seen_sha = ?, last_checked = ?, last_notified = ?, change_interval = ?, last_change = ?, next_check = ? WHERE key = ?',
+                (previous['last_seen_sha'], previous['last_checked'], previous['last_notified'], previous['change_interval'], previous['last_change'], previous['next_check'], previous['key'])
+            )
+
+    def close(self):
+        self.connection.close()